@@ -0,0 +1,87 @@
+"""Benchmark parsing of a large multi-block CIF with CifParser.parse_structures
+and the streaming CifParser.iter_structures, and of the symmetry expansion of
+a CIF with many sites in general positions of a high-multiplicity space group.
+
+Usage: python bench_cif.py [n_blocks] [n_general_sites]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+from pymatgen.io.cif import CifBlock, CifParser
+from pymatgen.symmetry.groups import SpaceGroup
+from pymatgen.util.testing import TEST_FILES_DIR
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+
+def make_multi_block_cif(n_blocks: int) -> str:
+    """Concatenate renamed copies of test CIFs into a single multi-block CIF string."""
+    blocks = []
+    for filename in ("Fe3O4.cif", "LiFePO4.cif", "Li2O.cif", "Li10GeP2S12.cif"):
+        with open(f"{TEST_FILES_DIR}/cif/{filename}") as file:
+            blocks.append(file.read())
+    return "\n".join(blocks[idx % len(blocks)].replace("data_", f"data_{idx}_", 1) for idx in range(n_blocks))
+
+
+def make_high_multiplicity_cif(n_sites: int, space_group: str = "Fd-3m") -> str:
+    """CIF string with n_sites random Si sites in general positions of a cubic space group."""
+    rng = np.random.default_rng(0)
+    lines = [
+        "data_high_multiplicity",
+        "_cell_length_a 30.0",
+        "_cell_length_b 30.0",
+        "_cell_length_c 30.0",
+        "_cell_angle_alpha 90",
+        "_cell_angle_beta 90",
+        "_cell_angle_gamma 90",
+        "loop_",
+        "_symmetry_equiv_pos_as_xyz",
+    ]
+    lines += [f"'{op.as_xyz_str()}'" for op in SpaceGroup(space_group).symmetry_ops]
+    lines += ["loop_", "_atom_site_label", "_atom_site_type_symbol"]
+    lines += [f"_atom_site_fract_{axis}" for axis in "xyz"]
+    lines += [f"Si{idx} Si {x:.5f} {y:.5f} {z:.5f}" for idx, (x, y, z) in enumerate(rng.random((n_sites, 3)))]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    n_blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    n_general_sites = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    warnings.simplefilter("ignore")
+    cif_str = make_multi_block_cif(n_blocks)
+
+    block_str = make_multi_block_cif(1)
+    start = time.perf_counter()
+    for _ in range(1000):
+        CifBlock.from_str(block_str)
+    print(f"CifBlock.from_str: {(time.perf_counter() - start):.3f} ms per block")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cif_path = os.path.join(tmp_dir, "multi_block.cif")
+        with open(cif_path, mode="w") as file:
+            file.write(cif_str)
+
+        start = time.perf_counter()
+        structures = CifParser(cif_path).parse_structures(primitive=False)
+        print(f"parse_structures: {len(structures)} structures in {time.perf_counter() - start:.2f} s")
+
+        start = time.perf_counter()
+        structs = CifParser.iter_structures(cif_path)
+        next(structs)
+        print(f"iter_structures: first structure after {time.perf_counter() - start:.4f} s")
+        n_structs = 1 + sum(1 for _ in structs)
+        print(f"iter_structures: {n_structs} structures in {time.perf_counter() - start:.2f} s")
+
+    cif_str = make_high_multiplicity_cif(n_general_sites)
+    start = time.perf_counter()
+    structure = CifParser.from_str(cif_str, check_cif=False).parse_structures(primitive=False)[0]
+    print(f"symmetry expansion: {len(structure)} sites in {time.perf_counter() - start:.2f} s")
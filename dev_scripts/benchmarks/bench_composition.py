@@ -0,0 +1,41 @@
+"""Benchmark construction of a Composition from a formula string and the
+computation of its reduced formula, with and without the formula parsing cache.
+
+Usage: python bench_composition.py [n_repeats]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from pymatgen.core.composition import FORMULA_CACHE_SIZE, Composition, set_formula_cache_size
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+FORMULA = "Li2Fe3(PO4)3"
+
+
+def bench(n_repeats: int) -> None:
+    """Print the time per call of Composition(FORMULA) and Composition(FORMULA).reduced_formula."""
+    for label, stmt in (
+        ("Composition(formula)", "Composition(FORMULA)"),
+        ("Composition(formula).reduced_formula", "Composition(FORMULA).reduced_formula"),
+    ):
+        time = min(timeit.repeat(stmt, globals=globals(), number=n_repeats, repeat=5))
+        print(f"{label}: {1e6 * time / n_repeats:.2f} us")
+
+    comp = Composition(FORMULA)
+    time = min(timeit.repeat("comp.reduced_formula", globals=locals(), number=n_repeats, repeat=5))
+    print(f"comp.reduced_formula (same instance): {1e6 * time / n_repeats:.2f} us")
+
+
+if __name__ == "__main__":
+    n_repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print("uncached formula parsing")
+    set_formula_cache_size(0)
+    bench(n_repeats)
+    print(f"\ncached formula parsing ({FORMULA_CACHE_SIZE=})")
+    set_formula_cache_size(FORMULA_CACHE_SIZE)
+    bench(n_repeats)
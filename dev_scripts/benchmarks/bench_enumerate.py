@@ -0,0 +1,72 @@
+"""Benchmark the ranking of enumerated orderings in EnumerateStructureTransformation:
+Ewald energies sharing one EwaldSummation per supercell against one summation per
+ordering in parallel tasks, and removal of symmetrically equivalent orderings
+against StructureMatcher.group_structures.
+
+The orderings are generated with OrderDisorderedStructureTransformation so that
+enumlib is not needed.
+
+Usage: python bench_enumerate.py [n_jobs]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import warnings
+
+from joblib import Parallel, delayed
+
+from pymatgen.analysis.ewald import EwaldSummation
+from pymatgen.analysis.structure_matcher import StructureMatcher
+from pymatgen.transformations.advanced_transformations import EnumerateStructureTransformation
+from pymatgen.transformations.standard_transformations import (
+    OrderDisorderedStructureTransformation,
+    OxidationStateDecorationTransformation,
+    SubstitutionTransformation,
+)
+from pymatgen.util.testing import PymatgenTest
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-19"
+
+
+def get_ewald_energy_per_ordering(structure, ordering):
+    """Ewald energy of an ordering as computed by one task per ordering."""
+    supercell = structure * (1, 1, round(ordering.volume / structure.volume))
+    return EwaldSummation(supercell).compute_sub_structure(ordering)
+
+
+if __name__ == "__main__":
+    n_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else -1
+    warnings.simplefilter("ignore")
+
+    struct = SubstitutionTransformation({"Fe": {"Fe": 0.5}}).apply_transformation(PymatgenTest.get_structure("LiFePO4"))
+    struct = OxidationStateDecorationTransformation({"Li": 1, "Fe": 2, "P": 5, "O": -2}).apply_transformation(struct)
+    order_trans = OrderDisorderedStructureTransformation(algo=2)
+    orderings = [dct["structure"] for dct in order_trans.apply_transformation(struct, 100)]
+    orderings += [dct["structure"] for dct in order_trans.apply_transformation(struct * (1, 1, 2), 100)]
+
+    start = time.perf_counter()
+    Parallel(n_jobs=n_jobs)(delayed(get_ewald_energy_per_ordering)(struct, ordering) for ordering in orderings)
+    print(f"Ewald energies of {len(orderings)} orderings, one task each: {time.perf_counter() - start:.2f} s")
+
+    enum_trans = EnumerateStructureTransformation(n_jobs=n_jobs, remove_duplicate_structures=True)
+    start = time.perf_counter()
+    energies = enum_trans._get_ewald_energies(struct, orderings)
+    print(f"Ewald energies of {len(orderings)} orderings, per supercell: {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    n_groups = len(StructureMatcher().group_structures(orderings))
+    print(f"group_structures: {n_groups} unique in {time.perf_counter() - start:.2f} s")
+
+    all_structures = [
+        {"num_sites": len(ordering), "energy": energy, "structure": ordering}
+        for ordering, energy in zip(orderings, energies, strict=True)
+    ]
+    for num_to_return in (100, 5):
+        start = time.perf_counter()
+        ranked = enum_trans._rank_structures(
+            all_structures, lambda dct: dct["energy"] / dct["num_sites"], num_to_return
+        )
+        print(f"_rank_structures({num_to_return}): {len(ranked)} unique in {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,53 @@
+"""Benchmark the Ewald energy matrix and forces of a LiFePO4 supercell with
+EwaldSummation, energy changes of site swaps with IncrementalEwaldEnergy, and
+the total energy and forces of larger supercells with ParticleMeshEwaldSummation.
+
+Usage: python bench_ewald.py [supercell_size]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from pymatgen.analysis.ewald import EwaldSummation, IncrementalEwaldEnergy, ParticleMeshEwaldSummation
+from pymatgen.util.testing import PymatgenTest
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    lifepo4 = PymatgenTest.get_structure("LiFePO4")
+    lifepo4.add_oxidation_state_by_element({"Li": 1, "Fe": 2, "P": 5, "O": -2})
+
+    supercell = lifepo4 * (size, size, size)
+    start = time.perf_counter()
+    ewald = EwaldSummation(supercell, compute_forces=True)
+    _ = ewald.total_energy_matrix, ewald.forces
+    print(f"EwaldSummation, {len(supercell)} sites: {time.perf_counter() - start:.2f} s")
+
+    n_swaps = 10_000
+    energy = IncrementalEwaldEnergy.from_ewald_summation(ewald)
+    swaps = np.random.default_rng(0).integers(len(supercell), size=(n_swaps, 2))
+    start = time.perf_counter()
+    for idx1, idx2 in swaps:
+        if idx1 != idx2 and energy.get_swap_energy(idx1, idx2) < 0:
+            energy.swap(idx1, idx2)
+    print(f"IncrementalEwaldEnergy, {n_swaps} trial swaps: {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    for idx1, idx2 in swaps[:100]:
+        ewald.compute_partial_energy([idx1, idx2])
+    print(f"compute_partial_energy x 100: {time.perf_counter() - start:.2f} s")
+
+    for multiple in (size, 2 * size):
+        supercell = lifepo4 * (multiple, multiple, multiple)
+        start = time.perf_counter()
+        pme = ParticleMeshEwaldSummation(supercell, compute_forces=True)
+        _ = pme.total_energy, pme.forces
+        print(
+            f"ParticleMeshEwaldSummation, {len(supercell)} sites, {pme.grid} mesh: {time.perf_counter() - start:.2f} s"
+        )
@@ -0,0 +1,36 @@
+"""Benchmark the import time of pymatgen.core and its submodules in fresh interpreters,
+as paid by every short-lived command line invocation.
+
+Usage: python bench_import.py [repeats]
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-19"
+
+
+STATEMENTS = (
+    "import pymatgen.core",
+    "from pymatgen.core import Element",
+    "from pymatgen.core import Composition",
+    "from pymatgen.core import Structure",
+)
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for statement in STATEMENTS:
+        timer = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+        times = []
+        for _ in range(repeats):
+            output = subprocess.run([sys.executable, "-c", timer], capture_output=True, text=True, check=True).stdout
+            times.append(float(output))
+        print(f"{statement}: {1000 * min(times):.0f} ms")
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    print(f"Interpreter startup: {1000 * (time.perf_counter() - start):.0f} ms")
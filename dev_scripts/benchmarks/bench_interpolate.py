@@ -0,0 +1,46 @@
+"""Benchmark Structure.interpolate for many NEB images of a large cell, as a
+list of structures and as a Trajectory, and the IDPP optimization of a
+vacancy hop path.
+
+Usage: python bench_interpolate.py [n_images] [supercell_size]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from pymatgen.analysis.transition_state import IDPPSolver
+from pymatgen.core import Lattice, Structure
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+
+if __name__ == "__main__":
+    n_images = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+
+    rocksalt = Structure.from_spacegroup("Fm-3m", Lattice.cubic(4.2), ["Mg", "O"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+    start = rocksalt * size
+    start.add_site_property("magmom", [1.0] * len(start))
+    end = start.copy()
+    end.perturb(0.2)
+    end.apply_strain(0.02)
+
+    for return_trajectory in (False, True):
+        begin = time.perf_counter()
+        start.interpolate(end, n_images, interpolate_lattices=True, return_trajectory=return_trajectory)
+        elapsed = time.perf_counter() - begin
+        print(f"interpolate {len(start)} sites, {n_images} images, {return_trajectory=}: {elapsed:.3f} s")
+
+    fcc = Structure(Lattice.cubic(4.09), ["Ag"] * 4, [[0, 0, 0], [0.5, 0.5, 0], [0, 0.5, 0.5], [0.5, 0, 0.5]]) * 3
+    fcc.remove_sites([0])
+    hop_idx = next(idx for idx, site in enumerate(fcc) if np.allclose(site.frac_coords, [1 / 6, 1 / 6, 0]))
+    hopped = fcc.copy()
+    hopped.replace(hop_idx, "Ag", [0, 0, 0])
+    begin = time.perf_counter()
+    IDPPSolver.from_endpoints([fcc, hopped], nimages=7, sort_tol=0).run()
+    print(f"IDPP vacancy hop, {len(fcc)} sites, 7 images: {time.perf_counter() - begin:.2f} s")
@@ -0,0 +1,45 @@
+"""Benchmark k-point symmetry reduction: SpacegroupAnalyzer.get_kpoint_weights for the
+irreducible k-points of a dense mesh, repeated irreducible mesh generation and
+folding of an arbitrary k-point list with KpointSymmetry.
+
+Usage: python bench_kpoints.py [mesh_size]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+from pymatgen.symmetry.kpoint_symmetry import KpointSymmetry
+from pymatgen.util.testing import PymatgenTest
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-19"
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    mesh = (size, size, size)
+    warnings.simplefilter("ignore")
+
+    for name in ("SrTiO3", "LiFePO4"):
+        sga = SpacegroupAnalyzer(PymatgenTest.get_structure(name))
+        kpoints = [kpt for kpt, _ in sga.get_ir_reciprocal_mesh(mesh)]
+        start = time.perf_counter()
+        sga.get_kpoint_weights(kpoints)
+        print(f"get_kpoint_weights {name}: {len(kpoints)} k-points in {time.perf_counter() - start:.2f} s")
+
+        start = time.perf_counter()
+        for _ in range(100):
+            sga.get_ir_reciprocal_mesh(mesh)
+        print(f"get_ir_reciprocal_mesh {name} x100: {time.perf_counter() - start:.2f} s")
+
+    kpt_symm = KpointSymmetry.from_structure(PymatgenTest.get_structure("SrTiO3"))
+    kpoints = np.indices((4 * size,) * 3).reshape(3, -1).T / (4 * size)
+    start = time.perf_counter()
+    n_ir = len(kpt_symm.fold(kpoints)[0])
+    print(f"KpointSymmetry.fold SrTiO3: {len(kpoints)} -> {n_ir} k-points in {time.perf_counter() - start:.2f} s")
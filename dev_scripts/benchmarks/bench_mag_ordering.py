@@ -0,0 +1,81 @@
+"""Benchmark the removal of duplicate spin orderings in MagOrderingTransformation:
+hashing of orderings with the parent space group against pairwise matching with
+StructureMatcher within groups of the same space group.
+
+All antiferromagnetic orderings of all supercells of the given sizes are generated
+directly, so that enumlib is not needed.
+
+Usage: python bench_mag_ordering.py [max_cell_size]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import warnings
+from itertools import combinations, groupby, product
+
+from pymatgen.analysis.structure_matcher import SpinComparator, StructureMatcher
+from pymatgen.core import Lattice, Species, Structure
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+from pymatgen.transformations.advanced_transformations import _SpinOrderingHasher
+from pymatgen.util.testing import PymatgenTest
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-19"
+
+
+def get_orderings(structure, sizes, symbol):
+    """All orderings with equal numbers of up and down spins of supercells of the given sizes."""
+    orderings = []
+    for size in sizes:
+        for a, c in product(range(1, size + 1), repeat=2):
+            if size % (a * c):
+                continue
+            for b, d, e in product(range(a), range(a), range(c)):
+                supercell = structure * [[a, 0, 0], [b, c, 0], [d, e, size // (a * c)]]
+                indices = supercell.indices_from_symbol(symbol)
+                for spin_up in combinations(indices, len(indices) // 2):
+                    ordering = supercell.copy()
+                    for idx in indices:
+                        ordering.replace(idx, Species(symbol, 2, spin=5 if idx in spin_up else -5))
+                    orderings.append(ordering)
+    return orderings
+
+
+def remove_duplicates_pairwise(orderings):
+    """Duplicate removal as previously done in MagOrderingTransformation."""
+    matcher = StructureMatcher(comparator=SpinComparator())
+
+    def key(struct):
+        return SpacegroupAnalyzer(struct, 0.1).get_space_group_number()
+
+    return [
+        grouped[0]
+        for _, group in groupby(sorted(orderings, key=key), key)
+        for grouped in matcher.group_structures(list(group))
+    ]
+
+
+if __name__ == "__main__":
+    max_cell_size = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    warnings.simplefilter("ignore")
+
+    nio = Structure.from_spacegroup("Fm-3m", Lattice.cubic(4.2), ["Ni2+", "O2-"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+    lfp = PymatgenTest.get_structure("LiFePO4")
+    lfp.add_oxidation_state_by_element({"Li": 1, "Fe": 2, "P": 5, "O": -2})
+    for parent, symbol, sizes in (
+        (nio.get_primitive_structure(), "Ni", range(2, max_cell_size + 1, 2)),
+        (lfp, "Fe", range(1, max_cell_size // 2 + 1)),
+    ):
+        orderings = get_orderings(parent, sizes, symbol)
+        name = f"{parent.reduced_formula} cell sizes {list(sizes)}"
+
+        start = time.perf_counter()
+        hasher = _SpinOrderingHasher(parent, [0 if site.specie.symbol == symbol else -1 for site in parent])
+        n_unique = len({hasher.get_key(ordering) for ordering in orderings})
+        print(f"{name}: hashing {len(orderings)} -> {n_unique} orderings in {time.perf_counter() - start:.2f} s")
+
+        start = time.perf_counter()
+        n_unique = len(remove_duplicates_pairwise(orderings))
+        print(f"{name}: matching {len(orderings)} -> {n_unique} orderings in {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,48 @@
+"""Benchmark covalent bond detection and boxing of a large molecule, built
+from benzene rings on a grid (20k atoms by default).
+
+Usage: python bench_molecule.py [n_atoms]
+"""
+
+from __future__ import annotations
+
+import itertools
+import sys
+import time
+
+import numpy as np
+
+from pymatgen.core import Molecule
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+BENZENE_SPECIES = ["C"] * 6 + ["H"] * 6
+BENZENE_COORDS = [
+    [1.39 * np.cos(angle) * scale, 1.39 * np.sin(angle) * scale, 0]
+    for scale in (1, 2.48 / 1.39)
+    for angle in np.arange(6) * np.pi / 3
+]
+
+
+def make_benzene_grid(n_atoms: int, spacing: float = 6.0) -> Molecule:
+    """Molecule of benzene rings on a cubic grid with at least n_atoms atoms."""
+    n_per_side = int(np.ceil((n_atoms / 12) ** (1 / 3)))
+    offsets = spacing * np.array(list(itertools.product(range(n_per_side), repeat=3)))
+    coords = (offsets[:, None, :] + np.array(BENZENE_COORDS)[None, :, :]).reshape(-1, 3)
+    return Molecule(BENZENE_SPECIES * len(offsets), coords)
+
+
+if __name__ == "__main__":
+    n_atoms = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    mol = make_benzene_grid(n_atoms)
+    print(f"{len(mol)} atoms")
+
+    start = time.perf_counter()
+    bonds = mol.get_covalent_bonds()
+    print(f"get_covalent_bonds: {len(bonds)} bonds in {time.perf_counter() - start:.2f} s")
+
+    box = 2 * np.ptp(mol.cart_coords, axis=0).max()
+    start = time.perf_counter()
+    struct = mol.get_boxed_structure(box, box, box, images=(2, 2, 1), random_rotation=True, reorder=False)
+    print(f"get_boxed_structure with 4 rotated images: {len(struct)} sites in {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,53 @@
+"""Benchmark the npz binary serialization of ComputedStructureEntries against
+the MSONable as_dict / from_dict JSON round trip.
+
+Usage: python bench_npz.py [n_entries]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+import numpy as np
+from monty.json import MontyDecoder, MontyEncoder
+
+from pymatgen.entries.computed_entries import ComputedStructureEntry
+from pymatgen.io.npz import dump_many, load_many
+from pymatgen.util.testing import PymatgenTest
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+
+def make_entries(n_entries: int) -> list[ComputedStructureEntry]:
+    """Perturbed copies of a 2x1x1 LiFePO4 supercell with magnetic moments."""
+    rng = np.random.default_rng(0)
+    base = PymatgenTest.get_structure("LiFePO4") * (2, 1, 1)
+    entries = []
+    for idx in range(n_entries):
+        struct = base.copy(site_properties={"magmom": rng.random(len(base)).tolist()})
+        struct.perturb(0.01)
+        entries.append(ComputedStructureEntry(struct, -rng.random() * 100, entry_id=f"mp-{idx}"))
+    return entries
+
+
+if __name__ == "__main__":
+    n_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    entries = make_entries(n_entries)
+
+    start = time.perf_counter()
+    json_str = json.dumps([entry.as_dict() for entry in entries], cls=MontyEncoder)
+    print(f"JSON dump: {time.perf_counter() - start:.2f} s, {len(json_str) / 1e6:.1f} MB")
+    start = time.perf_counter()
+    json.loads(json_str, cls=MontyDecoder)
+    print(f"JSON load: {time.perf_counter() - start:.2f} s")
+
+    for compress in (False, True):
+        start = time.perf_counter()
+        data = dump_many(entries, compress=compress)
+        print(f"npz dump ({compress=}): {time.perf_counter() - start:.2f} s, {len(data) / 1e6:.1f} MB")
+        start = time.perf_counter()
+        load_many(data)
+        print(f"npz load ({compress=}): {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,39 @@
+"""Benchmark OrderDisorderedStructureTransformation on LiFePO4 supercells with
+half of the Li sites vacant, with the branch-and-bound EwaldMinimizer
+(ALGO_FAST) and simulated annealing (ALGO_MONTE_CARLO).
+
+Usage: python bench_ordering.py [n_chains] [ncores]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from pymatgen.transformations.standard_transformations import OrderDisorderedStructureTransformation
+from pymatgen.util.testing import PymatgenTest
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+
+if __name__ == "__main__":
+    n_chains = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    ncores = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    lifepo4 = PymatgenTest.get_structure("LiFePO4")
+    lifepo4.add_oxidation_state_by_element({"Li": 1, "Fe": 2, "P": 5, "O": -2})
+
+    # ALGO_FAST does not finish within minutes beyond the smallest supercell
+    for scaling, algos in (((1, 2, 2), ("ALGO_FAST", "ALGO_MONTE_CARLO")), ((2, 2, 2), ("ALGO_MONTE_CARLO",))):
+        supercell = lifepo4 * scaling
+        supercell.replace_species({"Li+": {"Li+": 0.5}})
+        for algo in algos:
+            trafo = OrderDisorderedStructureTransformation(
+                algo=getattr(OrderDisorderedStructureTransformation, algo),
+                mc_params={"n_chains": n_chains, "ncores": ncores, "seed": 0},
+            )
+            start = time.perf_counter()
+            ranked = trafo.apply_transformation(supercell, return_ranked_list=5)
+            elapsed = time.perf_counter() - start
+            print(f"{algo}, {len(supercell)} sites: lowest energy {ranked[0]['energy']:.4f} eV in {elapsed:.2f} s")
@@ -0,0 +1,49 @@
+"""Benchmark PointGroupAnalyzer on ~1000-atom gold clusters cut from fcc Au,
+where most candidate operations are valid, and on a random cluster without
+symmetry, where every candidate mirror has to be rejected.
+
+Usage: python bench_point_group.py [n_random_atoms]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from pymatgen.core import Lattice, Molecule, Structure
+from pymatgen.symmetry.analyzer import PointGroupAnalyzer
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+
+def get_gold_cluster(radius: float, scale: tuple[float, float, float] = (1, 1, 1)) -> Molecule:
+    """Atoms of fcc Au within an ellipsoid with semi-axes radius * scale around an atom."""
+    gold = Structure.from_spacegroup("Fm-3m", Lattice.cubic(4.08), ["Au"], [[0, 0, 0]])
+    n_cells = 2 * (int(radius * max(scale) / 4.08) + 2)
+    supercell = gold * n_cells
+    coords = supercell.cart_coords - supercell.lattice.get_cartesian_coords([0.5, 0.5, 0.5])
+    mask = np.linalg.norm(coords / np.array(scale), axis=1) < radius
+    return Molecule(["Au"] * int(mask.sum()), coords[mask])
+
+
+if __name__ == "__main__":
+    n_random = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    molecules = {
+        "sphere": get_gold_cluster(17),
+        "ellipsoid": get_gold_cluster(14, (1, 1.3, 1.6)),
+        "random": Molecule(["C"] * n_random, np.random.default_rng(0).random((n_random, 3)) * 20),
+    }
+    for name, mol in molecules.items():
+        start = time.perf_counter()
+        analyzer = PointGroupAnalyzer(mol)
+        print(
+            f"PointGroupAnalyzer {name}, {len(mol)} atoms: {analyzer.sch_symbol} in {time.perf_counter() - start:.2f} s"
+        )
+
+    start = time.perf_counter()
+    eq_sets = PointGroupAnalyzer(molecules["sphere"]).get_equivalent_atoms()["eq_sets"]
+    print(f"get_equivalent_atoms sphere: {len(eq_sets)} sets in {time.perf_counter() - start:.2f} s")
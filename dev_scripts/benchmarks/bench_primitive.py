@@ -0,0 +1,38 @@
+"""Benchmark the reduction of ~1000-site supercells to their primitive cells with
+Structure.get_primitive_structure and StructureMatcher, which reduces both
+structures before matching.
+
+Usage: python bench_primitive.py [supercell_size]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import warnings
+
+from pymatgen.analysis.structure_matcher import StructureMatcher
+from pymatgen.core import Lattice, Structure
+from pymatgen.util.testing import PymatgenTest
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    warnings.simplefilter("ignore")
+
+    silicon = Structure.from_spacegroup("Fd-3m", Lattice.cubic(5.43), ["Si"], [[0, 0, 0]])
+    lifepo4 = PymatgenTest.get_structure("LiFePO4")
+    supercells = {"Si": silicon * size, "LiFePO4": lifepo4 * (3, 3, 4)}
+
+    for name, supercell in supercells.items():
+        start = time.perf_counter()
+        primitive = supercell.get_primitive_structure()
+        elapsed = time.perf_counter() - start
+        print(f"get_primitive_structure {name}: {len(supercell)} -> {len(primitive)} sites in {elapsed:.2f} s")
+
+    start = time.perf_counter()
+    assert StructureMatcher().fit(supercells["LiFePO4"], lifepo4)
+    print(f"StructureMatcher.fit LiFePO4 supercell vs primitive: {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,34 @@
+"""Benchmark gathering element properties for all sites of a large structure with
+Structure.get_species_property_array against looking them up per site.
+
+Usage: python bench_species_properties.py [supercell_size]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from pymatgen.util.testing import PymatgenTest
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-19"
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    struct = PymatgenTest.get_structure("LiFePO4") * (size, size, size)
+
+    for name in ("X", "atomic_mass", "atomic_radius"):
+        per_site = gathered = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            np.array([float(getattr(site.specie, name)) for site in struct])
+            per_site = min(per_site, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            struct.get_species_property_array(name)
+            gathered = min(gathered, time.perf_counter() - start)
+        print(f"{name} for {len(struct)} sites: per site {per_site:.3f} s, get_species_property_array {gathered:.4f} s")
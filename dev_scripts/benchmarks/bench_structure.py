@@ -0,0 +1,79 @@
+"""Benchmark construction, copying, straining and coordinate access of large
+structures, building a 20x20x20 supercell and its sparse distance matrix,
+merging duplicated sites of the supercell, creating many small structures from arrays and repeated neighbor queries with
+the cache enabled.
+
+Usage: python bench_structure.py [n_sites]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from pymatgen.core import Lattice, Structure
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+
+def timed(label: str, func, *args, **kwargs):
+    """Run func(*args, **kwargs), print the wall time and return the result."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"{label}: {time.perf_counter() - start:.4f} s")
+    return result
+
+
+if __name__ == "__main__":
+    n_sites = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = np.random.default_rng(0)
+    lattice = Lattice.cubic(n_sites ** (1 / 3) * 2.5)
+    species = rng.choice(["Li", "Fe", "P", "O"], n_sites).tolist()
+    frac_coords = rng.random((n_sites, 3))
+    magmoms = rng.random(n_sites).tolist()
+
+    print(f"{n_sites} sites")
+    struct = timed(
+        "Structure()", Structure, lattice, species, frac_coords, site_properties={"magmom": magmoms}, to_unit_cell=True
+    )
+    copy = timed("copy()", struct.copy)
+    timed("apply_strain()", copy.apply_strain, 0.01)
+    timed("frac_coords", lambda: struct.frac_coords)
+    timed("cart_coords", lambda: struct.cart_coords)
+    timed("composition", lambda: struct.composition)
+    timed("iterate all sites", lambda: sum(1 for _ in struct))
+
+    rocksalt = Structure.from_spacegroup("Fm-3m", Lattice.cubic(4.2), ["Mg", "O"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+    rocksalt.add_site_property("magmom", [1.0] * len(rocksalt))
+    supercell = timed("rocksalt * (20, 20, 20)", rocksalt.__mul__, (20, 20, 20))
+    print(f"{len(supercell)} sites in supercell")
+    timed("make_supercell((20, 20, 20))", rocksalt.make_supercell, (20, 20, 20))
+    sparse = timed("get_distance_matrix(cutoff=3) of supercell", supercell.get_distance_matrix, cutoff=3)
+    print(f"{sparse.nnz} stored distances instead of {len(supercell) ** 2} in the dense matrix")
+    timed("is_valid() of supercell", supercell.is_valid)
+    duplicated = Structure.from_sites([*supercell, *supercell[::10]])
+    timed(f"merge_sites() of {len(duplicated)} sites", duplicated.merge_sites, mode="delete")
+
+    n_structs, n_atoms = 10_000, 50
+    matrices = np.eye(3) * rng.uniform(8, 12, (n_structs, 1, 1))
+    atomic_numbers = rng.integers(1, 84, (n_structs, n_atoms))
+    all_frac_coords = rng.random((n_structs, n_atoms, 3))
+    timed(
+        f"Structure() x {n_structs} ({n_atoms} sites each)",
+        lambda: [Structure(*args) for args in zip(matrices, atomic_numbers.tolist(), all_frac_coords, strict=True)],
+    )
+    timed(
+        f"Structure.from_arrays() x {n_structs} ({n_atoms} sites each)",
+        lambda: [Structure.from_arrays(*args) for args in zip(matrices, atomic_numbers, all_frac_coords, strict=True)],
+    )
+
+    cell = Structure.from_spacegroup("Fm-3m", Lattice.cubic(4.2), ["Mg", "O"], [[0, 0, 0], [0.5, 0.5, 0.5]]) * 6
+    for enable in (False, True):
+        cell.enable_cache(enable)
+        timed(
+            f"5 x (distance_matrix + get_all_neighbors(3)), {len(cell)} sites, cache={enable}",
+            lambda: [(cell.distance_matrix, cell.get_all_neighbors(3)) for _ in range(5)],
+        )
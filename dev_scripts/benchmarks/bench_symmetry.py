@@ -0,0 +1,43 @@
+"""Benchmark symmetry analysis of a list of perturbed structures that is
+analyzed twice, as when the space group and the symmetrized structure are
+requested from different places of a pipeline, one structure at a time and
+with batch_symmetry_analysis.
+
+Usage: python bench_symmetry.py [n_structures] [n_jobs]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from pymatgen.symmetry.analyzer import SPGLIB_CACHE, SpacegroupAnalyzer, batch_symmetry_analysis
+from pymatgen.util.testing import PymatgenTest
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+
+if __name__ == "__main__":
+    n_structures = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    n_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    lifepo4 = PymatgenTest.get_structure("LiFePO4") * (1, 1, 2)
+    structures = []
+    for idx in range(n_structures):
+        structure = lifepo4.copy()
+        structure.perturb(1e-4, min_distance=0)
+        structure.translate_sites([idx % len(structure)], [1e-3, 0, 0])
+        structures.append(structure)
+
+    start = time.perf_counter()
+    for structure in structures:
+        structure.get_space_group_info(symprec=0.1)
+    for structure in structures:
+        SpacegroupAnalyzer(structure, symprec=0.1).get_symmetrized_structure()
+    print(f"{n_structures} structures analyzed twice: {time.perf_counter() - start:.2f} s")
+
+    SPGLIB_CACHE.clear()
+    start = time.perf_counter()
+    batch_symmetry_analysis(structures, symprec=0.1, n_jobs=n_jobs)
+    print(f"batch_symmetry_analysis, {n_jobs=}: {time.perf_counter() - start:.2f} s")
@@ -6,12 +6,14 @@ import bisect
 import math
 from copy import copy, deepcopy
 from datetime import datetime, timezone
+from multiprocessing import Pool
 from typing import TYPE_CHECKING
 from warnings import warn
 
 import numpy as np
 from monty.json import MSONable
 from scipy import constants
+from scipy.fft import next_fast_len
 from scipy.special import comb, erfc
 
 from pymatgen.core.structure import Structure
@@ -20,6 +22,7 @@ from pymatgen.util.due import Doi, due
 if TYPE_CHECKING:
     from typing import Any
 
+    from numpy.typing import ArrayLike
     from typing_extensions import Self
 
 __author__ = "Shyue Ping Ong, William Davidson Richard"
@@ -132,12 +135,14 @@ class EwaldSummation(MSONable):
         )
 
     def compute_partial_energy(self, removed_indices):
-        """Get total Ewald energy for certain sites being removed, i.e. zeroed out."""
-        total_energy_matrix = self.total_energy_matrix.copy()
-        for idx in removed_indices:
-            total_energy_matrix[idx, :] = 0
-            total_energy_matrix[:, idx] = 0
-        return sum(sum(total_energy_matrix))
+        """Get total Ewald energy for certain sites being removed, i.e. zeroed out.
+
+        For many evaluations on the same structure, IncrementalEwaldEnergy gives
+        the energy change of removing k sites in O(k^2) instead of O(N^2).
+        """
+        kept = np.ones(len(self._struct), dtype=bool)
+        kept[list(removed_indices)] = False
+        return np.sum(self.total_energy_matrix[np.ix_(kept, kept)])
 
     def compute_sub_structure(self, sub_structure, tol: float = 1e-3):
         """Get total Ewald energy for an sub structure in the same
@@ -151,37 +156,26 @@ class EwaldSummation(MSONable):
         Returns:
             Ewald sum of substructure.
         """
-        total_energy_matrix = self.total_energy_matrix.copy()
-
-        def find_match(site):
-            for test_site in sub_structure:
-                frac_diff = abs(np.array(site.frac_coords) - np.array(test_site.frac_coords)) % 1
-                frac_diff = [abs(a) < tol or abs(a) > 1 - tol for a in frac_diff]
-                if all(frac_diff):
-                    return test_site
-            return None
-
-        matches = []
-        for idx, site in enumerate(self._struct):
-            matching_site = find_match(site)
-            if matching_site:
-                new_charge = compute_average_oxidation_state(matching_site)
-                old_charge = self._oxi_states[idx]
-                scaling_factor = new_charge / old_charge
-                matches.append(matching_site)
-            else:
-                scaling_factor = 0
-            total_energy_matrix[idx, :] *= scaling_factor
-            total_energy_matrix[:, idx] *= scaling_factor
-
-        if len(matches) != len(sub_structure):
+        # For each site, the first site of sub_structure at the same position (if any)
+        frac_diff = np.abs(self._struct.frac_coords[:, None, :] - sub_structure.frac_coords[None, :, :]) % 1
+        is_match = np.all((frac_diff < tol) | (frac_diff > 1 - tol), axis=-1)
+        has_match = np.any(is_match, axis=1)
+        match_inds = np.argmax(is_match, axis=1)
+
+        scaling_factors = np.zeros(len(self._struct))
+        for idx in np.where(has_match)[0]:
+            new_charge = compute_average_oxidation_state(sub_structure[match_inds[idx]])
+            scaling_factors[idx] = new_charge / self._oxi_states[idx]
+
+        matched = set(match_inds[has_match].tolist())
+        if np.sum(has_match) != len(sub_structure):
             output = ["Missing sites."]
-            for site in sub_structure:
-                if site not in matches:
+            for idx, site in enumerate(sub_structure):
+                if idx not in matched:
                     output.append(f"unmatched = {site}")
             raise ValueError("\n".join(output))
 
-        return sum(sum(total_energy_matrix))
+        return scaling_factors @ self.total_energy_matrix @ scaling_factors
 
     @property
     def reciprocal_space_energy(self):
@@ -308,90 +302,61 @@ class EwaldSummation(MSONable):
 
         This method is heavily vectorized to utilize numpy's C backend for speed.
         """
-        n_sites = len(self._struct)
         prefactor = 2 * math.pi / self._vol
-        e_recip = np.zeros((n_sites, n_sites), dtype=np.float64)
-        forces = np.zeros((n_sites, 3), dtype=np.float64)
         coords = self._coords
         rcp_latt = self._struct.lattice.reciprocal_lattice
         recip_nn = rcp_latt.get_points_in_sphere([[0, 0, 0]], [0, 0, 0], self._gmax)
 
         frac_coords = [frac_coords for (frac_coords, dist, _idx, _img) in recip_nn if dist != 0]
 
-        gs = rcp_latt.get_cartesian_coords(frac_coords)
+        gs = rcp_latt.get_cartesian_coords(frac_coords).reshape(-1, 3)
         g2s = np.sum(gs**2, 1)
         exp_vals = np.exp(-g2s / (4 * self._eta))
         grs = np.sum(gs[:, None] * coords[None, :], 2)
+        cos_grs, sin_grs = np.cos(grs), np.sin(grs)
 
         oxi_states = np.array(self._oxi_states)
 
         # create array where q_2[i,j] is qi * qj
         qi_qj = oxi_states[None, :] * oxi_states[:, None]
 
-        # calculate the structure factor
-        s_reals = np.sum(oxi_states[None, :] * np.cos(grs), 1)
-        s_imags = np.sum(oxi_states[None, :] * np.sin(grs), 1)
-
-        for g, g2, gr, exp_val, s_real, s_imag in zip(gs, g2s, grs, exp_vals, s_reals, s_imags, strict=True):
-            # Uses the identity sin(x)+cos(x) = 2**0.5 sin(x + pi/4)
-            m = np.sin((gr[None, :] + math.pi / 4) - gr[:, None])
-            m *= exp_val / g2
-
-            e_recip += m
+        # Sum over all G vectors at once as matrix products, using
+        # cos(gr_j - gr_i) + sin(gr_j - gr_i)
+        # = cos(gr_i) (cos(gr_j) + sin(gr_j)) + sin(gr_i) (sin(gr_j) - cos(gr_j))
+        weights = (exp_vals / g2s)[:, None]
+        e_recip = (weights * cos_grs).T @ (cos_grs + sin_grs) + (weights * sin_grs).T @ (sin_grs - cos_grs)
+        e_recip *= prefactor * EwaldSummation.CONV_FACT * qi_qj
 
-            if self._compute_forces:
-                pref = 2 * exp_val / g2 * oxi_states
-                factor = prefactor * pref * (s_real * np.sin(gr) - s_imag * np.cos(gr))
-
-                forces += factor[:, None] * g[None, :]
+        forces = np.zeros((len(coords), 3), dtype=np.float64)
+        if self._compute_forces:
+            # calculate the structure factor
+            s_reals = cos_grs @ oxi_states
+            s_imags = sin_grs @ oxi_states
+            factors = 2 * weights * oxi_states[None, :] * (s_reals[:, None] * sin_grs - s_imags[:, None] * cos_grs)
+            forces = prefactor * EwaldSummation.CONV_FACT * (factors.T @ gs)
 
-        forces *= EwaldSummation.CONV_FACT
-        e_recip *= prefactor * EwaldSummation.CONV_FACT * qi_qj * 2**0.5
         return e_recip, forces
 
     def _calc_real_and_point(self):
         """Determine the self energy -(eta/pi)**(1/2) * sum_{i=1}^{N} q_i**2."""
-        frac_coords = self._struct.frac_coords
-        force_pf = 2 * self._sqrt_eta / math.sqrt(math.pi)
-        coords = self._coords
         n_sites = len(self._struct)
-        e_real = np.empty((n_sites, n_sites), dtype=np.float64)
-
-        forces = np.zeros((n_sites, 3), dtype=np.float64)
-
         qs = np.array(self._oxi_states)
 
         e_point = -(qs**2) * math.sqrt(self._eta / math.pi)
 
-        for idx in range(n_sites):
-            nf_coords, rij, js, _ = self._struct.lattice.get_points_in_sphere(
-                frac_coords, coords[idx], self._rmax, zip_results=False
-            )
-
-            # remove the rii term
-            inds = rij > 1e-8
-            js = js[inds]
-            rij = rij[inds]
-            nf_coords = nf_coords[inds]
-
-            qi = qs[idx]
-            qj = qs[js]
-
-            erfc_val = erfc(self._sqrt_eta * rij)
-            new_ereals = erfc_val * qi * qj / rij
-
-            # insert new_ereals
-            for key in range(n_sites):
-                e_real[key, idx] = np.sum(new_ereals[js == key])
-
-            if self._compute_forces:
-                nc_coords = self._struct.lattice.get_cartesian_coords(nf_coords)
+        # All pairs within the cutoff from a single neighbor list, accumulated
+        # into the (n_sites, n_sites) matrix with bincount
+        centers, points, pair_energies, pair_forces = _get_real_space_pairs(
+            self._struct, qs, self._eta, self._rmax, self._compute_forces
+        )
+        e_real = np.bincount(points * n_sites + centers, weights=pair_energies, minlength=n_sites**2)
+        e_real = e_real.reshape(n_sites, n_sites)
 
-                fijpf = qj / rij**3 * (erfc_val + force_pf * rij * np.exp(-self._eta * rij**2))
-                forces[idx] += np.sum(
-                    np.expand_dims(fijpf, 1) * (np.array([coords[idx]]) - nc_coords) * qi * EwaldSummation.CONV_FACT,
-                    axis=0,
-                )
+        forces = np.zeros((n_sites, 3), dtype=np.float64)
+        if self._compute_forces:
+            for axis in range(3):
+                forces[:, axis] = np.bincount(centers, weights=pair_forces[:, axis], minlength=n_sites)
+            forces *= EwaldSummation.CONV_FACT
 
         e_real *= 0.5 * EwaldSummation.CONV_FACT
         e_point *= EwaldSummation.CONV_FACT
@@ -466,6 +431,396 @@ class EwaldSummation(MSONable):
         return summation
 
 
+class IncrementalEwaldEnergy:
+    """
+    Ewald energy of a configuration of charges on the sites of a fixed
+    structure, with O(N) updates.
+
+    The energy is E = q^T J q, where J[i, j] is the Ewald interaction energy of
+    unit charges on sites i and j (from the total energy matrix of an
+    EwaldSummation) and q are the current charges of the sites, with zero for
+    removed (vacant) sites. The potential J q is kept up to date, so the energy
+    change of modifying k sites is evaluated in O(k^2) and applied in O(k N).
+    This makes Monte Carlo ordering and screening many candidate orderings
+    feasible. Like EwaldSummation.total_energy_matrix, the charged-cell energy
+    is not included.
+    """
+
+    def __init__(self, interaction_matrix: np.ndarray, charges: ArrayLike) -> None:
+        """
+        Args:
+            interaction_matrix (np.ndarray): (N, N) Ewald energies of unit charges
+                on each pair of sites. Symmetrized on input.
+            charges (ArrayLike): Initial charge of each site.
+        """
+        matrix = np.asarray(interaction_matrix, dtype=float)
+        self._matrix = (matrix + matrix.T) / 2
+        self._charges = np.array(charges, dtype=float)
+        if self._charges.shape != (len(self._matrix),):
+            raise ValueError(f"Expected {len(self._matrix)} charges, got {self._charges.shape}")
+        self._potential = self._matrix @ self._charges
+        self._energy = float(self._charges @ self._potential)
+
+    @classmethod
+    def from_ewald_summation(cls, ewald: EwaldSummation, charges: ArrayLike | None = None) -> Self:
+        """Initialize from an EwaldSummation of a structure.
+
+        Args:
+            ewald (EwaldSummation): Ewald summation of a structure. The unit
+                charge interactions of sites with zero charge in the structure
+                are unknown, so they are treated as non-interacting.
+            charges (ArrayLike): Initial charges. Defaults to None, which means
+                the charges of the sites in the structure.
+
+        Returns:
+            IncrementalEwaldEnergy
+        """
+        ref_charges = np.array(ewald._oxi_states, dtype=float)
+        inv_charges = np.divide(1, ref_charges, out=np.zeros_like(ref_charges), where=np.abs(ref_charges) > 1e-8)
+        matrix = ewald.total_energy_matrix * np.outer(inv_charges, inv_charges)
+        return cls(matrix, ref_charges if charges is None else charges)
+
+    @property
+    def energy(self) -> float:
+        """The Ewald energy of the current charges."""
+        return self._energy
+
+    @property
+    def charges(self) -> np.ndarray:
+        """The current charge of each site."""
+        return self._charges.copy()
+
+    @property
+    def interaction_matrix(self) -> np.ndarray:
+        """The (symmetric) Ewald energies of unit charges on each pair of sites."""
+        return self._matrix
+
+    def get_energy_change(self, indices: ArrayLike, new_charges: ArrayLike) -> float:
+        """Get the energy change of setting the charges of some sites, without
+        applying it. O(k^2) for k sites.
+
+        Args:
+            indices (ArrayLike): Distinct indices of the sites.
+            new_charges (ArrayLike): New charge of each of the sites.
+
+        Returns:
+            float: Energy after the change minus the current energy.
+        """
+        indices = np.atleast_1d(np.asarray(indices, dtype=int))
+        deltas = np.atleast_1d(np.asarray(new_charges, dtype=float)) - self._charges[indices]
+        return float(2 * deltas @ self._potential[indices] + deltas @ self._matrix[np.ix_(indices, indices)] @ deltas)
+
+    def get_swap_energy(self, idx1: int, idx2: int) -> float:
+        """Get the energy change of swapping the charges of two sites."""
+        # Scalar form of get_energy_change, since this is the inner loop of Monte Carlo ordering
+        delta = self._charges[idx2] - self._charges[idx1]
+        if delta == 0:
+            return 0.0
+        matrix = self._matrix
+        return float(
+            2 * delta * (self._potential[idx1] - self._potential[idx2])
+            + delta**2 * (matrix[idx1, idx1] + matrix[idx2, idx2] - 2 * matrix[idx1, idx2])
+        )
+
+    def get_removal_energy(self, idx: int) -> float:
+        """Get the energy change of removing a site, i.e. setting its charge to zero."""
+        return self.get_energy_change([idx], [0])
+
+    def set_charges(self, indices: ArrayLike, new_charges: ArrayLike) -> float:
+        """Set the charges of some sites. O(k N) for k sites.
+
+        Args:
+            indices (ArrayLike): Distinct indices of the sites.
+            new_charges (ArrayLike): New charge of each of the sites.
+
+        Returns:
+            float: The new energy.
+        """
+        indices = np.atleast_1d(np.asarray(indices, dtype=int))
+        new_charges = np.atleast_1d(np.asarray(new_charges, dtype=float))
+        self._energy += self.get_energy_change(indices, new_charges)
+        self._potential += self._matrix[:, indices] @ (new_charges - self._charges[indices])
+        self._charges[indices] = new_charges
+        return self._energy
+
+    def swap(self, idx1: int, idx2: int) -> float:
+        """Swap the charges of two sites and return the new energy."""
+        return self.set_charges([idx1, idx2], self._charges[[idx2, idx1]])
+
+    def remove(self, idx: int) -> float:
+        """Remove a site, i.e. set its charge to zero, and return the new energy."""
+        return self.set_charges([idx], [0])
+
+    def get_energies(self, charges: ArrayLike) -> np.ndarray:
+        """Get the energies of many configurations at once, without changing
+        the current charges.
+
+        Args:
+            charges (ArrayLike): (M, N) charges of the sites in M configurations.
+
+        Returns:
+            np.ndarray: Energy of each configuration.
+        """
+        charges = np.atleast_2d(np.asarray(charges, dtype=float))
+        return np.einsum("ij,ij->i", charges @ self._matrix, charges)
+
+
+@due.dcite(
+    Doi("10.1063/1.470117"),
+    description="A smooth particle mesh Ewald method",
+    path="pymatgen.analysis.ewald.ParticleMeshEwaldSummation",
+)
+class ParticleMeshEwaldSummation:
+    """
+    Calculates the electrostatic energy and forces of a periodic array of
+    charges with the smooth particle mesh Ewald (SPME) method, for large cells
+    where only the total energy and forces are needed.
+
+    The real space and point terms are the same as in EwaldSummation. The
+    reciprocal space sum is evaluated on a mesh with B-spline interpolation of
+    the charges and FFTs, which scales as O(N log N) instead of O(N * N_G). No
+    (N, N) energy matrices are built, so use EwaldSummation when site energies,
+    energy matrices or partial energies are needed.
+
+    Ref:
+        A smooth particle mesh Ewald method
+        U. Essmann, L. Perera, M. L. Berkowitz, T. Darden, H. Lee, L. G. Pedersen
+        J. Chem. Phys. 103, 8577 (1995)
+        DOI: 10.1063/1.470117
+    """
+
+    def __init__(
+        self,
+        structure: Structure,
+        real_space_cut: float = 10.0,
+        eta: float | None = None,
+        acc_factor: float = 12.0,
+        grid: tuple[int, int, int] | None = None,
+        order: int = 6,
+        compute_forces: bool = False,
+    ) -> None:
+        """Initialize the SPME summation. The terms are calculated lazily.
+
+        Args:
+            structure (Structure): Input structure that must have proper
+                Species on all sites, i.e. Element with oxidation state, or
+                a "charge" site property.
+            real_space_cut (float): Real space cutoff radius in Angstrom.
+                Defaults to 10.
+            eta (float): The screening parameter. Defaults to None, which means
+                the real space sum is converged to acc_factor at real_space_cut.
+            acc_factor (float): No. of significant figures each sum is
+                converged to.
+            grid (tuple[int, int, int]): Number of mesh points along each lattice
+                vector. Defaults to None, which means enough points to resolve all
+                reciprocal lattice vectors up to the reciprocal space cutoff of
+                EwaldSummation for the same eta and acc_factor.
+            order (int): Order of the B-spline interpolation. Must be even and
+                at least 4. Defaults to 6.
+            compute_forces (bool): Whether to compute forces. False by
+                default since it is usually not needed.
+        """
+        if order < 4 or order % 2:
+            raise ValueError(f"B-spline order must be even and at least 4, got {order}")
+        self._struct = structure
+        self._vol = structure.volume
+        self._compute_forces = compute_forces
+        self._order = order
+
+        accf = math.sqrt(math.log(10**acc_factor))
+        self._rmax = real_space_cut
+        self._eta = eta or (accf / real_space_cut) ** 2
+        gmax = 2 * math.sqrt(self._eta) * accf
+        if grid is None:
+            grid = tuple(
+                next_fast_len(max(2 * math.ceil(gmax * length / (2 * math.pi)) + 1, order))
+                for length in structure.lattice.abc
+            )
+        self._grid = tuple(grid)
+
+        self._oxi_states = np.array([compute_average_oxidation_state(site) for site in structure])
+        self._charged_cell_energy = (
+            -EwaldSummation.CONV_FACT / 2 * np.pi / structure.volume / self._eta * structure.charge**2
+        )
+
+        self._initialized = False
+        self._recip = self._real = self._point = self._forces = None
+
+    @property
+    def eta(self) -> float:
+        """Eta value used in the summation."""
+        return self._eta
+
+    @property
+    def grid(self) -> tuple[int, int, int]:
+        """Number of mesh points along each lattice vector."""
+        return self._grid  # type: ignore[return-value]
+
+    @property
+    def real_space_energy(self) -> float:
+        """The real space energy."""
+        self._calc_terms()
+        return self._real
+
+    @property
+    def reciprocal_space_energy(self) -> float:
+        """The reciprocal space energy."""
+        self._calc_terms()
+        return self._recip
+
+    @property
+    def point_energy(self) -> float:
+        """The point energy."""
+        self._calc_terms()
+        return self._point
+
+    @property
+    def total_energy(self) -> float:
+        """The total energy, including the charged-cell energy."""
+        self._calc_terms()
+        return self._recip + self._real + self._point + self._charged_cell_energy
+
+    @property
+    def forces(self) -> np.ndarray:
+        """The forces on each site as a Nx3 matrix. Each row corresponds to a site."""
+        if not self._compute_forces:
+            raise AttributeError("Forces are available only if compute_forces is True!")
+        self._calc_terms()
+        return self._forces
+
+    def _calc_terms(self) -> None:
+        """Calculate and set all terms (point, real and reciprocal)."""
+        if self._initialized:
+            return
+        qs = self._oxi_states
+        n_sites = len(qs)
+        centers, _points, pair_energies, pair_forces = _get_real_space_pairs(
+            self._struct, qs, self._eta, self._rmax, self._compute_forces
+        )
+        self._real = 0.5 * EwaldSummation.CONV_FACT * np.sum(pair_energies)
+        self._point = -EwaldSummation.CONV_FACT * math.sqrt(self._eta / math.pi) * np.sum(qs**2)
+        self._recip, recip_forces = self._calc_recip()
+
+        if self._compute_forces:
+            real_forces = np.zeros((n_sites, 3))
+            for axis in range(3):
+                real_forces[:, axis] = np.bincount(centers, weights=pair_forces[:, axis], minlength=n_sites)
+            self._forces = EwaldSummation.CONV_FACT * real_forces + recip_forces
+        self._initialized = True
+
+    def _calc_recip(self) -> tuple[float, np.ndarray | None]:
+        """Reciprocal space energy and forces on the mesh."""
+        order, grid = self._order, np.array(self._grid)
+        lattice = self._struct.lattice
+        qs = self._oxi_states
+
+        # Spread the charges on the mesh: each site contributes to order**3
+        # points with weights from B-splines of its scaled fractional coordinates
+        scaled = (self._struct.frac_coords % 1) * grid
+        base = np.floor(scaled).astype(int)
+        weights, d_weights = _get_bspline_weights(scaled - base, order)
+        # Mesh indices (n_sites, 3, order) of the points k = floor(u) - j
+        inds = (base[:, :, None] - np.arange(order)[None, None, :]) % grid[None, :, None]
+        flat_inds = (
+            inds[:, 0, :, None, None] * grid[1] * grid[2]
+            + inds[:, 1, None, :, None] * grid[2]
+            + inds[:, 2, None, None, :]
+        )
+        spread = weights[:, 0, :, None, None] * weights[:, 1, None, :, None] * weights[:, 2, None, None, :]
+        mesh = np.bincount(
+            flat_inds.ravel(), weights=(qs[:, None, None, None] * spread).ravel(), minlength=np.prod(grid)
+        ).reshape(grid)
+
+        # Influence function theta(m) = 2 pi / V exp(-G^2 / 4 eta) / G^2 B(m)
+        ms = np.meshgrid(*[np.fft.fftfreq(n_points, 1 / n_points) for n_points in grid], indexing="ij")
+        gs = np.stack(ms, axis=-1) @ lattice.reciprocal_lattice.matrix
+        g2s = np.sum(gs**2, axis=-1)
+        g2s[0, 0, 0] = 1
+        theta = 2 * math.pi / self._vol * np.exp(-g2s / (4 * self._eta)) / g2s
+        theta[0, 0, 0] = 0
+        for axis, moduli in enumerate(_get_bspline_moduli(grid, order)):
+            shape = [1, 1, 1]
+            shape[axis] = -1
+            theta *= moduli.reshape(shape)
+
+        mesh_fft = np.fft.fftn(mesh)
+        energy = EwaldSummation.CONV_FACT * np.sum(theta * np.abs(mesh_fft) ** 2)
+
+        forces = None
+        if self._compute_forces:
+            # dE/dQ(k) on the mesh, gathered back to the sites with the B-spline derivatives
+            potential = 2 * np.prod(grid) * np.real(np.fft.ifftn(theta * mesh_fft)).ravel()[flat_inds]
+            d_scaled = np.stack(
+                [
+                    np.sum(
+                        potential
+                        * d_weights[:, 0, :, None, None]
+                        * weights[:, 1, None, :, None]
+                        * weights[:, 2, None, None, :],
+                        axis=(1, 2, 3),
+                    ),
+                    np.sum(
+                        potential
+                        * weights[:, 0, :, None, None]
+                        * d_weights[:, 1, None, :, None]
+                        * weights[:, 2, None, None, :],
+                        axis=(1, 2, 3),
+                    ),
+                    np.sum(
+                        potential
+                        * weights[:, 0, :, None, None]
+                        * weights[:, 1, None, :, None]
+                        * d_weights[:, 2, None, None, :],
+                        axis=(1, 2, 3),
+                    ),
+                ],
+                axis=1,
+            )
+            # u = K * frac_coords = K * (r @ inv(matrix)), so du_a/dr_b = K_a inv(matrix)[b, a]
+            forces = -EwaldSummation.CONV_FACT * (qs[:, None] * d_scaled * grid[None, :]) @ lattice.inv_matrix.T
+        return energy, forces
+
+
+def _get_bspline_weights(frac_parts: np.ndarray, order: int) -> tuple[np.ndarray, np.ndarray]:
+    """Cardinal B-spline values M_n(w + j) and derivatives for j = 0, ..., order - 1.
+
+    Args:
+        frac_parts (np.ndarray): Fractional parts w in [0, 1) of any shape.
+        order (int): Order n of the B-splines (>= 3).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Values and derivatives, with an extra
+            last axis of length order.
+    """
+    # M_2(w) = w and M_2(w + 1) = 1 - w, then the recursion
+    # M_n(x) = (x M_{n-1}(x) + (n - x) M_{n-1}(x - 1)) / (n - 1)
+    values = np.zeros((*frac_parts.shape, order))
+    values[..., 0] = frac_parts
+    values[..., 1] = 1 - frac_parts
+    shifts = frac_parts[..., None] + np.arange(order)
+    for n in range(3, order + 1):
+        previous = values.copy()
+        shifted = np.zeros_like(previous)
+        shifted[..., 1:] = previous[..., :-1]
+        if n == order:
+            d_values = previous - shifted
+        values = (shifts * previous + (n - shifts) * shifted) / (n - 1)
+    return values, d_values
+
+
+def _get_bspline_moduli(grid: np.ndarray, order: int) -> list[np.ndarray]:
+    """Squared moduli |b(m)|^2 of the SPME structure factor correction along each axis."""
+    # M_n(k + 1) for k = 0, ..., order - 2
+    values, _ = _get_bspline_weights(np.zeros(1), order)
+    knots = values[0, 1:]
+    moduli = []
+    for n_points in grid:
+        phases = np.exp(2j * math.pi * np.outer(np.arange(n_points), np.arange(order - 1)) / n_points)
+        denominators = np.abs(phases @ knots) ** 2
+        moduli.append(np.where(denominators > 1e-10, 1 / np.maximum(denominators, 1e-10), 0))
+    return moduli
+
+
 class EwaldMinimizer:
     """
     This class determines the manipulations that will minimize an Ewald matrix,
@@ -700,6 +1055,239 @@ class EwaldMinimizer:
         return self._output_lists
 
 
+class EwaldMonteCarloMinimizer:
+    """
+    Determines the manipulations that minimize an Ewald matrix by simulated
+    annealing, as an alternative to the branch-and-bound search of
+    EwaldMinimizer for orderings with many partially occupied sites.
+
+    The inputs and outputs are the same as for EwaldMinimizer. Each
+    manipulation multiplies the rows and columns of the sites it is applied to
+    by its fraction, and sites that no manipulation is applied to keep a
+    fraction of 1. Manipulations must act on either identical or disjoint sets
+    of indices. Every chain starts from a random assignment of the
+    manipulations to the sites of each set and proposes swaps of the
+    fractions of two sites in the same set, accepted with the Metropolis
+    criterion while the temperature is lowered geometrically. The energy
+    changes are evaluated in O(1) and applied in O(N) with
+    IncrementalEwaldEnergy. Independent chains can run in a process pool.
+
+    The lowest energy distinct assignments visited by all chains are returned.
+    Being a stochastic search, the lowest energy ordering is not guaranteed to
+    be found, and symmetrically equivalent orderings are not merged.
+    """
+
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        m_list: list,
+        num_to_return: int = 1,
+        n_chains: int = 4,
+        n_sweeps: int = 1000,
+        start_kt: float | None = None,
+        end_kt: float | None = None,
+        ncores: int | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Args:
+            matrix: A matrix of the Ewald sum interaction energies.
+            m_list: list of manipulations. each item is of the form
+                (multiplication fraction, number_of_indices, indices, species)
+            num_to_return (int): Number of lowest energy distinct orderings to
+                return. Defaults to 1.
+            n_chains (int): Number of independent annealing chains. Defaults to 4.
+            n_sweeps (int): Number of sweeps per chain. Each sweep proposes as
+                many swaps as there are sites to order and is run at a single
+                temperature. Defaults to 1000.
+            start_kt (float): Initial temperature in energy units of the matrix
+                (eV). Defaults to None, which means the largest absolute energy
+                change of random swaps from a random ordering.
+            end_kt (float): Final temperature. Defaults to None, which means
+                start_kt / 1000.
+            ncores (int): Number of processes to run the chains in. Defaults to
+                None, which means the chains are run serially.
+            seed (int): Seed of the random number generator, for reproducible
+                orderings. Defaults to None.
+        """
+        self._matrix = np.asarray(matrix, dtype=float)
+        self._m_list = m_list
+        self._num_to_return = num_to_return
+
+        n_sites = len(self._matrix)
+        # Label of each site: the index of the manipulation applied to it, or
+        # len(m_list) for no manipulation
+        self._factors = np.array([manipulation[0] for manipulation in m_list] + [1], dtype=float)
+        labels = np.full(n_sites, len(m_list))
+        groups: dict[tuple[int, ...], list[int]] = {}
+        for m_idx, manipulation in enumerate(m_list):
+            groups.setdefault(tuple(sorted(manipulation[2])), []).append(m_idx)
+        used_indices: set[int] = set()
+        self._groups = []
+        for indices, m_indices in groups.items():
+            if used_indices.intersection(indices):
+                raise ValueError("Manipulations must act on identical or disjoint sets of indices")
+            used_indices.update(indices)
+            group_labels = np.concatenate([np.full(m_list[m_idx][1], m_idx) for m_idx in m_indices])
+            if len(group_labels) > len(indices):
+                raise ValueError(f"More manipulations than sites for indices {list(indices)}")
+            labels[list(indices)[: len(group_labels)]] = group_labels
+            self._groups.append(np.array(indices))
+        self._labels = labels
+
+        seeds = np.random.SeedSequence(seed).spawn(n_chains + 1)
+        if start_kt is None:
+            start_kt = self._get_start_kt(np.random.default_rng(seeds[0]))
+        end_kt = start_kt / 1000 if end_kt is None else end_kt
+
+        args = [
+            (self._matrix, self._groups, labels, self._factors, n_sweeps, start_kt, end_kt, num_to_return, chain_seed)
+            for chain_seed in seeds[1:]
+        ]
+        if ncores and ncores > 1:
+            with Pool(min(ncores, n_chains)) as pool:
+                results = pool.starmap(_anneal_ewald_chain, args)
+        else:
+            results = [_anneal_ewald_chain(*chain_args) for chain_args in args]
+
+        # Merge the distinct orderings of all chains and recompute their energies exactly
+        orderings = {label_array.tobytes(): label_array for result in results for label_array in result}
+        all_labels = np.array(list(orderings.values()))
+        energies = IncrementalEwaldEnergy(self._matrix, self._factors[labels]).get_energies(self._factors[all_labels])
+        order = np.argsort(energies, kind="stable")[:num_to_return]
+
+        self._output_lists = []
+        for idx in order:
+            sites = np.flatnonzero(all_labels[idx] < len(m_list))
+            self._output_lists.append(
+                [float(energies[idx]), [[int(site), m_list[all_labels[idx, site]][3]] for site in sites]]
+            )
+        self._best_m_list = self._output_lists[0][1]
+        self._minimized_sum = self._output_lists[0][0]
+
+    def _get_start_kt(self, rng: np.random.Generator, n_samples: int = 1000) -> float:
+        """Largest absolute energy change of random swaps from a random ordering,
+        so that initially all swaps are likely to be accepted in every group.
+        """
+        labels = self._labels.copy()
+        for group in self._groups:
+            labels[group] = rng.permutation(labels[group])
+        energy = IncrementalEwaldEnergy(self._matrix, self._factors[labels])
+        changes = [
+            abs(energy.get_swap_energy(idx1, idx2))
+            for group in self._groups
+            for idx1, idx2 in rng.choice(group, size=(n_samples, 2))
+        ]
+        return max(changes, default=0) or 1.0
+
+    @property
+    def best_m_list(self):
+        """The best manipulation list found."""
+        return self._best_m_list
+
+    @property
+    def minimized_sum(self):
+        """The minimized Ewald sum."""
+        return self._minimized_sum
+
+    @property
+    def output_lists(self):
+        """Output lists."""
+        return self._output_lists
+
+
+def _anneal_ewald_chain(
+    matrix: np.ndarray,
+    groups: list[np.ndarray],
+    labels: np.ndarray,
+    factors: np.ndarray,
+    n_sweeps: int,
+    start_kt: float,
+    end_kt: float,
+    num_to_return: int,
+    seed: np.random.SeedSequence,
+) -> list[np.ndarray]:
+    """Run one simulated annealing chain of EwaldMonteCarloMinimizer. Module
+    level so it can be run in a process pool.
+
+    Returns:
+        list[np.ndarray]: Site labels of the lowest energy distinct orderings visited.
+    """
+    if not groups:
+        return [labels]
+    rng = np.random.default_rng(seed)
+    labels = labels.copy()
+    for group in groups:
+        labels[group] = rng.permutation(labels[group])
+    energy_model = IncrementalEwaldEnergy(matrix, factors[labels])
+
+    # Swaps are proposed between a random site and a random site of the same group
+    active = np.concatenate(groups)
+    sizes = np.array([len(group) for group in groups])
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    group_ids = np.repeat(np.arange(len(groups)), sizes)
+
+    best: dict[bytes, tuple[float, np.ndarray]] = {labels.tobytes(): (energy_model.energy, labels.copy())}
+    threshold = energy_model.energy if len(best) == num_to_return else float("inf")
+    for kt in np.geomspace(start_kt, end_kt, n_sweeps):
+        pos1 = rng.integers(len(active), size=len(active))
+        ids = group_ids[pos1]
+        pos2 = starts[ids] + (rng.random(len(active)) * sizes[ids]).astype(int)
+        # Accept if exp(-dE / kT) > u, i.e. dE < -kT log(u)
+        max_changes = -kt * np.log(1 - rng.random(len(active)))
+        for idx1, idx2, max_change in zip(
+            active[pos1].tolist(), active[pos2].tolist(), max_changes.tolist(), strict=True
+        ):
+            if labels[idx1] == labels[idx2] or energy_model.get_swap_energy(idx1, idx2) >= max_change:
+                continue
+            energy = energy_model.swap(idx1, idx2)
+            labels[idx1], labels[idx2] = labels[idx2], labels[idx1]
+            if energy < threshold or len(best) < num_to_return:
+                key = labels.tobytes()
+                if key in best:
+                    continue
+                best[key] = (energy, labels.copy())
+                if len(best) > num_to_return:
+                    del best[max(best, key=lambda k: best[k][0])]
+                if len(best) == num_to_return:
+                    threshold = max(energy for energy, _ in best.values())
+    return [label_array for _, label_array in best.values()]
+
+
+def _get_real_space_pairs(
+    structure: Structure, charges: np.ndarray, eta: float, cutoff: float, compute_forces: bool = False
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray | None]:
+    """Real space Ewald terms of all pairs of sites within cutoff, from a single
+    neighbor list call.
+
+    Args:
+        structure (Structure): The structure.
+        charges (np.ndarray): Charge of each site.
+        eta (float): The screening parameter.
+        cutoff (float): Real space cutoff radius.
+        compute_forces (bool): Whether to compute the pair forces.
+
+    Returns:
+        tuple: Center and neighbor indices of each pair, the pair energies
+            q_i q_j erfc(sqrt(eta) r) / r and, if compute_forces, the force on the
+            center from each pair (both without the unit conversion factor).
+    """
+    sqrt_eta = math.sqrt(eta)
+    centers, points, images, rij = structure.get_neighbor_list(cutoff)
+    qi_qj = charges[centers] * charges[points]
+    erfc_val = erfc(sqrt_eta * rij)
+    pair_energies = erfc_val * qi_qj / rij
+
+    pair_forces = None
+    if compute_forces:
+        coords = structure.cart_coords
+        vecs = coords[centers] - coords[points] - structure.lattice.get_cartesian_coords(images)
+        force_pf = 2 * sqrt_eta / math.sqrt(math.pi)
+        fijpf = qi_qj / rij**3 * (erfc_val + force_pf * rij * np.exp(-eta * rij**2))
+        pair_forces = fijpf[:, None] * vecs
+    return centers, points, pair_energies, pair_forces
+
+
 def compute_average_oxidation_state(site):
     """
     Calculates the average oxidation state of a site.
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 
 from monty.json import MSONable
 
-from pymatgen.analysis.graphs import MoleculeGraph, MolGraphSplitError
+from pymatgen.analysis.graphs import MoleculeGraph, MolGraphSplitError, _graph_hash
 from pymatgen.analysis.local_env import OpenBabelNN, metal_edge_extender
 from pymatgen.io.babel import BabelMolAdaptor
 
@@ -72,6 +72,8 @@ class Fragmenter(MSONable):
                 miss some unique subfragments.
         """
         self.assume_previous_thoroughness = assume_previous_thoroughness
+        # graph hashes used to prescreen isomorphism checks, keyed by id of the MoleculeGraph
+        self._graph_hashes: dict[int, tuple[MoleculeGraph, str]] = {}
         self.open_rings = open_rings
         self.opt_steps = opt_steps
 
@@ -130,11 +132,7 @@ class Fragmenter(MSONable):
                     self.new_unique_frag_dict[frag_key] = copy.deepcopy(self.all_unique_frag_dict[frag_key])
                 else:
                     for fragment in self.all_unique_frag_dict[frag_key]:
-                        found = False
-                        for prev_frag in self.prev_unique_frag_dict[frag_key]:
-                            if fragment.isomorphic_to(prev_frag):
-                                found = True
-                        if not found:
+                        if not self._is_isomorph_present(fragment, self.prev_unique_frag_dict[frag_key]):
                             if frag_key not in self.new_unique_frag_dict:
                                 self.new_unique_frag_dict[frag_key] = [fragment]
                             else:
@@ -188,28 +186,37 @@ class Fragmenter(MSONable):
                             and self.prev_unique_frag_dict != {}
                             and new_frag_key in self.prev_unique_frag_dict
                         ):
-                            for unique_fragment in self.prev_unique_frag_dict[new_frag_key]:
-                                if unique_fragment.isomorphic_to(fragment):
-                                    proceed = False
-                                    break
+                            proceed = not self._is_isomorph_present(fragment, self.prev_unique_frag_dict[new_frag_key])
                         if proceed:
                             if new_frag_key not in self.all_unique_frag_dict:
                                 self.all_unique_frag_dict[new_frag_key] = [fragment]
                                 new_frag_dict[new_frag_key] = [fragment]
-                            else:
-                                found = False
-                                for unique_fragment in self.all_unique_frag_dict[new_frag_key]:
-                                    if unique_fragment.isomorphic_to(fragment):
-                                        found = True
-                                        break
-                                if not found:
-                                    self.all_unique_frag_dict[new_frag_key].append(fragment)
-                                    if new_frag_key in new_frag_dict:
-                                        new_frag_dict[new_frag_key].append(fragment)
-                                    else:
-                                        new_frag_dict[new_frag_key] = [fragment]
+                            elif not self._is_isomorph_present(fragment, self.all_unique_frag_dict[new_frag_key]):
+                                self.all_unique_frag_dict[new_frag_key].append(fragment)
+                                if new_frag_key in new_frag_dict:
+                                    new_frag_dict[new_frag_key].append(fragment)
+                                else:
+                                    new_frag_dict[new_frag_key] = [fragment]
         return new_frag_dict
 
+    def _get_graph_hash(self, mol_graph: MoleculeGraph) -> str:
+        """Get the (memoized) Weisfeiler-Lehman hash of a fragment."""
+        key = id(mol_graph)
+        if key not in self._graph_hashes:
+            # keep a reference to the fragment so that its id cannot be reused
+            self._graph_hashes[key] = (mol_graph, _graph_hash(mol_graph.graph))
+        return self._graph_hashes[key][1]
+
+    def _is_isomorph_present(self, fragment: MoleculeGraph, frag_list: list[MoleculeGraph]) -> bool:
+        """Check whether a fragment isomorphic to the given one is present in frag_list. The full
+        isomorphism check is only done for fragments with the same graph hash.
+        """
+        frag_hash = self._get_graph_hash(fragment)
+        return any(
+            self._get_graph_hash(unique_fragment) == frag_hash and unique_fragment.isomorphic_to(fragment)
+            for unique_fragment in frag_list
+        )
+
     def _open_all_rings(self) -> None:
         """
         Having already generated all unique fragments that did not require ring opening,
@@ -235,22 +242,10 @@ class Fragmenter(MSONable):
                             if frag_key not in new_frag_keys["0"]:
                                 new_frag_keys["0"].append(copy.deepcopy(frag_key))
                                 new_frag_key_dict[frag_key] = copy.deepcopy([new_fragment])
-                            else:
-                                found = False
-                                for unique_fragment in new_frag_key_dict[frag_key]:
-                                    if unique_fragment.isomorphic_to(new_fragment):
-                                        found = True
-                                        break
-                                if not found:
-                                    new_frag_key_dict[frag_key].append(copy.deepcopy(new_fragment))
-                        else:
-                            found = False
-                            for unique_fragment in self.all_unique_frag_dict[frag_key]:
-                                if unique_fragment.isomorphic_to(new_fragment):
-                                    found = True
-                                    break
-                            if not found:
-                                self.all_unique_frag_dict[frag_key].append(copy.deepcopy(new_fragment))
+                            elif not self._is_isomorph_present(new_fragment, new_frag_key_dict[frag_key]):
+                                new_frag_key_dict[frag_key].append(copy.deepcopy(new_fragment))
+                        elif not self._is_isomorph_present(new_fragment, self.all_unique_frag_dict[frag_key]):
+                            self.all_unique_frag_dict[frag_key].append(copy.deepcopy(new_fragment))
         for key, value in new_frag_key_dict.items():
             self.all_unique_frag_dict[key] = copy.deepcopy(value)
         idx = 0
@@ -270,22 +265,10 @@ class Fragmenter(MSONable):
                                 if frag_key not in new_frag_keys[str(idx)]:
                                     new_frag_keys[str(idx)].append(copy.deepcopy(frag_key))
                                     new_frag_key_dict[frag_key] = copy.deepcopy([new_fragment])
-                                else:
-                                    found = False
-                                    for unique_fragment in new_frag_key_dict[frag_key]:
-                                        if unique_fragment.isomorphic_to(new_fragment):
-                                            found = True
-                                            break
-                                    if not found:
-                                        new_frag_key_dict[frag_key].append(copy.deepcopy(new_fragment))
-                            else:
-                                found = False
-                                for unique_fragment in self.all_unique_frag_dict[frag_key]:
-                                    if unique_fragment.isomorphic_to(new_fragment):
-                                        found = True
-                                        break
-                                if not found:
-                                    self.all_unique_frag_dict[frag_key].append(copy.deepcopy(new_fragment))
+                                elif not self._is_isomorph_present(new_fragment, new_frag_key_dict[frag_key]):
+                                    new_frag_key_dict[frag_key].append(copy.deepcopy(new_fragment))
+                            elif not self._is_isomorph_present(new_fragment, self.all_unique_frag_dict[frag_key]):
+                                self.all_unique_frag_dict[frag_key].append(copy.deepcopy(new_fragment))
             for key, value in new_frag_key_dict.items():
                 self.all_unique_frag_dict[key] = copy.deepcopy(value)
         self.all_unique_frag_dict.pop(mol_key)
@@ -26,6 +26,7 @@ from scipy.stats import describe
 from pymatgen.core import Lattice, Molecule, PeriodicSite, Structure
 from pymatgen.core.structure import FunctionalGroups
 from pymatgen.util.coord import lattice_points_in_supercell
+from pymatgen.util.graph_hashing import weisfeiler_lehman_graph_hash
 from pymatgen.vis.structure_vtk import EL_COLORS
 
 try:
@@ -34,7 +35,7 @@ except ImportError:
     igraph = None
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
     from typing import Any
 
     from igraph import Graph
@@ -115,6 +116,55 @@ def _isomorphic(frag1: nx.Graph, frag2: nx.Graph) -> bool:
     return nx.is_isomorphic(frag1.to_undirected(), frag2.to_undirected(), node_match=nm)
 
 
+def _graph_hash(graph: nx.Graph, node_attr: str = "specie") -> str:
+    """Helper function to get the Weisfeiler-Lehman hash of the undirected, simple graph
+    underlying a (multi-, di-)graph, with nodes labelled by node_attr.
+
+    Isomorphic graphs always share a hash, so hashes can be used to bucket graphs
+    before doing a full isomorphism check.
+    """
+    return weisfeiler_lehman_graph_hash(nx.Graph(graph), node_attr=node_attr)
+
+
+def unique_graphs(
+    graphs: Iterable,
+    isomorphic: Callable[[Any, Any], bool] | None = None,
+    node_attr: str = "specie",
+) -> list:
+    """Remove isomorphic duplicates from a collection of graphs.
+
+    Graphs are first bucketed by their Weisfeiler-Lehman hash and the full
+    isomorphism check is only performed within a bucket, which avoids the
+    quadratic number of isomorphism checks of a pairwise comparison.
+
+    Args:
+        graphs: networkx graphs or MoleculeGraphs. Nodes must have a node_attr attribute.
+        isomorphic (Callable): Function taking two graphs and returning whether they are
+            isomorphic. Defaults to MoleculeGraph.isomorphic_to for MoleculeGraphs and to
+            a species-aware isomorphism check for networkx graphs.
+        node_attr (str): Node attribute used to label nodes when hashing. Defaults to "specie".
+
+    Returns:
+        list: The first occurrence of each unique graph, in input order.
+    """
+    buckets: dict[str, list] = defaultdict(list)
+    unique: list = []
+    for graph in graphs:
+        is_mol_graph = isinstance(graph, MoleculeGraph)
+        if isomorphic is not None:
+            is_iso = isomorphic
+        elif is_mol_graph:
+            is_iso = MoleculeGraph.isomorphic_to
+        else:
+            is_iso = _isomorphic
+
+        bucket = buckets[_graph_hash(graph.graph if is_mol_graph else graph, node_attr=node_attr)]
+        if not any(is_iso(graph, other) for other in bucket):
+            bucket.append(graph)
+            unique.append(graph)
+    return unique
+
+
 class StructureGraph(MSONable):
     """
     This is a class for annotating a Structure with bond information, stored in the form
@@ -1510,14 +1560,10 @@ class StructureGraph(MSONable):
             return True
 
         # prune duplicate subgraphs
-        unique_subgraphs: list = []
-        for subgraph in molecule_subgraphs:
-            already_present = [
-                nx.is_isomorphic(subgraph, g, node_match=node_match, edge_match=edge_match) for g in unique_subgraphs
-            ]
-
-            if not any(already_present):
-                unique_subgraphs.append(subgraph)
+        unique_subgraphs = unique_graphs(
+            molecule_subgraphs,
+            isomorphic=lambda g1, g2: nx.is_isomorphic(g1, g2, node_match=node_match, edge_match=edge_match),
+        )
 
         # get Molecule objects for each subgraph
         molecules = []
@@ -2133,16 +2179,7 @@ class MoleculeGraph(MSONable):
         # narrow to all unique fragments using graph isomorphism
         unique_frag_dict = {}
         for key, fragments in frag_dict.items():
-            unique_frags = []
-            for frag in fragments:
-                found = False
-                for fragment in unique_frags:
-                    if _isomorphic(frag, fragment):
-                        found = True
-                        break
-                if not found:
-                    unique_frags.append(frag)
-            unique_frag_dict[key] = copy.deepcopy(unique_frags)
+            unique_frag_dict[key] = copy.deepcopy(unique_graphs(fragments))
 
         # convert back to molecule graphs
         unique_mol_graph_dict = {}
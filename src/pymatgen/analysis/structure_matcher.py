@@ -941,13 +941,16 @@ class StructureMatcher(MSONable):
 
     @classmethod
     def _get_reduced_structure(cls, struct: Structure, primitive_cell: bool = True, niggli: bool = True) -> Structure:
-        """Helper method to find a reduced structure."""
-        reduced = struct.copy()
+        """Helper method to find a reduced structure. Both reductions return new
+        structures, and get_primitive_structure returns early (after its vectorized
+        translation search) for structures that are already primitive.
+        """
+        reduced = struct
         if niggli:
             reduced = reduced.get_reduced_structure(reduction_algo="niggli")
         if primitive_cell:
             reduced = reduced.get_primitive_structure()
-        return reduced
+        return struct.copy() if reduced is struct else reduced
 
     def get_rms_anonymous(self, struct1, struct2):
         """
@@ -9,6 +9,7 @@ This allows the usage and customization in Python.
 from __future__ import annotations
 
 import os
+import warnings
 from glob import glob
 from typing import TYPE_CHECKING
 
@@ -23,6 +24,8 @@ from pymatgen.io.vasp import Outcar
 from pymatgen.util.plotting import pretty_plot
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from typing_extensions import Self
 
 
@@ -277,6 +280,201 @@ class NEBAnalysis(MSONable):
         }
 
 
+class IDPPSolver:
+    """Optimize an interpolated path between two structures with the image
+    dependent pair potential (IDPP) of Smidstrup et al., J. Chem. Phys. 140,
+    214106 (2014), which gives much better initial NEB paths than linear
+    interpolation.
+
+    The interatomic distances in each image are driven towards a linear
+    interpolation of the distances in the endpoints, with nudged elastic band
+    projections to keep the images spread along the path. Only pairs of sites
+    within a cutoff distance in any image of the initial path are included,
+    since the pair weights decay as 1 / d^4. The pairs are stored as index
+    arrays with a fixed periodic image each, so memory and cost per step are
+    O(n_images * n_pairs), i.e. linear in the number of sites for large cells.
+    """
+
+    def __init__(self, structures: Sequence[Structure], cutoff: float = 6.0) -> None:
+        """
+        Args:
+            structures (list[Structure]): Initial path, including both endpoints,
+                e.g. from Structure.interpolate. All images must have the same
+                lattice and species.
+            cutoff (float): Pairs of sites are included if they are closer than
+                cutoff in Angstrom in any image of the initial path. Defaults to 6.
+        """
+        if len(structures) < 3:
+            raise ValueError("IDPPSolver needs at least one image between the endpoints.")
+        lattice = structures[0].lattice
+        if any(struct.lattice != lattice for struct in structures[1:]):
+            raise ValueError("All images must have the same lattice.")
+
+        self.structures = list(structures)
+        self.lattice = lattice
+
+        # Unwrap the fractional coordinates along the path so images connect continuously
+        frac_coords = np.array([struct.frac_coords for struct in structures])
+        steps = np.diff(frac_coords, axis=0)
+        steps[..., lattice.pbc] -= np.round(steps[..., lattice.pbc])
+        frac_coords[1:] = frac_coords[0] + np.cumsum(steps, axis=0)
+        self.init_coords = lattice.get_cartesian_coords(frac_coords)
+
+        # Pairs (i, j) with the periodic image of j fixed, so the forces stay
+        # continuous as atoms move. Images of the neighbor lists are converted to
+        # the unwrapped coordinates.
+        pairs = []
+        for struct, unwrapped in zip(structures, frac_coords, strict=True):
+            centers, points, images, _dists = struct.get_neighbor_list(cutoff)
+            wraps = np.round(unwrapped - struct.frac_coords)
+            shifts = images + wraps[centers] - wraps[points]
+            pairs.append(np.column_stack([centers, points, shifts]).astype(np.int64))
+        pairs = np.unique(np.concatenate(pairs), axis=0)
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        self._centers, self._points = pairs[:, 0], pairs[:, 1]
+        self._image_shifts = lattice.get_cartesian_coords(pairs[:, 2:])
+
+        # Target distances interpolate linearly between the endpoint distances
+        _vecs, dists = self._get_pair_vectors(self.init_coords)
+        fractions = np.linspace(0, 1, len(structures))[:, None]
+        self.target_dists = dists[0] + fractions * (dists[-1] - dists[0])
+
+    @classmethod
+    def from_endpoints(
+        cls, endpoints: Sequence[Structure], nimages: int = 5, sort_tol: float = 1.0, cutoff: float = 6.0
+    ) -> Self:
+        """Initialize from two endpoints with a linear interpolation.
+
+        Args:
+            endpoints (list[Structure]): The start and end structures.
+            nimages (int): Number of images between the endpoints. Defaults to 5.
+            sort_tol (float): Distance tolerance in Angstrom to match the sites
+                of the endpoints, see Structure.interpolate. 0 implies no sorting.
+                Defaults to 1.0.
+            cutoff (float): Cutoff distance of the pairs in Angstrom. Defaults to 6.
+
+        Returns:
+            IDPPSolver
+        """
+        start, end = endpoints
+        return cls(start.interpolate(end, nimages=nimages + 1, autosort_tol=sort_tol), cutoff=cutoff)
+
+    def _get_pair_vectors(self, coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Vectors r_j - r_i of shape (n_images, n_pairs, 3) to the fixed periodic
+        images and their lengths.
+        """
+        vecs = coords[:, self._points] - coords[:, self._centers] + self._image_shifts
+        return vecs, np.linalg.norm(vecs, axis=-1)
+
+    def _get_funcs_and_forces(self, coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """IDPP objective function and forces of all images."""
+        vecs, dists = self._get_pair_vectors(coords)
+        diff = self.target_dists - dists
+
+        # S = 1/2 sum_ij w(d_ij) (target_ij - d_ij)^2 with w(d) = 1/d^4
+        weights = dists**-4
+        funcs = 0.5 * np.einsum("kp,kp,kp->k", weights, diff, diff)
+        d_func = -2 * weights * diff * (2 * diff / dists + 1)
+        pair_forces = (d_func / dists)[..., None] * vecs
+
+        # Sum the pair forces onto the center sites of all images at once
+        n_images, n_sites = coords.shape[:2]
+        indices = (np.arange(n_images)[:, None] * n_sites + self._centers).ravel()
+        forces = np.column_stack(
+            [
+                np.bincount(indices, weights=pair_forces[..., axis].ravel(), minlength=n_images * n_sites)
+                for axis in range(3)
+            ]
+        )
+        return funcs, forces.reshape(n_images, n_sites, 3)
+
+    @staticmethod
+    def _get_tangents(coords: np.ndarray, funcs: np.ndarray) -> np.ndarray:
+        """Normalized improved tangents (Henkelman and Jonsson, J. Chem. Phys. 113,
+        9978 (2000)) of the intermediate images, flattened to (n_images - 2, n_sites * 3).
+        """
+        flat = coords.reshape(len(coords), -1)
+        tau_plus, tau_minus = flat[2:] - flat[1:-1], flat[1:-1] - flat[:-2]
+        delta_plus, delta_minus = funcs[2:] - funcs[1:-1], funcs[1:-1] - funcs[:-2]
+
+        d_max = np.maximum(np.abs(delta_plus), np.abs(delta_minus))[:, None]
+        d_min = np.minimum(np.abs(delta_plus), np.abs(delta_minus))[:, None]
+        mixed = np.where(
+            (funcs[2:] > funcs[:-2])[:, None],
+            tau_plus * d_max + tau_minus * d_min,
+            tau_plus * d_min + tau_minus * d_max,
+        )
+        tangents = np.where(
+            ((delta_plus > 0) & (delta_minus > 0))[:, None],
+            tau_plus,
+            np.where(((delta_plus < 0) & (delta_minus < 0))[:, None], tau_minus, mixed),
+        )
+        return tangents / np.linalg.norm(tangents, axis=1, keepdims=True)
+
+    def run(
+        self,
+        maxiter: int = 1000,
+        tol: float = 1e-5,
+        gtol: float = 1e-3,
+        step_size: float = 0.05,
+        max_disp: float = 0.05,
+        spring_const: float = 5.0,
+    ) -> list[Structure]:
+        """Optimize the path by steepest descent on the NEB forces of the IDPP.
+
+        Args:
+            maxiter (int): Maximum number of iterations. Defaults to 1000.
+            tol (float): Tolerance for the change in the summed objective
+                functions of all images between iterations. Defaults to 1e-5.
+            gtol (float): Tolerance for the largest NEB force component.
+                Defaults to 1e-3.
+            step_size (float): Step size of the steepest descent. Defaults to 0.05.
+            max_disp (float): Maximum displacement of any coordinate in one step
+                in Angstrom. Defaults to 0.05.
+            spring_const (float): Spring constant between images. Defaults to 5.0.
+
+        Returns:
+            list[Structure]: The optimized path, including the unchanged endpoints.
+        """
+        coords = self.init_coords.copy()
+        n_images, n_sites, _ = coords.shape
+        old_funcs = np.zeros(n_images)
+        for _ in range(maxiter):
+            funcs, forces = self._get_funcs_and_forces(coords)
+            tangents = self._get_tangents(coords, funcs)
+
+            # Perpendicular part of the true forces plus the parallel spring forces
+            flat_coords = coords.reshape(n_images, -1)
+            flat_forces = forces[1:-1].reshape(n_images - 2, -1)
+            spring = np.linalg.norm(flat_coords[2:] - flat_coords[1:-1], axis=1) - np.linalg.norm(
+                flat_coords[1:-1] - flat_coords[:-2], axis=1
+            )
+            parallel = np.sum(flat_forces * tangents, axis=1) - spring_const * spring
+            total_forces = flat_forces - parallel[:, None] * tangents
+
+            disp = np.clip(step_size * total_forces, -max_disp, max_disp)
+            coords[1:-1] += disp.reshape(n_images - 2, n_sites, 3)
+
+            if np.sum(np.abs(old_funcs - funcs)) < tol and np.max(np.abs(total_forces)) < gtol:
+                break
+            old_funcs = funcs
+        else:
+            warnings.warn(f"IDPP path optimization did not converge in {maxiter} iterations.", stacklevel=2)
+
+        start = self.structures[0]
+        images = [
+            Structure(
+                self.lattice,
+                start.species_and_occu,
+                image_coords,
+                coords_are_cartesian=True,
+                site_properties=start.site_properties,
+            )
+            for image_coords in coords[1:-1]
+        ]
+        return [start.copy(), *images, self.structures[-1].copy()]
+
+
 def combine_neb_plots(neb_analyses, arranged_neb_analyses=False, reverse_plot=False):
     """
     neb_analyses: a list of NEBAnalysis objects.
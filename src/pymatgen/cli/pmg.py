@@ -16,6 +16,7 @@ from pymatgen.cli.pmg_potcar import generate_potcar
 from pymatgen.cli.pmg_structure import analyze_structures
 from pymatgen.core import SETTINGS
 from pymatgen.core.structure import Structure
+from pymatgen.io.cif import convert_cifs
 from pymatgen.io.vasp import Incar, Potcar
 
 
@@ -75,6 +76,21 @@ def diff_incar(args):
     return 0
 
 
+def bulk_convert_cifs(args):
+    """Handle bulk CIF conversion commands.
+
+    Args:
+        args: Args from command.
+    """
+    summary = convert_cifs(args.paths, args.output, ncores=args.ncores, primitive=args.primitive)
+    print(
+        f"Parsed {summary['n_structures']} structures from {summary['n_files']} CIFs "
+        f"({summary['n_errors']} errors, {summary['n_files_with_warnings']} with warnings) "
+        f"in {summary['time']:.1f} s ({summary['files_per_second']:.1f} CIFs/s)."
+    )
+    return 0
+
+
 def main():
     """Handle main."""
     parser = argparse.ArgumentParser(
@@ -377,6 +393,41 @@ def main():
 
     parser_structure.set_defaults(func=analyze_structures)
 
+    parser_cifs = subparsers.add_parser(
+        "cifs", help="Convert directory trees or tar archives of CIFs to a structure store in parallel."
+    )
+    parser_cifs.add_argument(
+        "paths",
+        metavar="path",
+        type=str,
+        nargs="+",
+        help="Directories (searched recursively), tar archives or CIF files.",
+    )
+    parser_cifs.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        type=str,
+        required=True,
+        help="Output file. JSON lines (e.g. structures.jsonl.gz) or Parquet (e.g. structures.parquet).",
+    )
+    parser_cifs.add_argument(
+        "-n",
+        "--ncores",
+        dest="ncores",
+        type=int,
+        default=None,
+        help="Number of processes. Defaults to all CPUs.",
+    )
+    parser_cifs.add_argument(
+        "-p",
+        "--primitive",
+        dest="primitive",
+        action="store_true",
+        help="Convert structures to primitive cells.",
+    )
+    parser_cifs.set_defaults(func=bulk_convert_cifs)
+
     parser_view = subparsers.add_parser("view", help="Visualize structures")
     parser_view.add_argument("filename", metavar="filename", type=str, nargs=1, help="Filename")
     parser_view.add_argument(
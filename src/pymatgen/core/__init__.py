@@ -4,18 +4,18 @@ from __future__ import annotations
 
 import os
 import warnings
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ruamel.yaml import YAML
-
-from pymatgen.core.composition import Composition
-from pymatgen.core.lattice import Lattice
-from pymatgen.core.operations import SymmOp
-from pymatgen.core.periodic_table import DummySpecie, DummySpecies, Element, Species, get_el_sp
-from pymatgen.core.sites import PeriodicSite, Site
-from pymatgen.core.structure import IMolecule, IStructure, Molecule, PeriodicNeighbor, SiteCollection, Structure
-from pymatgen.core.units import ArrayWithUnit, FloatWithUnit, Unit
+if TYPE_CHECKING:
+    from pymatgen.core.composition import Composition
+    from pymatgen.core.lattice import Lattice
+    from pymatgen.core.operations import SymmOp
+    from pymatgen.core.periodic_table import DummySpecie, DummySpecies, Element, Species, get_el_sp
+    from pymatgen.core.sites import PeriodicSite, Site
+    from pymatgen.core.structure import IMolecule, IStructure, Molecule, PeriodicNeighbor, SiteCollection, Structure
+    from pymatgen.core.units import ArrayWithUnit, FloatWithUnit, Unit
 
 __author__ = "Pymatgen Development Team"
 __email__ = "pymatgen@googlegroups.com"
@@ -42,11 +42,12 @@ def _load_pmg_settings() -> dict[str, Any]:
     settings_file = os.getenv("PMG_CONFIG_FILE") or SETTINGS_FILE
 
     # Load .pmgrc.yaml file
-    yaml = YAML()
     for file_path in (settings_file, OLD_SETTINGS_FILE):
         try:
             with open(file_path, encoding="utf-8") as yml_file:
-                settings = yaml.load(yml_file) or {}
+                from ruamel.yaml import YAML
+
+                settings = YAML().load(yml_file) or {}
             break
         except FileNotFoundError:
             continue
@@ -74,3 +75,33 @@ def _load_pmg_settings() -> dict[str, Any]:
 
 SETTINGS = _load_pmg_settings()
 locals().update(SETTINGS)
+
+
+# Classes are imported from their submodules on first access, so that importing
+# pymatgen.core or any of its submodules does not import all of them
+_LAZY_IMPORTS: dict[str, str] = {
+    "Composition": "composition",
+    "Lattice": "lattice",
+    "SymmOp": "operations",
+    **dict.fromkeys(("DummySpecie", "DummySpecies", "Element", "Species", "get_el_sp"), "periodic_table"),
+    **dict.fromkeys(("PeriodicSite", "Site"), "sites"),
+    **dict.fromkeys(
+        ("IMolecule", "IStructure", "Molecule", "PeriodicNeighbor", "SiteCollection", "Structure"), "structure"
+    ),
+    **dict.fromkeys(("ArrayWithUnit", "FloatWithUnit", "Unit"), "units"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(f"{__name__}.{_LAZY_IMPORTS[name]}"), name)
+    elif name in set(_LAZY_IMPORTS.values()):
+        value = import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -10,7 +10,7 @@ import re
 import string
 import warnings
 from collections import defaultdict
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from itertools import combinations_with_replacement, product
 from math import isnan
 from typing import TYPE_CHECKING, cast
@@ -33,6 +33,10 @@ if TYPE_CHECKING:
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Maximum number of formula strings whose parsed {symbol: amount} mapping is
+# kept in the LRU cache of Composition string parsing. None means unbounded.
+FORMULA_CACHE_SIZE: int | None = int(os.getenv("PMG_FORMULA_CACHE_SIZE", "8192"))
+
 
 @total_ordering
 class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, Stringify):
@@ -142,6 +146,8 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
                 elem_amt[get_el_sp(key)] = val
                 self._n_atoms += abs(val)
         self._data = elem_amt
+        # Memo of derived quantities (reduced formula etc.). Safe since Composition is immutable.
+        self._cache: dict[Any, Any] = {}
         if strict and not self.valid:
             raise ValueError(f"Composition is not valid, contains: {', '.join(map(str, self.elements))}")
 
@@ -377,8 +383,10 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             A normalized composition and a multiplicative factor, i.e.,
             Li4Fe4P4O16 returns (Composition("LiFePO4"), 4).
         """
-        factor = self.get_reduced_formula_and_factor()[1]
-        return self / factor, factor
+        if "reduced_composition_and_factor" not in self._cache:
+            factor = self.get_reduced_formula_and_factor()[1]
+            self._cache["reduced_composition_and_factor"] = self / factor, factor
+        return self._cache["reduced_composition_and_factor"]
 
     def get_reduced_formula_and_factor(self, iupac_ordering: bool = False) -> tuple[str, float]:
         """Calculate a reduced formula and factor.
@@ -397,16 +405,22 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             A pretty normalized formula and a multiplicative factor, i.e.,
             Li4Fe4P4O16 returns (LiFePO4, 4).
         """
+        cache_key = ("reduced_formula_and_factor", iupac_ordering)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
         all_int = all(abs(val - round(val)) < type(self).amount_tolerance for val in self.values())
         if not all_int:
-            return self.formula.replace(" ", ""), 1
-        el_amt_dict = {key: int(round(val)) for key, val in self.get_el_amt_dict().items()}
-        formula, factor = reduce_formula(el_amt_dict, iupac_ordering=iupac_ordering)
+            formula, factor = self.formula.replace(" ", ""), 1
+        else:
+            el_amt_dict = {key: int(round(val)) for key, val in self.get_el_amt_dict().items()}
+            formula, factor = reduce_formula(el_amt_dict, iupac_ordering=iupac_ordering)
 
-        if formula in type(self).special_formulas:
-            formula = type(self).special_formulas[formula]
-            factor /= 2
+            if formula in type(self).special_formulas:
+                formula = type(self).special_formulas[formula]
+                factor /= 2
 
+        self._cache[cache_key] = formula, factor
         return formula, factor
 
     def get_integer_formula_and_factor(
@@ -457,6 +471,9 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         contains no carbon, all the elements, including hydrogen, are listed
         alphabetically.
         """
+        if "hill_formula" in self._cache:
+            return self._cache["hill_formula"]
+
         elem_comp = self.element_composition
         elements = sorted(el.symbol for el in elem_comp)
         hill_elements = []
@@ -469,7 +486,8 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         hill_elements += elements
 
         formula = [f"{el}{formula_double_format(elem_comp[el]) if elem_comp[el] != 1 else ''}" for el in hill_elements]
-        return " ".join(formula)
+        self._cache["hill_formula"] = " ".join(formula)
+        return self._cache["hill_formula"]
 
     @property
     def elements(self) -> list[Element | Species | DummySpecies]:
@@ -488,7 +506,9 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         sorted alphabetically and joined by dashes, by convention for use
         in database keys.
         """
-        return "-".join(sorted(self.chemical_system_set))
+        if "chemical_system" not in self._cache:
+            self._cache["chemical_system"] = "-".join(sorted(self.chemical_system_set))
+        return self._cache["chemical_system"]
 
     @property
     def num_atoms(self) -> float:
@@ -555,46 +575,15 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
                 Defaults to True.
 
         Returns:
-            Composition with that formula.
+            dict[str, float]: {symbol: amount} for that formula.
 
         Notes:
             In the case of Metallofullerene formula (e.g. Y3N@C80),
             the @ mark will be dropped and passed to parser.
+            Parsed formulas are memoized in a bounded LRU cache, see
+            set_formula_cache_size.
         """
-        # Raise error if formula contains special characters or only spaces and/or numbers
-        if strict and re.match(r"[\s\d.*/]*$", formula):
-            raise ValueError(f"Invalid {formula=}")
-
-        # For Metallofullerene like "Y3N@C80"
-        formula = formula.replace("@", "")
-        # Square brackets are used in formulas to denote coordination complexes (gh-3583)
-        formula = formula.replace("[", "(")
-        formula = formula.replace("]", ")")
-
-        def get_sym_dict(form: str, factor: float) -> dict[str, float]:
-            sym_dict: dict[str, float] = defaultdict(float)
-            for match in re.finditer(r"([A-Z][a-z]*)\s*([-*\.e\d]*)", form):
-                el = match[1]
-                amt = 1.0
-                if match[2].strip() != "":
-                    amt = float(match[2])
-                sym_dict[el] += amt * factor
-                form = form.replace(match.group(), "", 1)
-            if form.strip():
-                raise ValueError(f"{form} is an invalid formula!")
-            return sym_dict
-
-        match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
-        while match:
-            factor = 1.0
-            if match[2] != "":
-                factor = float(match[2])
-            unit_sym_dict = get_sym_dict(match[1], factor)
-            expanded_sym = "".join(f"{el}{amt}" for el, amt in unit_sym_dict.items())
-            expanded_formula = formula.replace(match.group(), expanded_sym, 1)
-            formula = expanded_formula
-            match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
-        return get_sym_dict(formula, 1)
+        return dict(_parse_formula_cached(formula, strict))
 
     @property
     def anonymized_formula(self) -> str:
@@ -1220,6 +1209,61 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
                         yield match
 
 
+def _parse_formula(formula: str, strict: bool = True) -> tuple[tuple[str, float], ...]:
+    """Parse a formula string into (symbol, amount) pairs. Uncached, see
+    Composition._parse_formula.
+    """
+    # Raise error if formula contains special characters or only spaces and/or numbers
+    if strict and re.match(r"[\s\d.*/]*$", formula):
+        raise ValueError(f"Invalid {formula=}")
+
+    # For Metallofullerene like "Y3N@C80"
+    formula = formula.replace("@", "")
+    # Square brackets are used in formulas to denote coordination complexes (gh-3583)
+    formula = formula.replace("[", "(")
+    formula = formula.replace("]", ")")
+
+    def get_sym_dict(form: str, factor: float) -> dict[str, float]:
+        sym_dict: dict[str, float] = defaultdict(float)
+        for match in re.finditer(r"([A-Z][a-z]*)\s*([-*\.e\d]*)", form):
+            el = match[1]
+            amt = 1.0
+            if match[2].strip() != "":
+                amt = float(match[2])
+            sym_dict[el] += amt * factor
+            form = form.replace(match.group(), "", 1)
+        if form.strip():
+            raise ValueError(f"{form} is an invalid formula!")
+        return sym_dict
+
+    match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
+    while match:
+        factor = 1.0
+        if match[2] != "":
+            factor = float(match[2])
+        unit_sym_dict = get_sym_dict(match[1], factor)
+        expanded_sym = "".join(f"{el}{amt}" for el, amt in unit_sym_dict.items())
+        expanded_formula = formula.replace(match.group(), expanded_sym, 1)
+        formula = expanded_formula
+        match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
+    return tuple(get_sym_dict(formula, 1).items())
+
+
+_parse_formula_cached = lru_cache(maxsize=FORMULA_CACHE_SIZE)(_parse_formula)
+
+
+def set_formula_cache_size(maxsize: int | None) -> None:
+    """Set the maximum number of formula strings kept in the LRU cache used when
+    constructing a Composition from a string. Clears the current cache.
+
+    Args:
+        maxsize (int | None): Max number of cached formulas. 0 disables caching
+            and None makes the cache unbounded.
+    """
+    global _parse_formula_cached  # noqa: PLW0603
+    _parse_formula_cached = lru_cache(maxsize=maxsize)(_parse_formula)
+
+
 def reduce_formula(
     sym_amt: dict[str, float] | dict[str, int],
     iupac_ordering: bool = False,
@@ -145,17 +145,9 @@ class ElementBase(Enum):
             # entries for the named element.
             data = {**_pt_data[self.symbol], **data}
 
-        at_r = data.get("Atomic radius", "no data")
-        if str(at_r).startswith("no data"):
-            self._atomic_radius = None
-        else:
-            self._atomic_radius = Length(at_r, "ang")
-        self._atomic_mass = Mass(data["Atomic mass"], "amu")
-
-        self._atomic_mass_number = None
+        # Quantities with units are only created on first access, see atomic_radius,
+        # atomic_mass and atomic_mass_number, as this is slow for all elements at import
         self.A = data.get("Atomic mass no")
-        if self.A:
-            self._atomic_mass_number = Mass(self.A, "amu")
 
         self.long_name = data["Name"]
         self._data = data
@@ -293,30 +285,33 @@ class ElementBase(Enum):
         )
         return float("NaN")
 
-    @property
+    @functools.cached_property
     def atomic_radius(self) -> FloatWithUnit | None:
         """
         Returns:
             float | None: The atomic radius of the element in Ångstroms. Can be None for
             some elements like noble gases.
         """
-        return self._atomic_radius
+        at_r = self._data.get("Atomic radius", "no data")
+        if str(at_r).startswith("no data"):
+            return None
+        return Length(at_r, "ang")
 
-    @property
+    @functools.cached_property
     def atomic_mass(self) -> FloatWithUnit:
         """
         Returns:
             float: The atomic mass of the element in amu.
         """
-        return self._atomic_mass
+        return Mass(self._data["Atomic mass"], "amu")
 
-    @property
+    @functools.cached_property
     def atomic_mass_number(self) -> FloatWithUnit | None:
         """
         Returns:
             float: The atomic mass of the element in amu.
         """
-        return self._atomic_mass_number
+        return Mass(self.A, "amu") if self.A else None
 
     @property
     def atomic_orbitals_eV(self) -> dict[str, float]:
@@ -1658,6 +1653,46 @@ def get_el_sp(obj: int | SpeciesLike) -> Element | Species | DummySpecies:
         raise ValueError(f"Can't parse Element or Species from {obj!r}") from exc
 
 
+@functools.lru_cache
+def property_table(name: str) -> np.ndarray:
+    """Get a numerical property of all elements as an array indexed by atomic number,
+    e.g. property_table("X")[26] is the electronegativity of Fe. The table is computed
+    once per property, so it is much faster than getattr(Element, name) in loops over
+    many species.
+
+    Args:
+        name (str): Name of a numerical Element property, e.g. "X", "atomic_mass",
+            "atomic_radius" or "average_ionic_radius". Quantities with units are
+            given in the units of the property, e.g. amu or Å.
+
+    Raises:
+        AttributeError: If Element has no property name.
+        ValueError: If the property is not numerical, e.g. "ionic_radii".
+
+    Returns:
+        np.ndarray: Read-only float array of length max(Z) + 1. Index 0 and elements
+            without data for the property are NaN.
+    """
+    elements = [el for el in Element if not el._is_named_isotope]
+    table = np.full(max(el.Z for el in elements) + 1, np.nan)
+    n_invalid = 0
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for el in elements:
+            val = getattr(el, name)
+            if val is None:
+                continue
+            try:
+                table[el.Z] = float(val)
+            except (TypeError, ValueError):
+                # Unparsable data is treated as missing
+                n_invalid += 1
+    if n_invalid and np.isnan(table).all():
+        raise ValueError(f"{name} is not a numerical Element property")
+    table.flags.writeable = False
+    return table
+
+
 @unique
 class ElementType(Enum):
     """Enum for element types."""
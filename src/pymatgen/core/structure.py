@@ -31,16 +31,17 @@ from monty.json import MSONable
 from numpy import cross, eye
 from numpy.linalg import norm
 from ruamel.yaml import YAML
-from scipy.cluster.hierarchy import fcluster, linkage
 from scipy.linalg import expm, polar
-from scipy.spatial.distance import squareform
+from scipy.sparse import csr_array
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import KDTree
 from tabulate import tabulate
 
-from pymatgen.core.bonds import CovalentBond, get_bond_length
+from pymatgen.core.bonds import CovalentBond, bond_lengths, get_bond_length
 from pymatgen.core.composition import Composition
 from pymatgen.core.lattice import Lattice, get_points_in_spheres
 from pymatgen.core.operations import SymmOp
-from pymatgen.core.periodic_table import DummySpecies, Element, Species, get_el_sp
+from pymatgen.core.periodic_table import DummySpecies, Element, Species, get_el_sp, property_table
 from pymatgen.core.sites import PeriodicSite, Site
 from pymatgen.core.units import Length, Mass
 from pymatgen.electronic_structure.core import Magmom
@@ -60,6 +61,7 @@ if TYPE_CHECKING:
     from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
+    from pymatgen.core.trajectory import Trajectory as PmgTrajectory
     from pymatgen.util.typing import CompositionLike, MillerIndex, PathLike, PbcLike, SpeciesLike
 
 FileFormats = Literal["cif", "poscar", "cssr", "json", "yaml", "yml", "xsf", "mcsqs", "res", "pwmat", ""]
@@ -196,6 +198,208 @@ class PeriodicNeighbor(PeriodicSite):
         return super(Site, cls).from_dict(dct)
 
 
+def _get_site_species(species: CompositionLike) -> Composition:
+    """Convert a species-like object to the Composition of a site, with the same
+    conversion rules and checks as PeriodicSite.
+    """
+    if not isinstance(species, Composition):
+        try:
+            species = Composition({get_el_sp(species): 1})  # type: ignore[arg-type]
+        except TypeError:
+            species = Composition(species)
+    if species.num_atoms > 1 + Composition.amount_tolerance:
+        raise ValueError("Species occupancies sum to more than 1!")
+    return species
+
+
+@functools.cache
+def _get_element_composition(atomic_number: int) -> Composition:
+    """Site Composition of an element, shared by all callers (Composition is immutable)."""
+    return Composition({get_el_sp(atomic_number): 1})
+
+
+def _filter_translations(
+    translations: NDArray[np.float64],
+    frac_coords: NDArray[np.float64],
+    ftol: NDArray[np.float64],
+    chunk_size: int = 1_000_000,
+) -> NDArray[np.float64]:
+    """Get the fractional translations that map every site in frac_coords onto
+    some site in frac_coords, to within ftol along each lattice vector.
+
+    All candidates are checked against all sites at once with a periodic
+    KD-tree, so the cost is O(len(translations) * n_sites * log(n_sites))
+    instead of looping over the sites.
+
+    Args:
+        translations (np.ndarray): Candidate translations, shape (m, 3).
+        frac_coords (np.ndarray): Fractional coordinates of the sites, shape (n, 3).
+        ftol (np.ndarray): Fractional tolerance along each lattice vector.
+        chunk_size (int): Maximum number of translated sites queried at once.
+
+    Returns:
+        np.ndarray: The translations that map the sites onto themselves.
+    """
+    # In units of the tolerance, matching sites are within a Chebyshev distance of 1
+    box_size = 1 / np.asarray(ftol, dtype=float)
+
+    def wrap(coords):
+        coords = (coords % 1) * box_size
+        return np.where(coords < box_size, coords, 0)
+
+    tree = KDTree(wrap(frac_coords), boxsize=box_size)
+    is_valid = np.zeros(len(translations), dtype=bool)
+    step = max(1, chunk_size // max(1, len(frac_coords)))
+    for start in range(0, len(translations), step):
+        points = wrap(frac_coords[None, :, :] + translations[start : start + step, None, :])
+        dists, _ = tree.query(points.reshape(-1, 3), p=np.inf, distance_upper_bound=1)
+        is_valid[start : start + step] = np.all(np.isfinite(dists).reshape(len(points), -1), axis=1)
+    return translations[is_valid]
+
+
+class _SiteStore(collections.abc.Sequence):
+    """Columnar storage for the sites of an IStructure/Structure.
+
+    Species, fractional coordinates, labels and site properties are held in
+    contiguous arrays/lists and a PeriodicSite is only created when it is
+    accessed by index or iteration. A created site is kept and from then on is
+    the reference for that index, so that in-place changes to the site (e.g.
+    site.frac_coords = ...) are seen by the structure. Per-site quantities
+    are assembled from the arrays with the created sites patched in.
+    """
+
+    __slots__ = ("_n_made", "_sites", "frac_coords", "labels", "lattice", "properties", "seq_type", "species")
+
+    def __init__(
+        self,
+        lattice: Lattice,
+        species: list[Composition],
+        frac_coords: np.ndarray,
+        labels: list[str | None],
+        properties: dict[str, list],
+        *,
+        seq_type: type[list | tuple] = list,
+    ) -> None:
+        """
+        Args:
+            lattice (Lattice): Lattice shared by all sites.
+            species (list[Composition]): Species on each site.
+            frac_coords (np.ndarray): Nx3 fractional coordinates.
+            labels (list[str | None]): Label of each site.
+            properties (dict[str, list]): Site properties as {name: values}.
+            seq_type (list | tuple): Sequence type used for slices and once
+                all sites are created.
+        """
+        self.lattice = lattice
+        self.species = species
+        self.frac_coords = frac_coords
+        self.labels = labels
+        self.properties = properties
+        self.seq_type = seq_type
+        self._sites: list[PeriodicSite | None] = [None] * len(species)
+        self._n_made = 0
+
+    def __len__(self) -> int:
+        return len(self._sites)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self.seq_type(map(self._get_site, range(len(self))[idx]))
+        return self._get_site(idx)
+
+    def __iter__(self) -> Iterator[PeriodicSite]:
+        for idx in range(len(self)):
+            yield self._get_site(idx)
+
+    def __setitem__(self, idx: int, site: PeriodicSite) -> None:
+        if self._sites[idx] is None:
+            self._n_made += 1
+        self._sites[idx] = site
+
+    def __delitem__(self, idx: SupportsIndex | slice) -> None:
+        indices = np.arange(len(self))[idx]
+        self.frac_coords = np.delete(self.frac_coords, indices, axis=0)
+        for values in (self.species, self.labels, self._sites, *self.properties.values()):
+            del values[idx]
+        self._n_made = len(self) - self._sites.count(None)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} sites, {self._n_made} created)"
+
+    def _get_site(self, idx: int) -> PeriodicSite:
+        site = self._sites[idx]
+        if site is None:
+            site = PeriodicSite(
+                self.species[idx],
+                self.frac_coords[idx].copy(),
+                self.lattice,
+                properties={key: values[idx] for key, values in self.properties.items()},
+                label=self.labels[idx],
+                skip_checks=True,
+            )
+            self._sites[idx] = site
+            self._n_made += 1
+        return site
+
+    def _created_sites(self) -> Iterator[tuple[int, PeriodicSite]]:
+        """Indices and sites of all sites created so far."""
+        if self._n_made:
+            yield from ((idx, site) for idx, site in enumerate(self._sites) if site is not None)
+
+    def set_lattice(self, lattice: Lattice) -> None:
+        """Set the lattice of all sites, keeping their fractional coordinates."""
+        self.lattice = lattice
+        for _idx, site in self._created_sites():
+            site.lattice = lattice
+
+    def get_frac_coords(self) -> np.ndarray:
+        """Nx3 array of fractional coordinates."""
+        frac_coords = self.frac_coords.copy()
+        for idx, site in self._created_sites():
+            frac_coords[idx] = site.frac_coords
+        return frac_coords
+
+    def get_cart_coords(self) -> np.ndarray:
+        """Nx3 array of Cartesian coordinates."""
+        cart_coords = self.lattice.get_cartesian_coords(self.frac_coords).reshape(-1, 3)
+        for idx, site in self._created_sites():
+            cart_coords[idx] = site.coords
+        return cart_coords
+
+    def get_species(self) -> list[Composition]:
+        """Species on each site."""
+        species = self.species.copy()
+        for idx, site in self._created_sites():
+            species[idx] = site.species
+        return species
+
+    def get_labels(self) -> list[str]:
+        """Label of each site, defaulting to the species string as in Site.label."""
+        species_strings: dict[int, str] = {}
+        labels = []
+        for comp, label in zip(self.species, self.labels, strict=True):
+            if label is None:
+                if id(comp) not in species_strings:
+                    species_strings[id(comp)] = Site(comp, (0, 0, 0), skip_checks=True).species_string
+                label = species_strings[id(comp)]
+            labels.append(label)
+        for idx, site in self._created_sites():
+            labels[idx] = site.label
+        return labels
+
+    def get_site_properties(self) -> dict[str, list]:
+        """Site properties as {name: values}, with None for sites lacking a property."""
+        if not self._sites:
+            return {}
+        props = {key: list(values) for key, values in self.properties.items()}
+        for idx, site in self._created_sites():
+            for key in set(props) - set(site.properties):
+                props[key][idx] = None
+            for key, val in site.properties.items():
+                props.setdefault(key, [None] * len(self))[idx] = val
+        return props
+
+
 class SiteCollection(collections.abc.Sequence, ABC):
     """Basic SiteCollection. Essentially a sequence of Sites or PeriodicSites.
     This serves as a base class for Molecule (a collection of Site, i.e., no
@@ -206,19 +410,21 @@ class SiteCollection(collections.abc.Sequence, ABC):
     # Tolerance in Angstrom for determining if sites are too close
     DISTANCE_TOLERANCE = 0.5
     _properties: dict
+    # Opt-in cache of data derived from the lattice and coordinates, see enable_cache
+    _cache: dict[tuple, Any] | None = None
 
     def __contains__(self, site: object) -> bool:
-        return site in self.sites
+        return site in self._sites
 
     def __iter__(self) -> Iterator[PeriodicSite]:
-        return iter(self.sites)
+        return iter(self._sites)
 
     # TODO return type needs fixing (can be Sequence[PeriodicSite] but raises lots of mypy errors)
     def __getitem__(self, ind: int | slice) -> PeriodicSite:
-        return self.sites[ind]  # type: ignore[return-value]
+        return self._sites[ind]  # type: ignore[return-value]
 
     def __len__(self) -> int:
-        return len(self.sites)
+        return len(self._sites)
 
     def __hash__(self) -> int:
         """Use the composition hash for now."""
@@ -227,14 +433,57 @@ class SiteCollection(collections.abc.Sequence, ABC):
     @property
     def sites(self) -> list[PeriodicSite] | tuple[PeriodicSite, ...]:
         """The sites in the Structure."""
+        if isinstance(self._sites, _SiteStore):
+            # Create all sites and switch to a plain list/tuple of sites
+            self._sites = self._sites.seq_type(self._sites)
         return self._sites
 
     @sites.setter
     def sites(self, sites: Sequence[PeriodicSite]) -> None:
         """Set the sites in the Structure."""
         # If self is mutable Structure or Molecule, set _sites as list
-        is_mutable = isinstance(self._sites, MutableSequence)
+        is_mutable = isinstance(self, MutableSequence)
         self._sites: list[PeriodicSite] | tuple[PeriodicSite, ...] = list(sites) if is_mutable else tuple(sites)
+        self.clear_cache()
+
+    def enable_cache(self, enable: bool = True) -> Self:
+        """Cache the distance matrix and neighbor lists so that repeated queries
+        on an unchanged structure/molecule are (nearly) free. Useful when several
+        analyses call distance_matrix or get_all_neighbors on the same object.
+
+        The cache is cleared by all Structure and Molecule methods that change the
+        lattice, the sites or their species and properties, e.g. __setitem__,
+        translate_sites, apply_strain, perturb or add_oxidation_state_by_element.
+        Changes made directly to site objects, e.g. structure[0].coords = [0, 0, 0],
+        are not tracked, so call clear_cache() after such modifications. Cached
+        Neighbor objects are shared between calls and should not be modified.
+
+        Args:
+            enable (bool): Whether to enable or disable the cache. Defaults to True.
+
+        Returns:
+            SiteCollection: self with the cache enabled or disabled.
+        """
+        self._cache = {} if enable else None
+        return self
+
+    def clear_cache(self) -> None:
+        """Clear the cached distance matrix and neighbor lists, see enable_cache."""
+        if self._cache:
+            self._cache.clear()
+
+    def _get_cached(self, key: tuple, func: Callable[[], Any]) -> Any:
+        """Get the array, tuple of arrays or list of neighbor lists returned by
+        func, from the cache if it is enabled.
+        """
+        if self._cache is None:
+            return func()
+        if (value := self._cache.get(key)) is None:
+            value = self._cache[key] = func()
+        # Return copies so callers can modify them in place
+        if isinstance(value, list):
+            return [list(item) for item in value]
+        return tuple(arr.copy() for arr in value) if isinstance(value, tuple) else value.copy()
 
     @abstractmethod
     def copy(self) -> Self:
@@ -262,7 +511,59 @@ class SiteCollection(collections.abc.Sequence, ABC):
         periodic structures, this is overwritten to return the nearest image
         distance.
         """
-        return all_distances(self.cart_coords, self.cart_coords)
+        return self._get_cached(("distance_matrix",), lambda: all_distances(self.cart_coords, self.cart_coords))
+
+    def get_distance_matrix(self, cutoff: float | None = None, chunk_size: int | None = None) -> np.ndarray | csr_array:
+        """Distance matrix between all sites with bounded memory use. For
+        periodic structures, the nearest image distance is used.
+
+        Args:
+            cutoff (float): If given, return a sparse matrix that only stores the
+                distances between different sites that are at most cutoff apart,
+                found with a neighbor search. Pairs of coincident sites are
+                stored explicitly even though their distance is (close to) zero.
+                Memory scales with the number of such pairs rather than N^2,
+                which makes this suitable for large supercells.
+            chunk_size (int): Number of rows of the dense matrix to compute at
+                once, which bounds the size of temporary arrays to chunk_size x N
+                (x 3). Ignored if cutoff is given. Defaults to None, which computes
+                all rows at once like distance_matrix.
+
+        Returns:
+            np.ndarray | scipy.sparse.csr_array: N x N distance matrix.
+        """
+        n_sites = len(self)
+        if cutoff is not None:
+            rows, cols, dists = self._get_close_pairs(cutoff)
+            # Keep the shortest distance for site pairs found for several periodic images
+            order = np.lexsort((dists, cols, rows))
+            rows, cols, dists = rows[order], cols[order], dists[order]
+            first = np.ones(len(rows), dtype=bool)
+            first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            return csr_array((dists[first], (rows[first], cols[first])), shape=(n_sites, n_sites))
+
+        if chunk_size is None:
+            return self.distance_matrix
+        dist_mat = np.empty((n_sites, n_sites))
+        for start in range(0, n_sites, chunk_size):
+            dist_mat[start : start + chunk_size] = self._get_distance_rows(start, start + chunk_size)
+        return dist_mat
+
+    def _get_distance_rows(self, start: int, stop: int) -> np.ndarray:
+        """Rows start to stop of the distance matrix."""
+        cart_coords = self.cart_coords
+        return all_distances(cart_coords[start:stop], cart_coords)
+
+    def _get_close_pairs(self, cutoff: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Indices and distances of all (ordered) pairs of different sites within cutoff."""
+        cart_coords = self.cart_coords
+        pairs = KDTree(cart_coords).query_pairs(cutoff, output_type="ndarray")
+        dists = np.linalg.norm(cart_coords[pairs[:, 0]] - cart_coords[pairs[:, 1]], axis=1)
+        return (
+            np.concatenate([pairs[:, 0], pairs[:, 1]]),
+            np.concatenate([pairs[:, 1], pairs[:, 0]]),
+            np.concatenate([dists, dists]),
+        )
 
     @property
     def species(self) -> list[Element | Species]:
@@ -276,11 +577,13 @@ class SiteCollection(collections.abc.Sequence, ABC):
         """
         if not self.is_ordered:
             raise AttributeError("species property only supports ordered structures!")
-        return [site.specie for site in self]
+        return [next(iter(species)) for species in self.species_and_occu]
 
     @property
     def species_and_occu(self) -> list[Composition]:
         """List of species and occupancies at each site of the structure."""
+        if isinstance(self._sites, _SiteStore):
+            return self._sites.get_species()
         return [site.species for site in self]
 
     @property
@@ -298,8 +601,8 @@ class SiteCollection(collections.abc.Sequence, ABC):
     def types_of_species(self) -> tuple[Element | Species | DummySpecies, ...]:
         """Tuple of types of species."""
         types: list[Element | Species | DummySpecies] = []
-        for site in self:
-            for sp, amt in site.species.items():
+        for species in self.species_and_occu:
+            for sp, amt in species.items():
                 if amt != 0:
                     types.append(sp)
 
@@ -335,15 +638,73 @@ class SiteCollection(collections.abc.Sequence, ABC):
     def atomic_numbers(self) -> tuple[int, ...]:
         """Tuple of atomic numbers."""
         try:
-            return tuple(site.specie.Z for site in self)
+            return tuple(specie.Z for specie in self.species)
         except AttributeError:
             raise AttributeError("atomic_numbers available only for ordered Structures")
 
+    def get_species_property_array(self, name: str, default: float = np.nan) -> np.ndarray:
+        """Get a numerical property of the species on all sites as an array, e.g. the
+        electronegativities of all sites with get_species_property_array("X").
+
+        The property is looked up once per distinct species, using property_table for
+        elements. For disordered sites, the average over the species on the site
+        weighted by their occupancies is returned, which is only available if all of
+        these species have the property.
+
+        Args:
+            name (str): Name of a numerical Element or Species property, e.g. "X",
+                "atomic_mass", "atomic_radius" or "ionic_radius". Quantities with units
+                are given in the units of the property, e.g. amu or Å.
+            default (float): Value for sites where the property is not available for
+                at least one of the species on the site, e.g. DummySpecies or elements
+                without data. Defaults to NaN.
+
+        Raises:
+            AttributeError: If Element or Species has no property name.
+
+        Returns:
+            np.ndarray: Property of each site.
+        """
+        species_values: dict[Element | Species | DummySpecies, float] = {}
+
+        def get_value(sp: Element | Species | DummySpecies) -> float:
+            if sp not in species_values:
+                if isinstance(sp, Element) and not sp._is_named_isotope:
+                    val = property_table(name)[sp.Z]
+                elif isinstance(sp, DummySpecies):
+                    val = getattr(sp, name, None)
+                else:
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore")
+                        val = getattr(sp, name)
+                try:
+                    species_values[sp] = float(val)  # type: ignore[arg-type]
+                except (TypeError, ValueError):
+                    species_values[sp] = np.nan
+            return species_values[sp]
+
+        # Sites usually share Composition objects, so evaluate each distinct one once
+        compositions = self.species_and_occu
+        _, first, inverse = np.unique(
+            np.fromiter(map(id, compositions), dtype=np.int64, count=len(self)), return_index=True, return_inverse=True
+        )
+        comp_values = np.array(
+            [
+                sum(amt * get_value(sp) for sp, amt in compositions[idx].items()) / compositions[idx].num_atoms
+                for idx in first
+            ]
+        )
+        values = comp_values[inverse.ravel()]
+        values[np.isnan(values)] = default
+        return values
+
     @property
     def site_properties(self) -> dict[str, Sequence]:
         """The site properties as a dict of sequences.
         E.g. {"magmom": (5, -5), "charge": (-4, 4)}.
         """
+        if isinstance(self._sites, _SiteStore):
+            return self._sites.get_site_properties()
         prop_keys: set[str] = set()
         for site in self:
             prop_keys.update(site.properties)
@@ -353,6 +714,8 @@ class SiteCollection(collections.abc.Sequence, ABC):
     @property
     def labels(self) -> list[str | None]:
         """Site labels as a list."""
+        if isinstance(self._sites, _SiteStore):
+            return self._sites.get_labels()
         return [site.label for site in self]
 
     def relabel_sites(self, ignore_uniq: bool = False) -> Self:
@@ -379,6 +742,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
             for idx, site in enumerate(sites):
                 site.label = f"{label}_{idx + 1}"
 
+        self.clear_cache()
         return self
 
     @property
@@ -389,6 +753,8 @@ class SiteCollection(collections.abc.Sequence, ABC):
     @property
     def cart_coords(self) -> np.ndarray:
         """An np.array of the Cartesian coordinates of sites in the structure."""
+        if isinstance(self._sites, _SiteStore):
+            return self._sites.get_cart_coords()
         return np.array([site.coords for site in self])
 
     @property
@@ -414,9 +780,13 @@ class SiteCollection(collections.abc.Sequence, ABC):
     @property
     def composition(self) -> Composition:
         """The structure's corresponding Composition object."""
+        # Sites often share the same Composition object, so only get its items once
+        site_species = self.species_and_occu
+        unique_species = {id(species): species for species in site_species}
+        species_items = {key: list(species.items()) for key, species in unique_species.items()}
         elem_map: dict[Species, float] = defaultdict(float)
-        for site in self:
-            for species, occu in site.species.items():
+        for key in map(id, site_species):
+            for species, occu in species_items[key]:
                 elem_map[species] += occu
         return Composition(elem_map)
 
@@ -438,8 +808,8 @@ class SiteCollection(collections.abc.Sequence, ABC):
         Elements are found, a charge of 0 is assumed.
         """
         charge = 0
-        for site in self:
-            for specie, amt in site.species.items():
+        for species in self.species_and_occu:
+            for specie, amt in species.items():
                 charge += (getattr(specie, "oxi_state", 0) or 0) * amt
 
         return charge
@@ -449,7 +819,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
         """Check if structure is ordered, meaning no partial occupancies in any
         of the sites.
         """
-        return all(site.is_ordered for site in self)
+        return all(species.num_atoms == len(species) == 1 for species in self.species_and_occu)
 
     def get_angle(self, i: int, j: int, k: int) -> float:
         """Get angle specified by three sites.
@@ -497,10 +867,9 @@ class SiteCollection(collections.abc.Sequence, ABC):
         Returns:
             bool: True if SiteCollection does not contain atoms that are too close together.
         """
-        if len(self) == 1:
-            return True
-        all_dists = self.distance_matrix[np.triu_indices(len(self), 1)]
-        return np.min(all_dists) > tol
+        # Only pairs within tol are needed: cell-list/KD-tree search, no dense distance matrix
+        _rows, _cols, dists = self._get_close_pairs(tol)
+        return bool(np.all(dists > tol))
 
     @abstractmethod
     def to(self, filename: str = "", fmt: FileFormats = "") -> str | None:
@@ -513,6 +882,35 @@ class SiteCollection(collections.abc.Sequence, ABC):
         """A more intuitive alias for .to()."""
         return self.to(filename, fmt)
 
+    def to_bytes(self, compress: bool = False) -> bytes:
+        """Compact binary (npz) representation with columnar coordinates and site
+        properties. Much faster to write and read than the JSON of as_dict(). Use
+        pymatgen.io.npz.dump_many to serialize many structures/molecules at once.
+
+        Args:
+            compress (bool): Whether to zip-compress the data. Defaults to False.
+
+        Returns:
+            bytes: Serialized SiteCollection.
+        """
+        from pymatgen.io.npz import to_bytes
+
+        return to_bytes(self, compress=compress)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Reconstitute a Structure or Molecule from the output of to_bytes().
+
+        Args:
+            data (bytes): Serialized SiteCollection.
+
+        Returns:
+            Structure or Molecule of type cls.
+        """
+        from pymatgen.io.npz import from_bytes
+
+        return from_bytes(data, cls=cls)
+
     @classmethod
     @abstractmethod
     def from_str(cls, input_string: str, fmt: Any) -> None:
@@ -550,6 +948,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
         for site, val in zip(self, values, strict=True):
             site.properties[property_name] = val
 
+        self.clear_cache()
         return self
 
     def remove_site_property(self, property_name: str) -> Self:
@@ -564,6 +963,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
         for site in self:
             del site.properties[property_name]
 
+        self.clear_cache()
         return self
 
     def replace_species(
@@ -608,6 +1008,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
                 site.species = comp
                 site.label = None  # type: ignore[assignment]
 
+        site_coll.clear_cache()
         return site_coll
 
     def add_oxidation_state_by_element(self, oxidation_states: dict[str, float]) -> Self:
@@ -631,6 +1032,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
                 new_sp[Species(el.symbol, oxidation_states[el.symbol])] = occu
             site.species = Composition(new_sp)
 
+        self.clear_cache()
         return self
 
     def add_oxidation_state_by_site(self, oxidation_states: list[float]) -> Self:
@@ -658,6 +1060,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
                 new_sp[Species(sym, ox)] = occu
             site.species = Composition(new_sp)
 
+        self.clear_cache()
         return self
 
     def remove_oxidation_states(self) -> Self:
@@ -669,6 +1072,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
                 new_sp[Element(sym)] += occu
             site.species = Composition(new_sp)
 
+        self.clear_cache()
         return self
 
     def add_oxidation_state_by_guess(self, **kwargs) -> Self:
@@ -701,6 +1105,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
                 new_species[species] = occu
             site.species = Composition(new_species)
 
+        self.clear_cache()
         return self
 
     def add_spin_by_site(self, spins: Sequence[float]) -> Self:
@@ -720,6 +1125,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
                 new_species[Species(sym, oxidation_state=oxi_state, spin=spin)] = occu
             site.species = Composition(new_species)
 
+        self.clear_cache()
         return self
 
     def remove_spin(self) -> Self:
@@ -731,6 +1137,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
                 new_sp[Species(sp.symbol, oxidation_state=oxi_state)] += occu
             site.species = Composition(new_sp)
 
+        self.clear_cache()
         return self
 
     def extract_cluster(self, target_sites: list[Site], **kwargs) -> list[Site]:
@@ -1038,25 +1445,35 @@ class IStructure(SiteCollection, MSONable):
 
         self._lattice = lattice if isinstance(lattice, Lattice) else Lattice(lattice)
 
-        sites = []
-        for idx, specie in enumerate(species):
-            prop = None
-            if site_properties:
-                prop = {key: val[idx] for key, val in site_properties.items() if val is not None}
-
-            label = labels[idx] if labels else None
-
-            site = PeriodicSite(
-                specie,
-                coords[idx],
-                self._lattice,
-                to_unit_cell,
-                coords_are_cartesian=coords_are_cartesian,
-                properties=prop,
-                label=label,
-            )
-            sites.append(site)
-        self._sites: tuple[PeriodicSite, ...] = tuple(sites)
+        n_sites = len(species)
+        frac_coords = np.array(coords, dtype=float).reshape(n_sites, 3)
+        if coords_are_cartesian:
+            frac_coords = self._lattice.get_fractional_coords(frac_coords).reshape(n_sites, 3)
+        if to_unit_cell:
+            frac_coords = np.where(self._lattice.pbc, np.mod(frac_coords, 1), frac_coords)
+
+        # Convert each distinct species input only once
+        species_cache: dict[Any, Composition] = {}
+        site_species = []
+        for specie in species:
+            key = id(specie) if isinstance(specie, Composition | dict) else specie
+            if key not in species_cache:
+                species_cache[key] = _get_site_species(specie)
+            site_species.append(species_cache[key])
+
+        site_props = {}
+        for key, val in (site_properties or {}).items():
+            if val is not None:
+                site_props[key] = [val[idx] for idx in range(n_sites)]
+
+        self._sites: _SiteStore | tuple[PeriodicSite, ...] = _SiteStore(
+            self._lattice,
+            site_species,
+            frac_coords,
+            list(labels) if labels else [None] * n_sites,
+            site_props,
+            seq_type=list if isinstance(self, MutableSequence) else tuple,
+        )
         if validate_proximity and not self.is_valid():
             raise StructureError(f"sites are less than {self.DISTANCE_TOLERANCE} Angstrom apart!")
         self._charge = charge
@@ -1119,23 +1536,30 @@ class IStructure(SiteCollection, MSONable):
         frac_lattice = lattice_points_in_supercell(scale_matrix)
         cart_lattice = new_lattice.get_cartesian_coords(frac_lattice)
 
-        new_sites = []
-        for site in self:
-            for vec in cart_lattice:
-                periodic_site = PeriodicSite(
-                    site.species,
-                    site.coords + vec,
-                    new_lattice,
-                    properties=site.properties,
-                    coords_are_cartesian=True,
-                    to_unit_cell=False,
-                    skip_checks=True,
-                    label=site.label,
-                )
-                new_sites.append(periodic_site)
+        # Translate every site by every lattice point at once, site-major like
+        # the sites of the supercell
+        n_images = len(cart_lattice)
+        cart_coords = self.cart_coords[:, None, :] + cart_lattice[None, :, :]
+        frac_coords = new_lattice.get_fractional_coords(cart_coords.reshape(-1, 3))
+
+        def repeat(values: Sequence) -> list:
+            return [val for val in values for _ in range(n_images)]
+
+        site_props = self.site_properties
+        for key, val in site_props.items():
+            if any(vv is None for vv in val):
+                warnings.warn(f"Not all sites have property {key}. Missing values are set to None.")
 
         new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
-        return Structure.from_sites(new_sites, charge=new_charge, to_unit_cell=True)
+        return Structure(
+            new_lattice,
+            repeat(self.species_and_occu),
+            frac_coords,
+            charge=new_charge,
+            to_unit_cell=True,
+            site_properties={key: repeat(val) for key, val in site_props.items()},
+            labels=repeat(self.labels),
+        )
 
     def __rmul__(self, scaling_matrix):
         """Similar to __mul__ to preserve commutativeness."""
@@ -1238,6 +1662,57 @@ class IStructure(SiteCollection, MSONable):
             properties=properties,
         )
 
+    @classmethod
+    def from_arrays(
+        cls,
+        lattice: ArrayLike | Lattice,
+        atomic_numbers: ArrayLike,
+        frac_coords: ArrayLike,
+        site_properties: dict[str, Sequence] | None = None,
+        labels: Sequence[str | None] | None = None,
+        charge: float | None = None,
+        properties: dict | None = None,
+    ) -> Self:
+        """Create an ordered structure from arrays of atomic numbers and fractional
+        coordinates. This is the high-throughput path for building many
+        structures, e.g. from ML datasets: each distinct element is converted
+        only once and the same Element composition is shared by all its sites,
+        sites are not created until they are accessed and no per-site
+        validation is done.
+
+        Args:
+            lattice (Lattice | ArrayLike): The lattice, as a Lattice or 3x3 matrix.
+            atomic_numbers (ArrayLike): Atomic number of each site, shape (N,).
+            frac_coords (ArrayLike): Fractional coordinates, shape (N, 3).
+            site_properties (dict): Properties associated with the sites as a
+                dict of sequences/arrays of length N, e.g. {"magmom": [5, 5]}.
+            labels (list[str]): Labels of the sites. Defaults to None.
+            charge (float): Overall charge of the structure. Defaults to None.
+            properties (dict): Properties associated with the whole structure.
+
+        Raises:
+            StructureError: If atomic_numbers and frac_coords have different lengths.
+
+        Returns:
+            IStructure | Structure: with the given sites.
+        """
+        atomic_numbers = np.asarray(atomic_numbers, dtype=int).ravel()
+        frac_coords = np.asarray(frac_coords, dtype=float).reshape(-1, 3)
+        if len(atomic_numbers) != len(frac_coords):
+            raise StructureError(f"{len(atomic_numbers)=} != {len(frac_coords)=}")
+
+        unique_z, species_idx = np.unique(atomic_numbers, return_inverse=True)
+        unique_species = [_get_element_composition(int(z)) for z in unique_z]
+        return cls(
+            lattice,
+            [unique_species[idx] for idx in species_idx.tolist()],
+            frac_coords,
+            charge=charge,
+            site_properties=site_properties,
+            labels=labels,
+            properties=properties,
+        )
+
     @classmethod
     def from_spacegroup(
         cls,
@@ -1484,7 +1959,22 @@ class IStructure(SiteCollection, MSONable):
         """The distance matrix between all sites in the structure. For
         periodic structures, this should return the nearest image distance.
         """
-        return self.lattice.get_all_distances(self.frac_coords, self.frac_coords)
+        return self._get_cached(
+            ("distance_matrix",), lambda: self.lattice.get_all_distances(self.frac_coords, self.frac_coords)
+        )
+
+    def _get_distance_rows(self, start: int, stop: int) -> np.ndarray:
+        """Rows start to stop of the distance matrix."""
+        frac_coords = self.frac_coords
+        return self.lattice.get_all_distances(frac_coords[start:stop], frac_coords)
+
+    def _get_close_pairs(self, cutoff: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Indices and distances of all (ordered) pairs of different sites within
+        cutoff, including all periodic images.
+        """
+        centers, points, _images, dists = self.get_neighbor_list(cutoff)
+        keep = (centers != points) & (dists <= cutoff)
+        return centers[keep], points[keep], dists[keep]
 
     @property
     def lattice(self) -> Lattice:
@@ -1563,6 +2053,8 @@ class IStructure(SiteCollection, MSONable):
     @property
     def frac_coords(self):
         """Fractional coordinates as a Nx3 numpy array."""
+        if isinstance(self._sites, _SiteStore):
+            return self._sites.get_frac_coords()
         return np.array([site.frac_coords for site in self])
 
     @property
@@ -1765,6 +2257,21 @@ class IStructure(SiteCollection, MSONable):
         Returns:
             tuple: (center_indices, points_indices, offset_vectors, distances)
         """
+        if sites is None:
+            return self._get_cached(
+                ("neighbor_list", r, numerical_tol, exclude_self),
+                lambda: self._get_neighbor_list(r, None, numerical_tol, exclude_self),
+            )
+        return self._get_neighbor_list(r, sites, numerical_tol, exclude_self)
+
+    def _get_neighbor_list(
+        self,
+        r: float,
+        sites: Sequence[PeriodicSite] | None,
+        numerical_tol: float,
+        exclude_self: bool,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Uncached implementation of get_neighbor_list."""
         try:
             from pymatgen.optimization.neighbors import find_points_in_spheres
         except ImportError:
@@ -1774,8 +2281,9 @@ class IStructure(SiteCollection, MSONable):
 
         else:
             if sites is None:
-                sites = self.sites
-            site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)
+                site_coords = np.ascontiguousarray(self.cart_coords, dtype=float)
+            else:
+                site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)
             cart_coords = np.ascontiguousarray(self.cart_coords, dtype=float)
             lattice_matrix = np.ascontiguousarray(self.lattice.matrix, dtype=float)
             pbc = np.ascontiguousarray(self.pbc, dtype=np.int64)
@@ -1992,11 +2500,16 @@ class IStructure(SiteCollection, MSONable):
             [[pymatgen.core.structure.PeriodicNeighbor], ...]: a list of
                 list of neighbors for each site in structure.
         """
-        if sites is None:
-            sites = self.sites
+        if sites is None and self._cache is not None:
+            return self._get_cached(
+                ("all_neighbors", r, numerical_tol),
+                lambda: self.get_all_neighbors(r, sites=self.sites, numerical_tol=numerical_tol),
+            )
         center_indices, points_indices, images, distances = self.get_neighbor_list(
             r=r, sites=sites, numerical_tol=numerical_tol
         )
+        if sites is None:
+            sites = self.sites
         if len(points_indices) < 1:
             return [[]] * len(sites)
         f_coords = self.frac_coords[points_indices] + images
@@ -2340,11 +2853,16 @@ class IStructure(SiteCollection, MSONable):
         pbc: bool = True,
         autosort_tol: float = 0,
         end_amplitude: float = 1,
-    ) -> list[Self]:
+        return_trajectory: bool = False,
+    ) -> list[Self] | PmgTrajectory:
         """Interpolate between this structure and end_structure. Useful for
         construction of NEB inputs. To obtain useful results, the cell setting
         and order of sites must consistent across the start and end structures.
 
+        The coordinates (and lattices) of all images are computed at once, so
+        return_trajectory=True gives the whole path as arrays without creating
+        a Structure per image.
+
         Args:
             end_structure (Structure): structure to interpolate between this
                 structure and end. Must be in the same setting and have the
@@ -2368,11 +2886,13 @@ class IStructure(SiteCollection, MSONable):
                 (default), 0.5 implies distortion to a point halfway
                 between structure and end_structure, and -1 implies full
                 distortion in the opposite direction to end_structure.
+            return_trajectory (bool): Whether to return a Trajectory with the
+                images as frames instead of a list of structures. Defaults to False.
 
         Returns:
-            List of interpolated structures. The starting and ending
-            structures included as the first and last structures respectively.
-            A total of (nimages + 1) structures are returned.
+            List of interpolated structures (or a Trajectory if return_trajectory).
+            The starting and ending structures included as the first and last
+            structures respectively. A total of (nimages + 1) structures are returned.
         """
         # Check length of structures
         if len(self) != len(end_structure):
@@ -2381,12 +2901,15 @@ class IStructure(SiteCollection, MSONable):
         if not (interpolate_lattices or self.lattice == end_structure.lattice):
             raise ValueError("Structures with different lattices!")
 
-        images = nimages if isinstance(nimages, collections.abc.Iterable) else np.arange(nimages + 1) / nimages
+        if isinstance(nimages, collections.abc.Iterable):
+            images = np.array(list(nimages), dtype=float)
+        else:
+            images = np.arange(nimages + 1) / nimages
 
         # Check that both structures have the same species
-        for idx, site in enumerate(self):
-            if site.species != end_structure[idx].species:
-                raise ValueError(f"Different species!\nStructure 1:\n{self}\nStructure 2\n{end_structure}")
+        sp = self.species_and_occu
+        if sp != end_structure.species_and_occu:
+            raise ValueError(f"Different species!\nStructure 1:\n{self}\nStructure 2\n{end_structure}")
 
         start_coords = np.array(self.frac_coords)
         end_coords = np.array(end_structure.frac_coords)
@@ -2426,8 +2949,9 @@ class IStructure(SiteCollection, MSONable):
         vec = end_amplitude * (end_coords - start_coords)
         if pbc:
             vec[:, self.pbc] -= np.round(vec[:, self.pbc])
-        sp = self.species_and_occu
-        structs = []
+
+        # Coordinates of all images in one broadcast, shape (n_images, n_sites, 3)
+        all_frac_coords = start_coords[None, :, :] + images[:, None, None] * vec[None, :, :]
 
         if interpolate_lattices:
             # Interpolate lattice matrices using polar decomposition
@@ -2435,18 +2959,28 @@ class IStructure(SiteCollection, MSONable):
             _u, p = polar(np.dot(end_structure.lattice.matrix.T, np.linalg.inv(self.lattice.matrix.T)))
             lvec = end_amplitude * (p - np.identity(3))
             lstart = self.lattice.matrix.T
+            matrices = np.matmul(np.identity(3) + images[:, None, None] * lvec, lstart).transpose(0, 2, 1)
+        else:
+            matrices = np.tile(self.lattice.matrix, (len(images), 1, 1))
 
-        for x in images:
-            if interpolate_lattices:
-                l_a = np.dot(np.identity(3) + x * lvec, lstart).T  # type: ignore[reportPossiblyUnboundVariable]
-                lattice = Lattice(l_a)
-            else:
-                lattice = self.lattice
-            frac_coords = start_coords + x * vec
-            structs.append(
-                type(self)(lattice, sp, frac_coords, site_properties=self.site_properties, labels=self.labels)
+        site_properties = self.site_properties
+        if return_trajectory:
+            from pymatgen.core.trajectory import Trajectory
+
+            return Trajectory(
+                species=sp,
+                coords=all_frac_coords,
+                lattice=matrices if interpolate_lattices else self.lattice.matrix,
+                site_properties=site_properties,
+                constant_lattice=not interpolate_lattices,
             )
-        return structs
+
+        labels = self.labels
+        lattices = [Lattice(matrix) for matrix in matrices] if interpolate_lattices else [self.lattice] * len(images)
+        return [
+            type(self)(lattice, sp, frac_coords, site_properties=site_properties, labels=labels)
+            for lattice, frac_coords in zip(lattices, all_frac_coords, strict=True)
+        ]
 
     def get_miller_index_from_site_indexes(
         self,
@@ -2534,23 +3068,17 @@ class IStructure(SiteCollection, MSONable):
         super_ftol = np.divide(tolerance, self.lattice.abc)
         super_ftol_2 = super_ftol * 2
 
-        def pbc_coord_intersection(fc1, fc2, tol):
-            """Get the fractional coords in fc1 that have coordinates
-            within tolerance to some coordinate in fc2.
-            """
-            dist = fc1[:, None, :] - fc2[None, :, :]
-            dist -= np.round(dist)
-            return fc1[np.any(np.all(dist < tol, axis=-1), axis=-1)]
-
         # Here we reduce the number of min_vecs by enforcing that every
         # vector in min_vecs approximately maps each site onto a similar site.
         # The subsequent processing is O(fu^3 * min_vecs) = O(n^4) if we do no
-        # reduction.
-        # This reduction is O(n^3) so usually is an improvement. Using double
-        # the tolerance because both vectors are approximate
+        # reduction. Starting with the smallest group discards most candidates
+        # early. Using double the tolerance because both vectors are approximate
         for group in sorted(grouped_frac_coords, key=len):
-            for frac_coords in group:
-                min_vecs = pbc_coord_intersection(min_vecs, group - frac_coords, super_ftol_2)
+            min_vecs = _filter_translations(min_vecs, group, super_ftol_2)
+
+        # Only the identity maps all sites onto themselves: already primitive
+        if len(min_vecs) <= 1:
+            return self.copy()
 
         def get_hnf(form_units):
             """Get all possible distinct supercell matrices given a
@@ -3447,11 +3975,29 @@ class IMolecule(SiteCollection, MSONable):
         Returns:
             List of bonds
         """
-        bonds = []
-        for site1, site2 in itertools.combinations(self._sites, 2):
-            if CovalentBond.is_bonded(site1, site2, tol):
-                bonds.append(CovalentBond(site1, site2))
-        return bonds
+        sites = self.sites
+        if len(sites) < 2:
+            return []
+
+        # Bond length thresholds for each pair of elements, as in CovalentBond.is_bonded
+        symbols = [next(iter(site.species)).symbol for site in sites]
+        unique_symbols, symbol_inds, counts = np.unique(symbols, return_inverse=True, return_counts=True)
+        thresholds = np.zeros((len(unique_symbols), len(unique_symbols)))
+        for (idx1, sym1), (idx2, sym2) in itertools.combinations_with_replacement(enumerate(unique_symbols), 2):
+            if idx1 == idx2 and counts[idx1] == 1:
+                continue  # no pair of sites of this element
+            syms = tuple(sorted([sym1, sym2]))
+            if syms not in bond_lengths:
+                raise ValueError(f"No bond data for elements {syms[0]} - {syms[1]}")
+            thresholds[idx1, idx2] = thresholds[idx2, idx1] = (1 + tol) * max(bond_lengths[syms].values())
+
+        # Only pairs within the longest threshold can be bonded
+        coords = self.cart_coords
+        pairs = KDTree(coords).query_pairs(np.max(thresholds), output_type="ndarray")
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        dists = np.linalg.norm(coords[pairs[:, 0]] - coords[pairs[:, 1]], axis=1)
+        is_bonded = dists < thresholds[symbol_inds[pairs[:, 0]], symbol_inds[pairs[:, 1]]]
+        return [CovalentBond(sites[idx1], sites[idx2]) for idx1, idx2 in pairs[is_bonded]]
 
     def get_zmatrix(self) -> str:
         """Get a z-matrix representation of the molecule."""
@@ -3635,11 +4181,21 @@ class IMolecule(SiteCollection, MSONable):
             raise ValueError("Box is not big enough to contain Molecule.")
         lattice = Lattice.from_parameters(a * images[0], b * images[1], c * images[2], 90, 90, 90)
         nimages: int = images[0] * images[1] * images[2]
-        all_coords: list[ArrayLike] = []
+        all_coords: list[np.ndarray] = []
 
         centered_coords = self.cart_coords - self.center_of_mass + offset
         rng = np.random.default_rng()
 
+        # The box is orthorhombic, so overlaps with the molecules placed so far
+        # are found with a periodic KD-tree instead of a dense distance matrix
+        box_size = np.array(lattice.abc)
+
+        def wrap(coords):
+            coords = coords % box_size
+            return np.where(coords < box_size, coords, 0)
+
+        placed_tree = None
+
         for i, j, k in itertools.product(
             list(range(images[0])),
             list(range(images[1])),
@@ -3661,13 +4217,10 @@ class IMolecule(SiteCollection, MSONable):
                         z_max, z_min = max(new_coords[:, 2]), min(new_coords[:, 2])
                         if x_max > a or x_min < 0 or y_max > b or y_min < 0 or z_max > c or z_min < 0:
                             raise ValueError("Molecule crosses boundary of box")
-                    if not all_coords:
+                    if placed_tree is None:
                         break
-                    distances = lattice.get_all_distances(
-                        lattice.get_fractional_coords(new_coords),
-                        lattice.get_fractional_coords(all_coords),
-                    )
-                    if np.amin(distances) > min_dist:
+                    n_close = placed_tree.query_ball_point(wrap(new_coords), r=min_dist, return_length=True)
+                    if not np.any(n_close):
                         break
             else:
                 new_coords = centered_coords + box_center
@@ -3677,7 +4230,9 @@ class IMolecule(SiteCollection, MSONable):
                     z_max, z_min = max(new_coords[:, 2]), min(new_coords[:, 2])
                     if x_max > a or x_min < 0 or y_max > b or y_min < 0 or z_max > c or z_min < 0:
                         raise ValueError("Molecule crosses boundary of box")
-            all_coords.extend(new_coords)
+            all_coords.append(new_coords)
+            if random_rotation:
+                placed_tree = KDTree(wrap(np.concatenate(all_coords)), boxsize=box_size)
 
         site_props = {key: sequence * nimages for key, sequence in self.site_properties.items()}  # type: ignore[operator]
 
@@ -3688,7 +4243,7 @@ class IMolecule(SiteCollection, MSONable):
             return cls(
                 lattice,
                 self.species * nimages,
-                all_coords,
+                np.concatenate(all_coords),
                 coords_are_cartesian=True,
                 site_properties=site_props,
                 labels=self.labels * nimages,
@@ -3697,7 +4252,7 @@ class IMolecule(SiteCollection, MSONable):
         return cls(
             lattice,
             self.species * nimages,
-            coords,
+            np.concatenate(all_coords),
             coords_are_cartesian=True,
             site_properties=site_props,
             labels=self.labels * nimages,
@@ -3935,8 +4490,6 @@ class Structure(IStructure, collections.abc.MutableSequence):
             properties=properties,
         )
 
-        self._sites: list[PeriodicSite] = list(self._sites)  # type: ignore[assignment]
-
     def __setitem__(
         self,
         idx: int | slice | Sequence[int] | SpeciesLike,
@@ -3976,6 +4529,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
             Replaces all Mn in the structure with Fe: 0.5, Co: 0.5, i.e.,
             creates a disordered structure!
         """
+        self.clear_cache()
         if isinstance(idx, int):
             indices = [idx]
         elif isinstance(idx, str | Element | Species):
@@ -4008,6 +4562,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
     def __delitem__(self, idx: SupportsIndex | slice) -> None:
         """Delete a site from the Structure."""
         self._sites.__delitem__(idx)
+        self.clear_cache()
 
     @property
     def lattice(self) -> Lattice:
@@ -4019,8 +4574,12 @@ class Structure(IStructure, collections.abc.MutableSequence):
         if not isinstance(lattice, Lattice):
             lattice = Lattice(lattice)
         self._lattice = lattice
-        for site in self:
-            site.lattice = lattice
+        if isinstance(self._sites, _SiteStore):
+            self._sites.set_lattice(lattice)
+        else:
+            for site in self:
+                site.lattice = lattice
+        self.clear_cache()
 
     def append(
         self,
@@ -4088,6 +4647,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
                     raise ValueError("New site is too close to an existing site!")
 
         cast(list[PeriodicSite], self.sites).insert(idx, new_site)
+        self.clear_cache()
 
         return self
 
@@ -4125,6 +4685,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
 
         new_site = PeriodicSite(species, frac_coords, self._lattice, properties=properties, label=label)
         cast(list[PeriodicSite], self.sites)[idx] = new_site
+        self.clear_cache()
 
         return self
 
@@ -4231,7 +4792,8 @@ class Structure(IStructure, collections.abc.MutableSequence):
         del self[index]
         for site in fgroup[1:]:
             s_new = PeriodicSite(site.species, site.coords, self.lattice, coords_are_cartesian=True, label=site.label)
-            self._sites.append(s_new)
+            self.sites.append(s_new)
+        self.clear_cache()
 
         return self
 
@@ -4360,7 +4922,8 @@ class Structure(IStructure, collections.abc.MutableSequence):
         Returns:
             Structure: self sorted.
         """
-        self._sites.sort(key=key, reverse=reverse)
+        self.sites.sort(key=key, reverse=reverse)
+        self.clear_cache()
         return self
 
     def translate_sites(
@@ -4397,6 +4960,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
             if to_unit_cell:
                 f_coords = [np.mod(f, 1) if p else f for p, f in zip(self.lattice.pbc, f_coords, strict=True)]
             self[idx].frac_coords = f_coords
+        self.clear_cache()
 
         return self
 
@@ -4518,9 +5082,9 @@ class Structure(IStructure, collections.abc.MutableSequence):
         struct: Structure = self if in_place else self.copy()
         supercell: Structure = struct * scaling_matrix
         if to_unit_cell:
-            for site in supercell:
-                site.to_unit_cell(in_place=True)
-        struct.sites = supercell.sites
+            site_store = cast(_SiteStore, supercell._sites)
+            site_store.frac_coords = np.where(supercell.pbc, np.mod(site_store.frac_coords, 1), site_store.frac_coords)
+        struct._sites = supercell._sites
         struct.lattice = supercell.lattice
 
         return struct
@@ -4553,26 +5117,30 @@ class Structure(IStructure, collections.abc.MutableSequence):
         Returns:
             Structure: self with merged sites.
         """
-        dist_mat = self.distance_matrix
-        np.fill_diagonal(dist_mat, 0)
-        clusters = fcluster(linkage(squareform((dist_mat + dist_mat.T) / 2)), tol, "distance")
+        # Single-linkage clusters of sites within tol, i.e. connected components
+        # of the sparse graph of close pairs, numbered by their first site
+        n_sites = len(self)
+        rows, cols, _dists = self._get_close_pairs(tol)
+        graph = csr_array((np.ones(len(rows)), (rows, cols)), shape=(n_sites, n_sites))
+        _n_clusters, clusters = connected_components(graph, directed=False)
+        order = np.argsort(clusters, kind="stable")
+        all_sites = self.sites
         sites = []
-        for cluster in np.unique(clusters):
-            inds = np.where(clusters == cluster)[0]
-            species = self[inds[0]].species
-            coords = self[inds[0]].frac_coords
-            props = self[inds[0]].properties
+        for inds in np.split(order, np.cumsum(np.bincount(clusters))[:-1]):
+            species = all_sites[inds[0]].species
+            coords = all_sites[inds[0]].frac_coords
+            props = all_sites[inds[0]].properties
             for n, i in enumerate(inds[1:]):
-                sp = self[i].species
+                site = all_sites[i]
                 if mode.lower()[0] == "s":
-                    species += sp
-                offset = self[i].frac_coords - coords
+                    species += site.species
+                offset = site.frac_coords - coords
                 coords = coords + ((offset - np.round(offset)) / (n + 2)).astype(coords.dtype)
                 for key in props:
-                    if props[key] is not None and self[i].properties[key] != props[key]:
+                    if props[key] is not None and site.properties[key] != props[key]:
                         if mode.lower()[0] == "a" and isinstance(props[key], float):
                             # update a running total
-                            props[key] = props[key] * (n + 1) / (n + 2) + self[i].properties[key] / (n + 2)
+                            props[key] = props[key] * (n + 1) / (n + 2) + site.properties[key] / (n + 2)
                         else:
                             props[key] = None
                             warnings.warn(
@@ -4580,7 +5148,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
                             )
             sites.append(PeriodicSite(species, coords, self.lattice, properties=props))
 
-        self._sites = sites
+        self.sites = sites
         return self
 
     def set_charge(self, new_charge: float = 0.0) -> Self:
@@ -4784,6 +5352,7 @@ class Molecule(IMolecule, collections.abc.MutableSequence):
                 simply a Species-like string/object, or finally a (Species,
                 coords) sequence, e.g. ("Fe", [0.5, 0.5, 0.5]).
         """
+        self.clear_cache()
         if isinstance(idx, int):
             indices = [idx]
 
@@ -4813,6 +5382,7 @@ class Molecule(IMolecule, collections.abc.MutableSequence):
     def __delitem__(self, idx: SupportsIndex | slice) -> None:
         """Deletes a site from the Structure."""
         self._sites.__delitem__(idx)
+        self.clear_cache()
 
     def append(
         self,
@@ -4907,6 +5477,7 @@ class Molecule(IMolecule, collections.abc.MutableSequence):
                 if site.distance(new_site) < self.DISTANCE_TOLERANCE:
                     raise ValueError("New site is too close to an existing site!")
         cast(list[PeriodicSite], self.sites).insert(idx, new_site)
+        self.clear_cache()
 
         return self
 
@@ -5143,6 +5714,7 @@ class Molecule(IMolecule, collections.abc.MutableSequence):
         # group.
         del self[index]
         self._sites += list(functional_group[1:])
+        self.clear_cache()
         return self
 
     def relax(
@@ -489,6 +489,28 @@ class Trajectory(MSONable):
             "base_positions": self.base_positions,
         }
 
+    def to_bytes(self, compress: bool = False) -> bytes:
+        """Compact binary (npz) representation of the trajectory, storing
+        coordinates and lattices as arrays. See pymatgen.io.npz.
+
+        Args:
+            compress (bool): Whether to zip-compress the data. Defaults to False.
+        """
+        from pymatgen.io.npz import to_bytes
+
+        return to_bytes(self, compress=compress)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Reconstitute a Trajectory from the output of to_bytes().
+
+        Args:
+            data (bytes): Serialized Trajectory.
+        """
+        from pymatgen.io.npz import from_bytes
+
+        return from_bytes(data, cls=cls)
+
     @classmethod
     def from_structures(cls, structures: list[Structure], constant_lattice: bool = True, **kwargs) -> Self:
         """Create trajectory from a list of structures.
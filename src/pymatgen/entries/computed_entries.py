@@ -606,6 +606,28 @@ class ComputedStructureEntry(ComputedEntry):
         dct["structure"] = self.structure.as_dict()
         return dct
 
+    def to_bytes(self, compress: bool = False) -> bytes:
+        """Compact binary (npz) representation with the structure stored
+        column-wise. Use pymatgen.io.npz.dump_many to serialize many entries at once.
+
+        Args:
+            compress (bool): Whether to zip-compress the data. Defaults to False.
+        """
+        from pymatgen.io.npz import to_bytes
+
+        return to_bytes(self, compress=compress)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Reconstitute an entry from the output of to_bytes().
+
+        Args:
+            data (bytes): Serialized ComputedStructureEntry.
+        """
+        from pymatgen.io.npz import from_bytes
+
+        return from_bytes(data, cls=cls)
+
     @classmethod
     def from_dict(cls, dct: dict) -> Self:
         """
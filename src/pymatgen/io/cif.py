@@ -2,23 +2,33 @@
 
 from __future__ import annotations
 
-import math
+import bz2
+import contextlib
+import gzip
+import json
+import lzma
 import os
 import re
+import tarfile
 import textwrap
+import time
 import warnings
-from collections import defaultdict, deque
+import zlib
+from collections import defaultdict
 from functools import partial
 from inspect import getfullargspec
 from io import StringIO
-from itertools import groupby
+from itertools import chain, groupby, repeat
+from multiprocessing import Pool
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, cast
 
 import numpy as np
 from monty.dev import deprecated
 from monty.io import zopen
+from monty.json import MontyEncoder
 from monty.serialization import loadfn
+from scipy.spatial import KDTree
 
 from pymatgen.core import Composition, DummySpecies, Element, Lattice, PeriodicSite, Species, Structure, get_el_sp
 from pymatgen.core.operations import MagSymmOp, SymmOp
@@ -27,12 +37,12 @@ from pymatgen.symmetry.analyzer import SpacegroupAnalyzer, SpacegroupOperations
 from pymatgen.symmetry.groups import SYMM_DATA, SpaceGroup
 from pymatgen.symmetry.maggroups import MagneticSpaceGroup
 from pymatgen.symmetry.structure import SymmetrizedStructure
-from pymatgen.util.coord import find_in_coord_list_pbc, in_coord_list_pbc
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from typing import Any
 
-    from numpy.typing import NDArray
+    from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
     from pymatgen.util.typing import PathLike, Vector3D
@@ -136,51 +146,73 @@ class CifBlock:
             val = quote + val + quote
         return val
 
+    # Multiline text fields, delimited by semicolons at the start of lines. A new text
+    # field may also start directly after the closing semicolon of the previous one.
+    _text_field_pattern = re.compile(r"(?:^|(?<=^;)[^\S\n]*);([^\n]*(?:\n(?!;)[^\n]*)*)\n;", flags=re.MULTILINE)
+
+    # This regex splits on spaces, except when in quotes. Starting quotes must not be
+    # preceded by non-whitespace (these get eaten by the first expression). Ending
+    # quotes must not be followed by non-whitespace.
+    _token_pattern = re.compile(r"""([^'"\s][\S]*)|'(.*?)'(?!\S)|"(.*?)"(?!\S)""")
+
     @classmethod
-    def _process_string(cls, string: str) -> deque:
-        """Process string to remove comments, empty lines and non-ASCII.
-        Then break it into a stream of tokens.
+    def _process_string(cls, string: str) -> list[tuple[str, ...]]:
+        """Process string to remove comments and non-ASCII.
+        Then break it into a stream of tokens. Empty lines are
+        meaningless, except in multiline text fields where they are
+        dropped.
+
+        Returns:
+            list[tuple[str, ...]]: Tokens as tuples with exactly one non-empty entry.
+                The first entry is only non-empty for unquoted tokens.
         """
-        # Remove comments
-        string = re.sub(r"(\s|^)#.*$", "", string, flags=re.MULTILINE)
+        # Normalize line endings
+        string = string.replace("\r\n", "\n").replace("\r", "\n")
 
-        # Remove empty lines
-        string = re.sub(r"^\s*\n", "", string, flags=re.MULTILINE)
+        # Remove comments
+        if "#" in string:
+            string = re.sub(r"(\s|^)#.*$", "", string, flags=re.MULTILINE)
 
         # Remove non-ASCII
-        string = string.encode("ascii", "ignore").decode("ascii")
+        if not string.isascii():
+            string = string.encode("ascii", "ignore").decode("ascii")
 
         # Since line breaks in .cif files are mostly meaningless,
         # break up into a stream of tokens to parse, rejoin multiline
-        # strings (between semicolons)
-        deq: deque = deque()
-        multiline: bool = False
-        lines: list[str] = []
-
-        # This regex splits on spaces, except when in quotes. Starting quotes must not be
-        # preceded by non-whitespace (these get eaten by the first expression). Ending
-        # quotes must not be followed by non-whitespace.
-        pattern = re.compile(r"""([^'"\s][\S]*)|'(.*?)'(?!\S)|"(.*?)"(?!\S)""")
-
-        for line in string.splitlines():
-            if multiline:
-                if line.startswith(";"):
-                    multiline = False
-                    deq.append(("", "", "", " ".join(lines)))
-                    lines = []
-                    line = line[1:].strip()
-                else:
-                    lines.append(line)
-                    continue
+        # strings (between semicolons) with spaces. Splitting with a
+        # capture group alternates between regular chunks and text fields.
+        chunks = cls._text_field_pattern.split(string)
+        tokens: list[tuple[str, ...]] = []
+        for idx in range(0, len(chunks) - 1, 2):
+            tokens += cls._tokenize(chunks[idx])
+            first, *rest = chunks[idx + 1].split("\n")
+            tokens.append(("", "", "", " ".join([first.strip(), *filter(str.strip, rest)])))
+
+        # Ignore a text field that is never closed and the rest of the block
+        last = chunks[-1].partition("\n;")[0]
+        if len(chunks) > 1 and last.partition("\n")[0].strip().startswith(";"):
+            last = ""
+        tokens += cls._tokenize(last)
+        return tokens
 
-            if line.startswith(";"):
-                multiline = True
-                lines.append(line[1:].strip())
+    @classmethod
+    def _tokenize(cls, string: str) -> list[tuple[str, ...]]:
+        """Break a string without multiline text fields into tokens. Runs of lines
+        without quotes are tokenized with str.split as it is much faster than the regex.
+        """
+        tokens: list[tuple[str, ...]] = []
+        unquoted: list[str] = []
+        for line in string.split("\n"):
+            if "'" in line or '"' in line:
+                if unquoted:
+                    tokens += zip(" ".join(unquoted).split(), repeat(""), repeat(""))
+                    unquoted = []
+                tokens += cls._token_pattern.findall(line)
             else:
-                for string in pattern.findall(line):
-                    # Location of the data in string depends on whether it was quoted in the input
-                    deq.append(tuple(string))
-        return deq
+                unquoted.append(line)
+        if unquoted:
+            tokens += zip(" ".join(unquoted).split(), repeat(""), repeat(""))
+        return tokens
 
     @classmethod
     def from_str(cls, string: str) -> Self:
@@ -192,44 +224,54 @@ class CifBlock:
         Returns:
             CifBlock
         """
-        deq: deque = cls._process_string(string)
-        header: str = deq.popleft()[0][5:]
+        tokens = cls._process_string(string)
+        header: str = tokens[0][0][5:]
         data: dict = {}
         loops: list[list[str]] = []
 
-        while deq:
-            _str = deq.popleft()
+        n_tokens = len(tokens)
+        idx = 1
+        while idx < n_tokens:
+            _str = tokens[idx]
+            idx += 1
             # CIF keys aren't in quotes, so show up as _str[0]
             if _str[0] == "_eof":
                 break
 
             if _str[0].startswith("_"):
-                try:
-                    data[_str[0]] = "".join(deq.popleft())
-                except IndexError:
+                if idx < n_tokens:
+                    data[_str[0]] = "".join(tokens[idx])
+                    idx += 1
+                else:
                     data[_str[0]] = ""
 
             elif _str[0].startswith("loop_"):
                 columns: list[str] = []
-                items: list[str] = []
-                while deq:
-                    _str = deq[0]
+                while idx < n_tokens:
+                    _str = tokens[idx]
                     if _str[0].startswith("loop_") or not _str[0].startswith("_"):
                         break
-                    columns.append("".join(deq.popleft()))
+                    columns.append(_str[0])
                     data[columns[-1]] = []
+                    idx += 1
 
-                while deq:
-                    _str = deq[0]
-                    if _str[0].startswith(("loop_", "_")):
-                        break
-                    items.append("".join(deq.popleft()))
+                loop_start = idx
+                while idx < n_tokens and not tokens[idx][0].startswith(("loop_", "_")):
+                    idx += 1
+                items = ["".join(_str).strip() for _str in tokens[loop_start:idx]]
 
+                if not columns or not items:
+                    raise ValueError(f"Loop without data names or values, {columns=}")
                 n = len(items) // len(columns)
-                assert len(items) % n == 0
+                if len(items) != n * len(columns):
+                    raise ValueError(f"Number of items in loop is not a multiple of the number of {columns=}")
                 loops.append(columns)
-                for k, v in zip(columns * n, items, strict=True):
-                    data[k].append(v.strip())
+                if len(set(columns)) == len(columns):
+                    for col_idx, col in enumerate(columns):
+                        data[col] = items[col_idx :: len(columns)]
+                else:
+                    for key, val in zip(columns * n, items, strict=True):
+                        data[key].append(val)
 
             elif issue := "".join(_str).strip():
                 warnings.warn(f"Possible issue in CIF file at line: {issue}")
@@ -287,6 +329,22 @@ class CifFile:
 
         return cls(dct, string)
 
+    @staticmethod
+    def _iter_block_strs(lines: Iterable[str]) -> Iterator[str]:
+        """Lazily split the lines of a CIF into the strings of its data blocks.
+        Anything before the first data block is skipped.
+        """
+        block: list[str] = []
+        for line in lines:
+            if line.lstrip().startswith("data_"):
+                if block:
+                    yield "".join(block)
+                block = [line]
+            elif block:
+                block.append(line)
+        if block:
+            yield "".join(block)
+
     @classmethod
     def from_file(cls, filename: PathLike) -> Self:
         """
@@ -601,49 +659,95 @@ class CifParser:
         """Generate unique coordinates using coordinates and symmetry
         positions, and their corresponding magnetic moments if supplied.
         """
-        coords_out: list[NDArray] = []
-        labels_out: list[str] = []
         labels = labels or {}
 
-        if magmoms:
-            if len(magmoms) != len(coords):
-                raise ValueError("Length of magmoms and coords don't match.")
+        if magmoms and len(magmoms) != len(coords):
+            raise ValueError("Length of magmoms and coords don't match.")
 
-            magmoms_out: list[Magmom] = []
-            for tmp_coord, tmp_magmom in zip(coords, magmoms, strict=True):
-                for op in self.symmetry_operations:
-                    coord = op.operate(tmp_coord)
-                    coord = np.array([i - math.floor(i) for i in coord])
-                    if isinstance(op, MagSymmOp):
-                        # Up to this point, magmoms have been defined relative
-                        # to crystal axis. Now convert to Cartesian and into
-                        # a Magmom object.
-                        if lattice is None:
-                            raise ValueError("Lattice cannot be None.")
-                        magmom = Magmom.from_moment_relative_to_crystal_axes(
-                            op.operate_magmom(tmp_magmom), lattice=lattice
-                        )
-                    else:
-                        magmom = Magmom(tmp_magmom)
+        # Apply all symmetry operations to all coordinates at once, in the
+        # order of coordinates then operations, and map into the unit cell
+        n_ops = len(self.symmetry_operations)
+        all_coords = self._operate_all(coords).reshape(-1, 3)
+        all_coords -= np.floor(all_coords)
 
-                    if not in_coord_list_pbc(coords_out, coord, atol=self._site_tolerance):
-                        coords_out.append(coord)
-                        magmoms_out.append(magmom)
-                        labels_out.append(labels.get(tmp_coord, "no_label"))
+        # Keep each generated coordinate unless it is within the site tolerance
+        # of a previously kept one
+        kept_indices = np.flatnonzero(self._first_unique_pbc(all_coords, self._site_tolerance))
+        coords_out: list[NDArray] = list(all_coords[kept_indices])
+        labels_out: list[str] = [labels.get(coords[idx // n_ops], "no_label") for idx in kept_indices]
 
-            return coords_out, magmoms_out, labels_out
+        if magmoms:
+            magmoms_out: list[Magmom] = []
+            for idx in kept_indices:
+                op = self.symmetry_operations[idx % n_ops]
+                tmp_magmom = magmoms[idx // n_ops]
+                if isinstance(op, MagSymmOp):
+                    # Up to this point, magmoms have been defined relative
+                    # to crystal axis. Now convert to Cartesian and into
+                    # a Magmom object.
+                    if lattice is None:
+                        raise ValueError("Lattice cannot be None.")
+                    magmoms_out.append(
+                        Magmom.from_moment_relative_to_crystal_axes(op.operate_magmom(tmp_magmom), lattice=lattice)
+                    )
+                else:
+                    magmoms_out.append(Magmom(tmp_magmom))
 
-        for tmp_coord in coords:
-            for op in self.symmetry_operations:
-                coord = op.operate(tmp_coord)
-                coord = np.array([i - math.floor(i) for i in coord])
-                if not in_coord_list_pbc(coords_out, coord, atol=self._site_tolerance):
-                    coords_out.append(coord)
-                    labels_out.append(labels.get(tmp_coord, "no_label"))
+            return coords_out, magmoms_out, labels_out
 
         dummy_magmoms = [Magmom(0)] * len(coords_out)
         return coords_out, dummy_magmoms, labels_out
 
+    def _operate_all(self, coords: ArrayLike) -> NDArray:
+        """Apply all symmetry operations to fractional coordinates.
+
+        Returns:
+            NDArray: Of shape (n_coords, n_symmetry_operations, 3).
+        """
+        coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+        affine_coords = np.concatenate([coords, np.ones((len(coords), 1))], axis=-1)
+        affine_matrices = np.array([op.affine_matrix for op in self.symmetry_operations]).reshape(-1, 4, 4)
+        return np.inner(affine_coords, affine_matrices)[..., :3]
+
+    @staticmethod
+    def _first_unique_pbc(frac_coords: NDArray, atol: float) -> NDArray:
+        """Find the fractional coordinates that do not match any earlier unique
+        coordinate within atol (in each direction, taking into account periodic
+        boundary conditions). Equivalent to adding the coordinates one by one to
+        a list if not in_coord_list_pbc(list, coord, atol), but uses a periodic
+        KD-tree to find candidate pairs, so scales as O(n log n).
+
+        Args:
+            frac_coords (NDArray): Fractional coordinates in [0, 1).
+            atol (float): Absolute tolerance.
+
+        Returns:
+            NDArray: Boolean mask of the unique coordinates.
+        """
+        is_unique = np.ones(len(frac_coords), dtype=bool)
+        if len(frac_coords) < 2:
+            return is_unique
+
+        # The periodic KD-tree requires coordinates strictly smaller than the box size
+        tree_coords = np.mod(frac_coords, 1)
+        tree_coords[tree_coords >= 1] = 0
+        pairs = KDTree(tree_coords, boxsize=1).query_pairs(atol, p=np.inf, output_type="ndarray")
+
+        # Keep the same strict comparison as in_coord_list_pbc
+        frac_dist = frac_coords[pairs[:, 0]] - frac_coords[pairs[:, 1]]
+        frac_dist -= np.round(frac_dist)
+        pairs = pairs[np.all(np.abs(frac_dist) < atol, axis=1)]
+        if len(pairs) == 0:
+            return is_unique
+
+        # Sort pairs as (earlier, later) by the later index
+        pairs.sort(axis=1)
+        pairs = pairs[np.argsort(pairs[:, 1], kind="stable")]
+        later, split_idx = np.unique(pairs[:, 1], return_index=True)
+        for idx, earlier in zip(later, np.split(pairs[:, 0], split_idx[1:]), strict=True):
+            is_unique[idx] = not is_unique[earlier].any()
+        return is_unique
+
     def get_lattice(
         self,
         data: CifBlock,
@@ -967,13 +1071,20 @@ class CifParser:
             coord: Vector3D,
         ) -> Vector3D | Literal[False]:
             """Find site by coordinate."""
+            if not coord_to_species:
+                return False
             coords: list[Vector3D] = list(coord_to_species)
-            for op in self.symmetry_operations:
-                frac_coord = op.operate(coord)
-                indices: NDArray = find_in_coord_list_pbc(coords, frac_coord, atol=self._site_tolerance)
-                if len(indices) > 0:
-                    return coords[indices[0]]
-            return False
+
+            # Compare the images of coord under all symmetry operations with all coords
+            frac_dist = self._operate_all(coord)[0][:, None, :] - np.array(coords)[None]
+            frac_dist -= np.round(frac_dist)
+            is_match = np.all(np.abs(frac_dist) < self._site_tolerance, axis=-1)
+
+            # First matching coord for the first symmetry operation with a match
+            op_has_match = is_match.any(axis=1)
+            if not op_has_match.any():
+                return False
+            return coords[np.argmax(is_match[np.argmax(op_has_match)])]
 
         lattice = self.get_lattice(data)
 
@@ -1269,26 +1380,89 @@ class CifParser:
                 "since unexpected behavior might result."
             )
 
-        structures: list[Structure] = []
-        for idx, data in enumerate(self._cif.data.values()):
+        structures = list(self._iter_structures(primitive, symmetrized, check_occu, on_error))
+
+        if self.warnings and on_error == "warn":
+            warnings.warn("Issues encountered while parsing CIF: " + "\n".join(self.warnings))
+
+        if not structures:
+            raise ValueError("Invalid CIF file with no structures!")
+        return structures
+
+    def _iter_structures(
+        self,
+        primitive: bool,
+        symmetrized: bool,
+        check_occu: bool,
+        on_error: Literal["ignore", "warn", "raise"],
+        first_section: int = 1,
+    ) -> Iterator[Structure]:
+        """Yield the structures of all data blocks, see parse_structures.
+
+        Args:
+            first_section (int): Number of the first data block, used in error messages.
+        """
+        for idx, data in enumerate(self._cif.data.values(), start=first_section):
             try:
-                if struct := self._get_structure(data, primitive, symmetrized, check_occu=check_occu):
-                    structures.append(struct)
+                struct = self._get_structure(data, primitive, symmetrized, check_occu=check_occu)
 
             except (KeyError, ValueError) as exc:
-                msg = f"No structure parsed for section {idx + 1} in CIF.\n{exc}"
+                msg = f"No structure parsed for section {idx} in CIF.\n{exc}"
                 if on_error == "raise":
                     raise ValueError(msg) from exc
                 if on_error == "warn":
                     warnings.warn(msg)
                 self.warnings.append(msg)
+                continue
 
-        if self.warnings and on_error == "warn":
-            warnings.warn("Issues encountered while parsing CIF: " + "\n".join(self.warnings))
+            if struct:
+                yield struct
 
-        if not structures:
+    @classmethod
+    def iter_structures(
+        cls,
+        filename: PathLike,
+        primitive: bool = False,
+        symmetrized: bool = False,
+        check_occu: bool = True,
+        on_error: Literal["ignore", "warn", "raise"] = "warn",
+        **kwargs,
+    ) -> Iterator[Structure]:
+        """Lazily iterate over the structures in a CIF file, one data block at a time.
+
+        Unlike parse_structures, the file is read and parsed incrementally, so only
+        a single data block is held in memory at any time and the first structures
+        are available before the rest of the file is read. Useful for large
+        multi-block CIF files such as database dumps.
+
+        Args:
+            filename (PathLike): CIF file, gzipped or bzipped CIF files are fine too.
+            primitive (bool): Whether to return primitive unit cells. Defaults to False.
+            symmetrized (bool): Whether to return SymmetrizedStructures, see parse_structures.
+            check_occu (bool): Whether to check site for unphysical occupancy > 1.
+            on_error ("ignore" | "warn" | "raise"): What to do in case of KeyError
+                or ValueError while parsing a data block. Defaults to "warn".
+            **kwargs: Passed to CifParser, e.g. occupancy_tolerance or site_tolerance.
+
+        Yields:
+            Structure: For each data block containing a structure.
+        """
+        if primitive and symmetrized:
+            raise ValueError(
+                "Using both 'primitive' and 'symmetrized' arguments is not currently supported "
+                "since unexpected behavior might result."
+            )
+
+        n_structures = 0
+        with zopen(filename, mode="rt", errors="replace") as file:
+            for idx, block_str in enumerate(CifFile._iter_block_strs(file), start=1):
+                parser = cls.from_str(block_str, **kwargs)
+                for struct in parser._iter_structures(primitive, symmetrized, check_occu, on_error, first_section=idx):
+                    n_structures += 1
+                    yield struct
+
+        if not n_structures:
             raise ValueError("Invalid CIF file with no structures!")
-        return structures
 
     @deprecated(
         parse_structures,
@@ -1720,3 +1894,199 @@ class CifWriter:
         """Write the CIF file."""
         with zopen(filename, mode=mode) as file:
             file.write(str(self))
+
+
+def iter_cif_sources(path: PathLike) -> Iterator[tuple[str, str | None, str | None]]:
+    """Find the CIFs in a directory tree, tar archive or single file.
+
+    Args:
+        path (PathLike): Directory (searched recursively for *.cif and *.mcif files,
+            optionally compressed), tar archive (optionally compressed) or CIF file.
+
+    Yields:
+        tuple[str, str | None, str | None]: Name of the CIF, its content and an error
+            message if it could not be read. The content is None for files on disk,
+            which are read lazily by the consumer, and for CIFs that could not be read.
+    """
+    path = Path(path)
+    if path.is_dir():
+        for file_path in sorted(path.rglob("*")):
+            if file_path.is_file() and _is_cif_filename(file_path.name):
+                yield str(file_path), None, None
+        return
+
+    try:
+        is_tarfile = tarfile.is_tarfile(path)
+    except OSError as exc:
+        yield str(path), None, f"{type(exc).__name__}: {exc}"
+        return
+
+    if not is_tarfile:
+        yield str(path), None, None
+        return
+
+    try:
+        with tarfile.open(path) as tar:
+            for member in tar:
+                if member.isfile() and _is_cif_filename(member.name):
+                    name = f"{path}:{member.name}"
+                    try:
+                        content = tar.extractfile(member).read()  # type: ignore[union-attr]
+                        decompress = _DECOMPRESSORS.get(Path(member.name).suffix.lower())
+                        if decompress is not None:
+                            content = decompress(content)
+                    except _READ_ERRORS as exc:
+                        yield name, None, f"{type(exc).__name__}: {exc}"
+                    else:
+                        yield name, content.decode(errors="replace"), None
+    except (tarfile.TarError, *_READ_ERRORS) as exc:
+        yield str(path), None, f"{type(exc).__name__}: {exc}"
+
+
+_DECOMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    ".gz": gzip.decompress,
+    ".bz2": bz2.decompress,
+    ".xz": lzma.decompress,
+    ".lzma": lzma.decompress,
+}
+
+
+# Errors raised when reading a corrupt or truncated file, possibly compressed
+_READ_ERRORS: tuple[type[Exception], ...] = (OSError, EOFError, lzma.LZMAError, zlib.error)
+
+
+def _is_cif_filename(filename: str) -> bool:
+    """Whether a filename looks like a CIF, optionally compressed in a format of _DECOMPRESSORS."""
+    return re.search(r"\.m?cif(\.(gz|bz2|xz|lzma))?$", filename, flags=re.IGNORECASE) is not None
+
+
+def _parse_cif_source(
+    source: tuple[str, str | None, str | None],
+    parser_kwargs: dict[str, Any],
+    parse_kwargs: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Parse one CIF into records for convert_cifs. Must be a module-level
+    function so it can be pickled for multiprocessing.
+    """
+    name, content, read_error = source
+    if read_error is not None:
+        return [{"source": name, "index": None, "structure": None, "warnings": [], "error": read_error}]
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        parser = None
+        try:
+            if content is None:
+                parser = CifParser(name, **parser_kwargs)
+            else:
+                parser = CifParser.from_str(content, **parser_kwargs)
+            structures = parser.parse_structures(on_error="ignore", **parse_kwargs)
+            error = None
+        except Exception as exc:
+            structures = []
+            error = f"{type(exc).__name__}: {exc}"
+
+    msgs = [*(parser.warnings if parser else []), *(str(warning.message) for warning in caught_warnings)]
+    file_warnings = list(dict.fromkeys(msgs))
+    if error is not None:
+        return [{"source": name, "index": None, "structure": None, "warnings": file_warnings, "error": error}]
+    return [
+        {"source": name, "index": idx, "structure": struct.as_dict(), "warnings": file_warnings, "error": None}
+        for idx, struct in enumerate(structures)
+    ]
+
+
+def convert_cifs(
+    paths: PathLike | Sequence[PathLike],
+    filename: PathLike,
+    ncores: int | None = None,
+    chunksize: int = 16,
+    row_group_size: int = 10_000,
+    primitive: bool = False,
+    symmetrized: bool = False,
+    check_occu: bool = True,
+    **kwargs,
+) -> dict[str, Any]:
+    """Convert many CIFs to structures in parallel and write them to a structure store.
+
+    Each structure is written as one record with keys "source" (the CIF it was parsed
+    from), "index" (of the structure within the CIF), "structure" (Structure.as_dict()),
+    "warnings" (issued while parsing the CIF) and "error" (None). CIFs that could not
+    be read or parsed are recorded with the error message and a None structure.
+
+    Args:
+        paths (PathLike | Sequence[PathLike]): Directory trees, tar archives or CIF
+            files, see iter_cif_sources.
+        filename (PathLike): Output file. JSON lines (*.jsonl, optionally compressed)
+            are written incrementally; Parquet (*.parquet) requires pyarrow, is written
+            in row groups and stores structures as JSON strings.
+        ncores (int | None): Number of processes. Defaults to None, which uses all
+            CPUs. Use 1 to parse serially.
+        chunksize (int): Number of CIFs sent to a process at once. Defaults to 16.
+        row_group_size (int): Number of records per Parquet row group. Defaults to 10000.
+        primitive (bool): Whether to return primitive unit cells. Defaults to False.
+        symmetrized (bool): Whether to return SymmetrizedStructures.
+        check_occu (bool): Whether to check sites for unphysical occupancy > 1.
+        **kwargs: Passed to CifParser, e.g. occupancy_tolerance or site_tolerance.
+
+    Returns:
+        dict: Summary with the number of files, structures, files with warnings and
+            errors, elapsed time in seconds and throughput in files per second.
+    """
+    if isinstance(paths, str | Path):
+        paths = [paths]
+    sources = chain.from_iterable(iter_cif_sources(path) for path in paths)
+    parse_cif = partial(
+        _parse_cif_source,
+        parser_kwargs=kwargs,
+        parse_kwargs={"primitive": primitive, "symmetrized": symmetrized, "check_occu": check_occu},
+    )
+
+    is_parquet = str(filename).endswith(".parquet")
+    row_group: list[dict[str, Any]] = []
+    summary = dict.fromkeys(("n_files", "n_structures", "n_files_with_warnings", "n_errors"), 0)
+    start = time.perf_counter()
+
+    with contextlib.ExitStack() as stack:
+        if ncores == 1:
+            results: Iterator[list[dict[str, Any]]] = map(parse_cif, sources)
+        else:
+            pool = stack.enter_context(Pool(ncores))
+            results = pool.imap(parse_cif, sources, chunksize=chunksize)
+        if is_parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            schema = pa.schema(
+                [
+                    ("source", pa.string()),
+                    ("index", pa.int64()),
+                    ("structure", pa.string()),
+                    ("warnings", pa.list_(pa.string())),
+                    ("error", pa.string()),
+                ]
+            )
+            writer = stack.enter_context(pq.ParquetWriter(str(filename), schema))
+        else:
+            file = stack.enter_context(zopen(filename, mode="wt"))
+
+        for records in results:
+            summary["n_files"] += 1
+            summary["n_errors"] += records[0]["error"] is not None
+            summary["n_files_with_warnings"] += bool(records[0]["warnings"])
+            summary["n_structures"] += sum(record["structure"] is not None for record in records)
+            for record in records:
+                if is_parquet:
+                    if record["structure"] is not None:
+                        record["structure"] = json.dumps(record["structure"], cls=MontyEncoder)
+                    row_group.append(record)
+                else:
+                    file.write(json.dumps(record, cls=MontyEncoder) + "\n")
+            if len(row_group) >= row_group_size:
+                writer.write_table(pa.Table.from_pylist(row_group, schema=schema))
+                row_group = []
+
+        if row_group:
+            writer.write_table(pa.Table.from_pylist(row_group, schema=schema))
+
+    elapsed = time.perf_counter() - start
+    return {**summary, "time": elapsed, "files_per_second": summary["n_files"] / elapsed if elapsed else 0.0}
@@ -0,0 +1,437 @@
+"""Compact binary serialization of Structures, Molecules, Trajectories and
+ComputedStructureEntries based on the NumPy npz container.
+
+Unlike the MSONable dict / JSON round trip, which creates a dict per site with
+nested species lists, objects are stored column-wise: the coordinates of all
+sites of all objects are concatenated into a single array, each site refers to
+an entry in a table of unique species by index, and numeric site properties are
+stored as arrays. Only the remaining, non-columnar information (charges,
+structure properties, entry data, ...) is stored as JSON. This makes it cheap to
+dump and load large lists of objects, e.g. an entry store::
+
+    from pymatgen.io.npz import dump_many, load_many
+
+    dump_many(entries, "entries.npz")
+    entries = load_many("entries.npz")
+
+Single objects can be converted with the to_bytes() / from_bytes() methods of
+Structure, Molecule, Trajectory and ComputedStructureEntry.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import TYPE_CHECKING
+
+import numpy as np
+from monty.json import MontyDecoder, MontyEncoder
+
+from pymatgen.core.composition import Composition
+from pymatgen.core.lattice import Lattice
+from pymatgen.core.periodic_table import DummySpecies, Element, Species
+from pymatgen.core.sites import Site
+from pymatgen.core.structure import IMolecule, IStructure, SiteCollection
+from pymatgen.core.trajectory import Trajectory
+from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any
+
+    from pymatgen.util.typing import PathLike
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+FORMAT_VERSION = 1
+
+
+def dump_many(
+    objects: Sequence[IStructure | IMolecule | Trajectory | ComputedStructureEntry],
+    filename: PathLike | None = None,
+    compress: bool = False,
+) -> bytes | None:
+    """Serialize a list of objects of the same kind column-wise in npz format.
+
+    Args:
+        objects: Structures, Molecules, Trajectories or ComputedStructureEntries.
+            Mutable and immutable variants (e.g. Structure and IStructure) can be
+            mixed, but all objects must be of the same kind.
+        filename: File to write to. If None, the serialized bytes are returned.
+        compress: Whether to zip-compress the arrays. Defaults to False, which is
+            faster to write and read.
+
+    Returns:
+        bytes | None: The serialized data if no filename is given.
+    """
+    kinds = {_get_kind(obj) for obj in objects}
+    if len(kinds) > 1:
+        raise TypeError(f"Cannot serialize a mix of {sorted(kinds)} in one batch.")
+    kind = kinds.pop() if kinds else "structure"
+
+    arrays, metadata = _ENCODERS[kind](objects)
+    metadata |= {"format_version": FORMAT_VERSION, "kind": kind, "n_objects": len(objects)}
+    arrays["metadata"] = np.frombuffer(json.dumps(metadata, cls=MontyEncoder).encode(), dtype=np.uint8)
+
+    savez = np.savez_compressed if compress else np.savez
+    if filename is None:
+        buffer = io.BytesIO()
+        savez(buffer, **arrays)
+        return buffer.getvalue()
+    # Write to an open file, since numpy appends .npz to other file names
+    with open(filename, mode="wb") as file:
+        savez(file, **arrays)
+    return None
+
+
+def load_many(data: bytes | PathLike, cls: type | None = None) -> list:
+    """Load a list of objects written by dump_many.
+
+    Args:
+        data (bytes | PathLike): Serialized data or name of the file to read.
+        cls (type): Class to decode the objects into, e.g. Structure to get mutable
+            structures from serialized IStructures. Defaults to None, which
+            restores the class each object was serialized from.
+
+    Returns:
+        list of Structures, Molecules, Trajectories or ComputedStructureEntries.
+    """
+    with np.load(io.BytesIO(data) if isinstance(data, bytes) else data, allow_pickle=False) as npz:
+        arrays = {key: npz[key] for key in npz.files}
+    metadata = json.loads(arrays.pop("metadata").tobytes().decode())
+    if metadata["format_version"] > FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {metadata['format_version']}, expected <= {FORMAT_VERSION}")
+    return _DECODERS[metadata["kind"]](arrays, metadata, cls)
+
+
+def to_bytes(obj: IStructure | IMolecule | Trajectory | ComputedStructureEntry, compress: bool = False) -> bytes:
+    """Serialize a single object in npz format. See dump_many."""
+    return dump_many([obj], compress=compress)  # type: ignore[return-value]
+
+
+def from_bytes(data: bytes, cls: type | None = None) -> Any:
+    """Load a single object serialized with to_bytes. See load_many."""
+    objects = load_many(data, cls=cls)
+    if len(objects) != 1:
+        raise ValueError(f"Expected data for a single object, got {len(objects)}")
+    return objects[0]
+
+
+def _get_kind(obj: Any) -> str:
+    if isinstance(obj, IStructure):
+        return "structure"
+    if isinstance(obj, IMolecule):
+        return "molecule"
+    if isinstance(obj, Trajectory):
+        return "trajectory"
+    if isinstance(obj, ComputedStructureEntry):
+        return "entry"
+    raise TypeError(f"Cannot serialize {type(obj).__name__} in npz format.")
+
+
+def _class_path(obj: Any) -> list[str]:
+    return [type(obj).__module__, type(obj).__name__]
+
+
+def _load_class(path: list[str]) -> type:
+    module_name, class_name = path
+    return getattr(__import__(module_name, fromlist=[class_name]), class_name)
+
+
+def _split(array: np.ndarray, counts: Sequence[int] | np.ndarray) -> list[np.ndarray]:
+    """Split a concatenated column back into per-object chunks."""
+    return np.split(array, np.cumsum(counts)[:-1])
+
+
+def _encode_composition(comp: Composition) -> list[dict]:
+    """Species and occupancies in the same format as Site.as_dict."""
+    species = []
+    for spec, occu in comp.items():
+        spec_dct = spec.as_dict()
+        del spec_dct["@module"]
+        del spec_dct["@class"]
+        spec_dct["occu"] = occu
+        species.append(spec_dct)
+    return species
+
+
+def _decode_composition(species: list[dict]) -> Composition:
+    """Inverse of _encode_composition, mirroring Site.from_dict."""
+    atoms_n_occu = {}
+    for sp_occu in species:
+        if "oxidation_state" in sp_occu and Element.is_valid_symbol(sp_occu["element"]):
+            sp: Species | DummySpecies | Element = Species.from_dict(sp_occu)
+        elif "oxidation_state" in sp_occu:
+            sp = DummySpecies.from_dict(sp_occu)
+        else:
+            sp = Element(sp_occu["element"])
+        atoms_n_occu[sp] = sp_occu["occu"]
+    return Composition(atoms_n_occu)
+
+
+def _encode_site_collections(collections: Sequence[SiteCollection]) -> tuple[dict[str, np.ndarray], dict]:
+    """Encode the sites of a list of Structures or Molecules column-wise.
+
+    Species are stored as indices into a table of unique compositions, labels only
+    if any of them differs from the default species string and site properties as
+    numeric arrays where all objects have numeric values of the same dtype and shape
+    for a property. All other site properties are stored as JSON per object.
+    """
+    comp_idx_by_id: dict[int, int] = {}
+    # exact keys, as Composition equality is tolerance-based
+    comp_idx: dict[tuple, int] = {}
+    species_table: list[list[dict]] = []
+    species_strings: list[str] = []
+    species_index: list[int] = []
+    labels: list[str | None] = []
+    site_props = [coll.site_properties for coll in collections]
+
+    for coll in collections:
+        for comp in coll.species_and_occu:
+            if (idx := comp_idx_by_id.get(id(comp))) is None:
+                if (idx := comp_idx.get(key := tuple(comp.items()))) is None:
+                    idx = comp_idx[key] = len(species_table)
+                    species_table.append(_encode_composition(comp))
+                    species_strings.append(Site(comp, (0, 0, 0), skip_checks=True).species_string)
+                comp_idx_by_id[id(comp)] = idx
+            species_index.append(idx)
+        labels.extend(coll.labels)
+    has_custom_labels = any(label != species_strings[idx] for label, idx in zip(labels, species_index, strict=True))
+
+    arrays: dict[str, np.ndarray] = {
+        "n_sites": np.array([len(coll) for coll in collections], dtype=np.int64),
+        "species_index": np.array(species_index, dtype=np.int32),
+    }
+
+    columnar_keys = []
+    for key in sorted({key for props in site_props for key in props}):
+        try:
+            columns = [np.asarray(props[key]) for props in site_props]
+        except (KeyError, ValueError):
+            continue
+        # a common dtype is required so that e.g. integer values are not restored as floats
+        if (
+            all(col.dtype.kind in "biuf" for col in columns)
+            and len({col.dtype for col in columns}) == 1
+            and len({col.shape[1:] for col in columns}) == 1
+        ):
+            columnar_keys.append(key)
+            arrays[f"site_properties/{key}"] = np.concatenate(columns)
+
+    metadata = {
+        "species_table": species_table,
+        "labels": labels if has_custom_labels else None,
+        "site_properties": [{k: v for k, v in props.items() if k not in columnar_keys} for props in site_props],
+        "columnar_site_properties": columnar_keys,
+    }
+    return arrays, metadata
+
+
+def _decode_site_collections(arrays: dict[str, np.ndarray], metadata: dict) -> list[dict[str, Any]]:
+    """Decode species, labels and site properties per object. Unique species are
+    decoded once and shared between sites and objects.
+    """
+    n_sites = arrays["n_sites"]
+    compositions = [_decode_composition(species) for species in metadata["species_table"]]
+    species_index = arrays["species_index"].tolist()
+    labels = metadata["labels"]
+    site_props = MontyDecoder().process_decoded(metadata["site_properties"])
+    columns = {key: _split(arrays[f"site_properties/{key}"], n_sites) for key in metadata["columnar_site_properties"]}
+
+    decoded = []
+    start = 0
+    for idx, count in enumerate(n_sites.tolist()):
+        end = start + count
+        props = site_props[idx]
+        for key, column in columns.items():
+            props[key] = column[idx].tolist()
+        decoded.append(
+            {
+                "species": [compositions[sp_idx] for sp_idx in species_index[start:end]],
+                "labels": labels[start:end] if labels is not None else None,
+                "site_properties": props,
+            }
+        )
+        start = end
+    return decoded
+
+
+def _encode_structures(structures: Sequence[IStructure]) -> tuple[dict[str, np.ndarray], dict]:
+    arrays, metadata = _encode_site_collections(structures)
+    arrays |= {
+        "lattices": np.array([struct.lattice.matrix for struct in structures], dtype=np.float64).reshape(-1, 3, 3),
+        "pbc": np.array([struct.pbc for struct in structures], dtype=bool).reshape(-1, 3),
+        "frac_coords": np.concatenate([struct.frac_coords for struct in structures] or [np.empty((0, 3))]),
+    }
+    metadata["objects"] = [
+        # the explicitly set charge, as the formal charge is recomputed on the fly
+        {"class": _class_path(struct), "charge": struct._charge, "properties": struct.properties}
+        for struct in structures
+    ]
+    return arrays, metadata
+
+
+def _decode_structures(arrays: dict[str, np.ndarray], metadata: dict, cls: type | None) -> list[IStructure]:
+    frac_coords = _split(arrays["frac_coords"], arrays["n_sites"])
+    objects = MontyDecoder().process_decoded(metadata["objects"])
+    structures = []
+    for idx, sites in enumerate(_decode_site_collections(arrays, metadata)):
+        obj = objects[idx]
+        struct_cls = cls or _load_class(obj["class"])
+        lattice = Lattice(arrays["lattices"][idx], pbc=tuple(arrays["pbc"][idx].tolist()))
+        structures.append(
+            struct_cls(
+                lattice,
+                sites["species"],
+                frac_coords[idx],
+                charge=obj["charge"],
+                site_properties=sites["site_properties"],
+                labels=sites["labels"],
+                properties=obj["properties"],
+            )
+        )
+    return structures
+
+
+def _encode_molecules(molecules: Sequence[IMolecule]) -> tuple[dict[str, np.ndarray], dict]:
+    arrays, metadata = _encode_site_collections(molecules)
+    arrays["coords"] = np.concatenate([mol.cart_coords for mol in molecules] or [np.empty((0, 3))])
+    metadata["objects"] = [
+        {
+            "class": _class_path(mol),
+            "charge": mol.charge,
+            "spin_multiplicity": mol.spin_multiplicity,
+            "charge_spin_check": mol._charge_spin_check,
+            "properties": mol.properties,
+        }
+        for mol in molecules
+    ]
+    return arrays, metadata
+
+
+def _decode_molecules(arrays: dict[str, np.ndarray], metadata: dict, cls: type | None) -> list[IMolecule]:
+    coords = _split(arrays["coords"], arrays["n_sites"])
+    objects = MontyDecoder().process_decoded(metadata["objects"])
+    molecules = []
+    for idx, sites in enumerate(_decode_site_collections(arrays, metadata)):
+        obj = objects[idx]
+        mol_cls = cls or _load_class(obj["class"])
+        molecules.append(
+            mol_cls(
+                sites["species"],
+                coords[idx],
+                charge=obj["charge"],
+                spin_multiplicity=obj["spin_multiplicity"],
+                site_properties=sites["site_properties"],
+                labels=sites["labels"],
+                charge_spin_check=obj["charge_spin_check"],
+                properties=obj["properties"],
+            )
+        )
+    return molecules
+
+
+def _encode_entries(entries: Sequence[ComputedStructureEntry]) -> tuple[dict[str, np.ndarray], dict]:
+    arrays, metadata = _encode_structures([entry.structure for entry in entries])
+    metadata["entries"] = []
+    for entry in entries:
+        if type(entry).as_dict is ComputedStructureEntry.as_dict:
+            # skip the expensive per-site structure dict
+            dct = ComputedEntry.as_dict(entry)
+        else:
+            dct = entry.as_dict()
+            del dct["structure"]
+        metadata["entries"].append(dct)
+    return arrays, metadata
+
+
+def _decode_entries(arrays: dict[str, np.ndarray], metadata: dict, cls: type | None) -> list[ComputedStructureEntry]:
+    structures = _decode_structures(arrays, metadata, None)
+    entries = []
+    for dct, struct in zip(metadata["entries"], structures, strict=True):
+        entry_cls = cls or _load_class([dct["@module"], dct["@class"]])
+        entries.append(entry_cls.from_dict({**dct, "structure": struct}))
+    return entries
+
+
+def _encode_trajectories(trajectories: Sequence[Trajectory]) -> tuple[dict[str, np.ndarray], dict]:
+    """Frames of all trajectories are concatenated. Lattices and base positions
+    are stored with per-trajectory counts, as they may be absent or constant.
+    """
+    lattices = [
+        np.empty((0, 3, 3)) if traj.lattice is None else np.reshape(traj.lattice, (-1, 3, 3)) for traj in trajectories
+    ]
+    base_positions = [
+        np.empty((0, 3)) if traj.base_positions is None else np.asarray(traj.base_positions, dtype=np.float64)
+        for traj in trajectories
+    ]
+    arrays = {
+        "n_frames": np.array([len(traj.coords) for traj in trajectories], dtype=np.int64),
+        "n_sites": np.array([len(traj.species) for traj in trajectories], dtype=np.int64),
+        "coords": np.concatenate([traj.coords.reshape(-1, 3) for traj in trajectories] or [np.empty((0, 3))]),
+        "n_lattices": np.array([len(lattice) for lattice in lattices], dtype=np.int64),
+        "lattices": np.concatenate(lattices or [np.empty((0, 3, 3))]),
+        "n_base_positions": np.array([len(pos) for pos in base_positions], dtype=np.int64),
+        "base_positions": np.concatenate(base_positions or [np.empty((0, 3))]),
+    }
+    metadata = {
+        "objects": [
+            {
+                "class": _class_path(traj),
+                "species": traj.species,
+                "constant_lattice_shape": traj.lattice is not None and np.shape(traj.lattice) == (3, 3),
+                "charge": traj.charge,
+                "spin_multiplicity": traj.spin_multiplicity,
+                "site_properties": traj.site_properties,
+                "frame_properties": traj.frame_properties,
+                "constant_lattice": traj.constant_lattice,
+                "time_step": traj.time_step,
+                "coords_are_displacement": traj.coords_are_displacement,
+            }
+            for traj in trajectories
+        ]
+    }
+    return arrays, metadata
+
+
+def _decode_trajectories(arrays: dict[str, np.ndarray], metadata: dict, cls: type | None) -> list[Trajectory]:
+    n_frames, n_sites = arrays["n_frames"], arrays["n_sites"]
+    coords = _split(arrays["coords"], n_frames * n_sites)
+    lattices = _split(arrays["lattices"], arrays["n_lattices"])
+    base_positions = _split(arrays["base_positions"], arrays["n_base_positions"])
+    objects = MontyDecoder().process_decoded(metadata["objects"])
+
+    trajectories = []
+    for idx, obj in enumerate(objects):
+        lattice: np.ndarray | None = lattices[idx]
+        if obj.pop("constant_lattice_shape"):
+            lattice = lattice[0]  # type: ignore[index]
+        elif not len(lattice):  # type: ignore[arg-type]
+            lattice = None
+        traj_cls = cls or _load_class(obj["class"])
+        del obj["class"]
+        trajectories.append(
+            traj_cls(
+                coords=coords[idx].reshape(n_frames[idx], n_sites[idx], 3),
+                lattice=lattice,
+                base_positions=base_positions[idx] if len(base_positions[idx]) else None,
+                **obj,
+            )
+        )
+    return trajectories
+
+
+_ENCODERS = {
+    "structure": _encode_structures,
+    "molecule": _encode_molecules,
+    "trajectory": _encode_trajectories,
+    "entry": _encode_entries,
+}
+
+_DECODERS = {
+    "structure": _decode_structures,
+    "molecule": _decode_molecules,
+    "trajectory": _decode_trajectories,
+    "entry": _decode_entries,
+}
@@ -11,32 +11,34 @@ v3.0 - pymatgen no longer ships with spglib. Instead, spglib (the python
 from __future__ import annotations
 
 import copy
+import hashlib
 import itertools
 import logging
 import math
 import warnings
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Sequence
 from fractions import Fraction
-from functools import lru_cache
 from math import cos, sin
 from typing import TYPE_CHECKING
 
 import numpy as np
-import scipy.cluster
 import spglib
+from joblib import Parallel, delayed
+from scipy.spatial import KDTree
 
+from pymatgen.core import SETTINGS
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.operations import SymmOp
 from pymatgen.core.structure import Molecule, PeriodicSite, Structure
 from pymatgen.symmetry.structure import SymmetrizedStructure
-from pymatgen.util.coord import find_in_coord_list, pbc_diff
 from pymatgen.util.due import Doi, due
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
     from typing import Any, Literal
 
-    from numpy.typing import NDArray
+    from numpy.typing import ArrayLike, NDArray
     from spglib import SpglibDataset
 
     from pymatgen.core import Element, Species
@@ -62,17 +64,190 @@ class SymmetryUndetermined(ValueError):
     """
 
 
-@lru_cache(maxsize=32)
+class SpglibCache:
+    """Least recently used cache of spglib results, shared by all SpacegroupAnalyzers
+    so that analyzing the same structure from several places (get_space_group_info,
+    SymmetrizedStructure, HighSymmKpath, ...) calls spglib once per tolerance.
+
+    Keys contain a hash of the spglib cell instead of the cell itself, so entries
+    are small and cheap to compare. The default size of 1024 entries can be set
+    with PMG_SYMMETRY_CACHE_SIZE in .pmgrc.yaml or by setting maxsize of
+    SPGLIB_CACHE. A maxsize of 0 disables caching.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Args:
+            maxsize (int): Maximum number of cached results. Defaults to 1024.
+        """
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    @staticmethod
+    def get_key(kind: str, cell: tuple, symprec: float | None, angle_tolerance: float) -> tuple:
+        """Get the cache key of a spglib result.
+
+        Args:
+            kind (str): Name of the result, e.g. "dataset".
+            cell (tuple): spglib cell of (lattice, frac_coords, numbers[, magmoms]).
+            symprec (float): Tolerance for symmetry finding.
+            angle_tolerance (float): Angle tolerance for symmetry finding.
+
+        Returns:
+            tuple: Hashable key.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in cell:
+            array = np.ascontiguousarray(part, dtype=float)
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+        return kind, digest.hexdigest(), symprec, angle_tolerance
+
+    def get(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Get a cached result, computing and caching it with func if missing.
+
+        Args:
+            key (Hashable): Cache key from get_key.
+            func (Callable): Function without arguments that computes the result.
+
+        Returns:
+            The cached or computed result.
+        """
+        if key in self._data:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+        self.misses += 1
+        value = func()
+        self.set(key, value)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a result, evicting the least recently used results beyond maxsize."""
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the statistics."""
+        self._data.clear()
+        self.hits = self.misses = 0
+
+
+SPGLIB_CACHE = SpglibCache(int(SETTINGS.get("PMG_SYMMETRY_CACHE_SIZE", 1024)))
+
+
 def _get_symmetry_dataset(cell, symprec, angle_tolerance):
     """Simple wrapper to cache results of spglib.get_symmetry_dataset since this call is
     expensive.
     """
-    dataset = spglib.get_symmetry_dataset(cell, symprec=symprec, angle_tolerance=angle_tolerance)
+    dataset = SPGLIB_CACHE.get(
+        SPGLIB_CACHE.get_key("dataset", cell, symprec, angle_tolerance),
+        lambda: spglib.get_symmetry_dataset(cell, symprec=symprec, angle_tolerance=angle_tolerance),
+    )
     if dataset is None:
         raise SymmetryUndetermined
     return dataset
 
 
+def _get_spglib_cell(structure: Structure) -> tuple[tuple, list[Element | Species]]:
+    """Get the spglib cell of a structure and the species of its atom types.
+
+    Sites with the same species share an atom type. Magnetic moments from the
+    magmom site property or the spin of the species are added to the cell if
+    present.
+    """
+    unique_species: list[Element | Species] = []
+    zs = []
+    for species, group in itertools.groupby(structure, key=lambda s: s.species):
+        if species in unique_species:
+            ind = unique_species.index(species)
+            zs.extend([ind + 1] * len(tuple(group)))
+        else:
+            unique_species.append(species)
+            zs.extend([len(unique_species)] * len(tuple(group)))
+
+    has_explicit_magmoms = "magmom" in structure.site_properties or any(
+        getattr(specie, "spin", None) is not None for specie in structure.types_of_species
+    )
+
+    magmoms = []
+    for site in structure if has_explicit_magmoms else ():
+        if hasattr(site, "magmom"):
+            magmoms.append(site.magmom)
+        elif site.is_ordered and getattr(site.specie, "spin", None) is not None:
+            magmoms.append(site.specie.spin)
+        else:  # if any site has a magmom, all sites must have magmoms
+            magmoms.append(0)
+
+    cell: tuple[Any, ...] = (
+        tuple(map(tuple, structure.lattice.matrix.tolist())),
+        tuple(map(tuple, structure.frac_coords.tolist())),
+        tuple(zs),
+    )
+    if len(magmoms) > 0:
+        cell = (*cell, tuple(map(tuple, magmoms) if isinstance(magmoms[0], Sequence) else magmoms))
+    # if no magmoms given do not add to cell
+    return cell, unique_species
+
+
+def batch_symmetry_analysis(
+    structures: Sequence[Structure],
+    symprec: float | None = 0.01,
+    angle_tolerance: float = 5,
+    n_jobs: int = 1,
+) -> list[SpacegroupAnalyzer]:
+    """Get SpacegroupAnalyzers of many structures, calling spglib once for each
+    distinct structure that is not in SPGLIB_CACHE yet, in parallel.
+
+    Args:
+        structures (Sequence[Structure]): Structures to find the symmetry of.
+        symprec (float): Tolerance for symmetry finding. Defaults to 0.01.
+        angle_tolerance (float): Angle tolerance for symmetry finding. Defaults to 5 degrees.
+        n_jobs (int): Number of processes to run spglib in, -1 for all CPUs.
+            Defaults to 1.
+
+    Raises:
+        SymmetryUndetermined: If the symmetry of any structure cannot be determined.
+
+    Returns:
+        list[SpacegroupAnalyzer]: Analyzer of each structure.
+    """
+    cells = [_get_spglib_cell(structure)[0] for structure in structures]
+    keys = [SPGLIB_CACHE.get_key("dataset", cell, symprec, angle_tolerance) for cell in cells]
+    missing = {key: cell for key, cell in zip(keys, cells, strict=True) if key not in SPGLIB_CACHE}
+
+    if n_jobs == 1:
+        results = [
+            spglib.get_symmetry_dataset(cell, symprec=symprec, angle_tolerance=angle_tolerance)
+            for cell in missing.values()
+        ]
+    else:
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(spglib.get_symmetry_dataset)(cell, symprec=symprec, angle_tolerance=angle_tolerance)
+            for cell in missing.values()
+        )
+    datasets = dict(zip(missing, results, strict=True))
+
+    analyzers = []
+    for structure, key in zip(structures, keys, strict=True):
+        # Insert right before use, so results are not evicted by a cache smaller than the batch
+        if key in datasets:
+            SPGLIB_CACHE.set(key, datasets[key])
+        analyzers.append(SpacegroupAnalyzer(structure, symprec=symprec, angle_tolerance=angle_tolerance))
+    return analyzers
+
+
 class SpacegroupAnalyzer:
     """Takes a pymatgen Structure object and a symprec.
 
@@ -101,45 +276,8 @@ class SpacegroupAnalyzer:
         self._angle_tol = angle_tolerance
         self._structure = structure
         self._site_props = structure.site_properties
-        unique_species: list[Element | Species] = []
-        zs = []
-        for species, group in itertools.groupby(structure, key=lambda s: s.species):
-            if species in unique_species:
-                ind = unique_species.index(species)
-                zs.extend([ind + 1] * len(tuple(group)))
-            else:
-                unique_species.append(species)
-                zs.extend([len(unique_species)] * len(tuple(group)))
-
-        has_explicit_magmoms = "magmom" in structure.site_properties or any(
-            getattr(specie, "spin", None) is not None for specie in structure.types_of_species
-        )
-
-        magmoms = []
-        for site in structure:
-            if hasattr(site, "magmom"):
-                magmoms.append(site.magmom)
-            elif site.is_ordered and getattr(site.specie, "spin", None) is not None:
-                magmoms.append(site.specie.spin)
-            elif has_explicit_magmoms:  # if any site has a magmom, all sites must have magmoms
-                magmoms.append(0)
-
-        self._unique_species = unique_species
-        self._numbers = zs
-
-        if len(magmoms) > 0:
-            self._cell: tuple[Any, ...] = (
-                tuple(map(tuple, structure.lattice.matrix.tolist())),
-                tuple(map(tuple, structure.frac_coords.tolist())),
-                tuple(zs),
-                tuple(map(tuple, magmoms) if isinstance(magmoms[0], Sequence) else magmoms),
-            )
-        else:  # if no magmoms given do not add to cell
-            self._cell = (
-                tuple(map(tuple, structure.lattice.matrix.tolist())),
-                tuple(map(tuple, structure.frac_coords.tolist())),
-                tuple(zs),
-            )
+        self._cell, self._unique_species = _get_spglib_cell(structure)
+        self._numbers = list(self._cell[2])
 
         self._space_group_data = _get_symmetry_dataset(self._cell, symprec, angle_tolerance)
 
@@ -266,13 +404,28 @@ class SpacegroupAnalyzer:
             "translations" gives the numpy float64 array of the translation
             vectors in scaled positions.
         """
-        dct = spglib.get_symmetry(self._cell, symprec=self._symprec, angle_tolerance=self._angle_tol)
-        if dct is None:
+        key = SPGLIB_CACHE.get_key("symmetry", self._cell, self._symprec, self._angle_tol)
+        symmetry = SPGLIB_CACHE.get(key, self._calc_symmetry)
+        if symmetry is None:
             symprec = self._symprec
             raise ValueError(
                 f"Symmetry detection failed for structure with formula {self._structure.formula}. "
                 f"Try setting {symprec=} to a different value."
             )
+        return symmetry
+
+    def _calc_symmetry(self) -> tuple[NDArray, NDArray] | None:
+        """Get the symmetry operations from spglib, or None if detection failed."""
+        if len(self._cell) == 3:
+            # Without magmoms, spglib.get_symmetry returns the operations of the dataset
+            dct = {
+                "rotations": self._space_group_data.rotations,
+                "translations": self._space_group_data.translations,
+            }
+        else:
+            dct = spglib.get_symmetry(self._cell, symprec=self._symprec, angle_tolerance=self._angle_tol)
+        if dct is None:
+            return None
         # Sometimes spglib returns small translation vectors, e.g.
         # [1e-4, 2e-4, 1e-4]
         # (these are in fractional coordinates, so should be small denominator
@@ -426,7 +579,7 @@ class SpacegroupAnalyzer:
             in fractional coordinates
         """
         shift = np.array([1 if i else 0 for i in is_shift])
-        mapping, grid = spglib.get_ir_reciprocal_mesh(np.array(mesh), self._cell, is_shift=shift, symprec=self._symprec)
+        mapping, grid = self._get_ir_reciprocal_mesh(mesh, shift)
 
         results = []
         for idx, count in zip(*np.unique(mapping, return_counts=True), strict=True):
@@ -453,11 +606,24 @@ class SpacegroupAnalyzer:
             that maps all the reducible kpoints from to irreducible ones.
         """
         shift = np.array([1 if i else 0 for i in is_shift])
-        mapping, grid = spglib.get_ir_reciprocal_mesh(np.array(mesh), self._cell, is_shift=shift, symprec=self._symprec)
+        mapping, grid = self._get_ir_reciprocal_mesh(mesh, shift)
 
         grid_fractional_coords = (grid + shift * (0.5, 0.5, 0.5)) / mesh
 
-        return grid_fractional_coords, mapping
+        return grid_fractional_coords, mapping.copy()
+
+    def _get_ir_reciprocal_mesh(self, mesh: ArrayLike, shift: ArrayLike) -> tuple[NDArray, NDArray]:
+        """Get the (mapping, grid_address) of spglib.get_ir_reciprocal_mesh, cached in
+        SPGLIB_CACHE per structure, mesh and shift so that repeated k-point
+        generation for the same structure does not recompute the irreducible mesh.
+        """
+        mesh = np.array(mesh, dtype=int)
+        shift = np.array(shift, dtype=int)
+        kind = f"ir_mesh {tuple(mesh.tolist())} {tuple(shift.tolist())}"
+        key = SPGLIB_CACHE.get_key(kind, self._cell, self._symprec, self._angle_tol)
+        return SPGLIB_CACHE.get(
+            key, lambda: spglib.get_ir_reciprocal_mesh(mesh, self._cell, is_shift=shift, symprec=self._symprec)
+        )
 
     @cite_conventional_cell_algo
     def get_conventional_to_primitive_transformation_matrix(
@@ -920,39 +1086,37 @@ class SpacegroupAnalyzer:
         Returns:
             List of weights, in the SAME order as kpoints.
         """
-        kpts = np.array(kpoints)
+        kpts = np.array(kpoints, dtype=float).reshape(-1, 3)
         shift = []
         mesh = []
         for idx in range(3):
-            nonzero = [i for i in kpts[:, idx] if abs(i) > 1e-5]
+            nonzero = kpts[np.abs(kpts[:, idx]) > 1e-5, idx]
             if len(nonzero) != len(kpts):
                 # gamma centered
-                if not nonzero:
-                    mesh.append(1)
-                else:
-                    m = np.abs(np.round(1 / np.array(nonzero)))
-                    mesh.append(int(max(m)))
+                mesh.append(int(np.max(np.abs(np.round(1 / nonzero)))) if len(nonzero) else 1)
                 shift.append(0)
             else:
                 # Monk
-                m = np.abs(np.round(0.5 / np.array(nonzero)))
-                mesh.append(int(max(m)))
+                mesh.append(int(np.max(np.abs(np.round(0.5 / nonzero)))))
                 shift.append(1)
 
-        mapping, grid = spglib.get_ir_reciprocal_mesh(np.array(mesh), self._cell, is_shift=shift, symprec=self._symprec)
-        mapping = list(mapping)
-        grid = (np.array(grid) + np.array(shift) * (0.5, 0.5, 0.5)) / mesh
-        weights = []
-        mapped: dict[tuple, int] = defaultdict(int)
-        for kpt in kpoints:
-            for idx, g in enumerate(grid):
-                if np.allclose(pbc_diff(kpt, g), (0, 0, 0), atol=atol):
-                    mapped[tuple(g)] += 1
-                    weights.append(mapping.count(mapping[idx]))
-                    break
-        if (len(mapped) != len(set(mapping))) or any(v != 1 for v in mapped.values()):
+        mapping, grid = self._get_ir_reciprocal_mesh(mesh, shift)
+        mesh_arr, shift_arr = np.array(mesh), np.array(shift)
+
+        # Map each kpoint to its grid address instead of comparing it to every grid point:
+        # a kpoint lies on the grid if kpt * mesh - shift / 2 is integer to within atol * mesh
+        address = kpts * mesh_arr - shift_arr * 0.5
+        rounded = np.round(address)
+        on_grid = np.all(np.abs(address - rounded) <= atol * mesh_arr, axis=1)
+        grid_index = np.full(np.prod(mesh_arr), -1)
+        grid_index[np.ravel_multi_index((np.asarray(grid) % mesh_arr).T, mesh_arr)] = np.arange(len(grid))
+        matched = grid_index[np.ravel_multi_index((rounded[on_grid].astype(int) % mesh_arr).T, mesh_arr)]
+
+        mapped_counts = np.unique(matched, return_counts=True)[1]
+        if len(mapped_counts) != len(np.unique(mapping)) or np.any(mapped_counts != 1):
             raise ValueError("Unable to find 1:1 corresponding between input kpoints and irreducible grid!")
-        return [w / sum(weights) for w in weights]
+        weights = np.bincount(mapping)[mapping[matched]]
+        return list(weights / weights.sum())
 
     def is_laue(self) -> bool:
         """Check if the point group of the structure has Laue symmetry (centrosymmetry)."""
@@ -1014,20 +1178,26 @@ class PointGroupAnalyzer:
             self.sch_symbol: str = "Cs"
 
     def _analyze(self) -> None:
+        # Coordinates, species indices and a KD-tree of the atoms, for testing
+        # symmetry operations on all atoms at once
+        self._coords = self.centered_mol.cart_coords
+        self._tree = KDTree(self._coords)
+        unique_species: list = []
+        species_ids = []
+        for site in self.centered_mol:
+            if site.species not in unique_species:
+                unique_species.append(site.species)
+            species_ids.append(unique_species.index(site.species))
+        self._species_ids = np.array(species_ids)
+
         if len(self.centered_mol) == 1:
             self.sch_symbol = "Kh"
         else:
-            inertia_tensor = np.zeros((3, 3))
-            total_inertia = 0
-            for site in self.centered_mol:
-                c = site.coords
-                wt = site.species.weight
-                for i in range(3):
-                    inertia_tensor[i, i] += wt * (c[(i + 1) % 3] ** 2 + c[(i + 2) % 3] ** 2)
-                for i, j in ((0, 1), (1, 2), (0, 2)):
-                    inertia_tensor[i, j] += -wt * c[i] * c[j]
-                    inertia_tensor[j, i] += -wt * c[j] * c[i]
-                total_inertia += wt * np.dot(c, c)
+            coords = self._coords
+            weights = np.array([site.species.weight for site in self.centered_mol])
+            sq_norms = np.sum(coords**2, axis=1)
+            inertia_tensor = np.sum(weights * sq_norms) * np.eye(3) - np.einsum("i,ij,ik->jk", weights, coords, coords)
+            total_inertia = np.sum(weights * sq_norms)
 
             # Normalize the inertia tensor so that it does not scale with size
             # of the system. This mitigates the problem of choosing a proper
@@ -1170,26 +1340,48 @@ class PointGroupAnalyzer:
             self.symmops.append(SymmOp.reflection(axis))
             mirror_type = "h"
         else:
-            # Iterate through all pairs of atoms to find mirror
-            for s1, s2 in itertools.combinations(self.centered_mol, 2):
-                if s1.species == s2.species:
-                    normal = s1.coords - s2.coords
-                    if np.dot(normal, axis) < self.tol:
-                        op = SymmOp.reflection(normal)
-                        if self.is_valid_op(op):
-                            self.symmops.append(op)
-                            if len(self.rot_sym) > 1:
-                                mirror_type = "d"
-                                for v, _ in self.rot_sym:
-                                    if np.linalg.norm(v - axis) >= self.tol and np.dot(v, normal) < self.tol:
-                                        mirror_type = "v"
-                                        break
-                            else:
+            # Iterate through all pairs of atoms to find mirror. A mirror maps an
+            # atom onto an atom of the same species at the same distance from the
+            # center, so only such pairs can give its normal.
+            norms = np.linalg.norm(self._coords, axis=1)
+            pairs = KDTree(norms[:, None]).query_pairs(np.sqrt(3) * self.tol, output_type="ndarray")
+            pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+            pairs = pairs[self._species_ids[pairs[:, 0]] == self._species_ids[pairs[:, 1]]]
+            normals = self._coords[pairs[:, 0]] - self._coords[pairs[:, 1]]
+            normals = normals[(normals @ axis < self.tol) & (np.linalg.norm(normals, axis=1) > 0)]
+            for normal in self._filter_reflections(normals):
+                op = SymmOp.reflection(normal)
+                if self.is_valid_op(op):
+                    self.symmops.append(op)
+                    if len(self.rot_sym) > 1:
+                        mirror_type = "d"
+                        for v, _ in self.rot_sym:
+                            if np.linalg.norm(v - axis) >= self.tol and np.dot(v, normal) < self.tol:
                                 mirror_type = "v"
-                            break
+                                break
+                    else:
+                        mirror_type = "v"
+                    break
 
         return mirror_type
 
+    def _filter_reflections(self, normals: NDArray, chunk_size: int = 4096) -> Iterator[NDArray]:
+        """Yield the mirror plane normals, in order, for which the first few atoms
+        are mapped onto atoms of the same species. The candidates are screened in
+        chunks with one KD-tree query each, so that finding the first valid mirror
+        does not require screening all of them.
+        """
+        probes = self._coords[:8]
+        probe_species = self._species_ids[: len(probes)]
+        for start in range(0, len(normals), chunk_size):
+            chunk = normals[start : start + chunk_size]
+            units = chunk / np.linalg.norm(chunk, axis=1)[:, None]
+            reflected = probes[None] - 2 * (units @ probes.T)[:, :, None] * units[:, None, :]
+            dists, matches = self._tree.query(reflected, p=np.inf)
+            found = dists < self.tol
+            valid = found & (self._species_ids[np.where(found, matches, 0)] == probe_species)
+            yield from chunk[np.all(valid, axis=1)]
+
     def _get_smallest_set_not_on_axis(self, axis: NDArray) -> list:
         """Get the smallest list of atoms with the same species and distance from
         origin AND does not lie on the specified axis.
@@ -1234,14 +1426,15 @@ class PointGroupAnalyzer:
         For handling symmetric top molecules.
         """
         min_set = self._get_smallest_set_not_on_axis(axis)
-        for s1, s2 in itertools.combinations(min_set, 2):
-            test_axis = np.cross(s1.coords - s2.coords, axis)
-            if np.linalg.norm(test_axis) > self.tol:
-                op = SymmOp.from_axis_angle_and_translation(test_axis, 180)
-                if self.is_valid_op(op):
-                    self.symmops.append(op)
-                    self.rot_sym.append((test_axis, 2))
-                    return True
+        coords = np.array([site.coords for site in min_set])
+        idx1, idx2 = np.triu_indices(len(coords), 1)
+        test_axes = np.cross(coords[idx1] - coords[idx2], axis)
+        for test_axis in test_axes[np.linalg.norm(test_axes, axis=1) > self.tol]:
+            op = SymmOp.from_axis_angle_and_translation(test_axis, 180)
+            if self.is_valid_op(op):
+                self.symmops.append(op)
+                self.rot_sym.append((test_axis, 2))
+                return True
         return None
 
     def _proc_sph_top(self) -> None:
@@ -1291,30 +1484,50 @@ class PointGroupAnalyzer:
         rot_present: dict[int, bool] = defaultdict(bool)
         _origin_site, dist_el_sites = cluster_sites(self.centered_mol, self.tol)
         test_set = min(dist_el_sites.values(), key=len)
-        coords = [s.coords for s in test_set]
-        for c1, c2, c3 in itertools.combinations(coords, 3):
-            for cc1, cc2 in itertools.combinations([c1, c2, c3], 2):
-                if not rot_present[2]:
-                    test_axis = cc1 + cc2
-                    if np.linalg.norm(test_axis) > self.tol:
-                        op = SymmOp.from_axis_angle_and_translation(test_axis, 180)
-                        rot_present[2] = self.is_valid_op(op)
+        coords = np.array([s.coords for s in test_set])
+        # Many triplets share the same axes, which only need to be tested once
+        rejected: set[tuple[bytes, int]] = set()
+
+        def is_valid_rotation(test_axis: NDArray, order: int) -> tuple[SymmOp, bool]:
+            key = (np.round(test_axis / np.linalg.norm(test_axis), 8).tobytes(), order)
+            op = SymmOp.from_axis_angle_and_translation(test_axis, 360 / order)
+            if key in rejected:
+                return op, False
+            if self.is_valid_op(op):
+                return op, True
+            rejected.add(key)
+            return op, False
+
+        # Triplets are processed in chunks, since the axes are usually found early
+        triplets = itertools.combinations(range(len(coords)), 3)
+        while chunk := list(itertools.islice(triplets, 1024)):
+            c1, c2, c3 = (coords[list(idx)] for idx in zip(*chunk, strict=True))
+            # Candidate 2-fold axes through the midpoints of each pair of the triplet
+            # and higher order axes normal to the plane of the triplet
+            pair_axes = np.stack([c1 + c2, c1 + c3, c2 + c3], axis=1)
+            pair_axes_valid = np.linalg.norm(pair_axes, axis=2) > self.tol
+            normal_axes = np.cross(c2 - c1, c3 - c1)
+            normal_axes_valid = np.linalg.norm(normal_axes, axis=1) > self.tol
+
+            for triplet_idx in range(len(chunk)):
+                for test_axis, valid in zip(pair_axes[triplet_idx], pair_axes_valid[triplet_idx], strict=True):
+                    if not rot_present[2] and valid:
+                        op, rot_present[2] = is_valid_rotation(test_axis, 2)
                         if rot_present[2]:
                             self.symmops.append(op)
                             self.rot_sym.append((test_axis, 2))
 
-            test_axis = np.cross(c2 - c1, c3 - c1)
-            if np.linalg.norm(test_axis) > self.tol:
-                for r in (3, 4, 5):
-                    if not rot_present[r]:
-                        op = SymmOp.from_axis_angle_and_translation(test_axis, 360 / r)
-                        rot_present[r] = self.is_valid_op(op)
-                        if rot_present[r]:
-                            self.symmops.append(op)
-                            self.rot_sym.append((test_axis, r))
-                            break
-            if rot_present[2] and rot_present[3] and (rot_present[4] or rot_present[5]):
-                break
+                test_axis = normal_axes[triplet_idx]
+                if normal_axes_valid[triplet_idx]:
+                    for r in (3, 4, 5):
+                        if not rot_present[r]:
+                            op, rot_present[r] = is_valid_rotation(test_axis, r)
+                            if rot_present[r]:
+                                self.symmops.append(op)
+                                self.rot_sym.append((test_axis, r))
+                                break
+                if rot_present[2] and rot_present[3] and (rot_present[4] or rot_present[5]):
+                    return
 
     def get_pointgroup(self) -> PointGroupOperations:
         """Get a PointGroup object for the molecule."""
@@ -1348,11 +1561,17 @@ class PointGroupAnalyzer:
         Returns:
             bool: True if SymmOp is valid for Molecule.
         """
-        coords = self.centered_mol.cart_coords
-        for site in self.centered_mol:
-            coord = symm_op.operate(site.coords)
-            ind = find_in_coord_list(coords, coord, self.tol)
-            if len(ind) != 1 or self.centered_mol[ind[0]].species != site.species:
+        # Each transformed atom must be within tol along every axis of exactly
+        # one atom, of the same species. A few atoms are tested first, since
+        # most candidate operations are rejected by any atom.
+        n_atoms = len(self._coords)
+        for indices in np.split(np.arange(n_atoms), [min(8, n_atoms)]):
+            if len(indices) == 0:
+                continue
+            dists, matches = self._tree.query(symm_op.operate_multi(self._coords[indices]), k=[1, 2], p=np.inf)
+            if np.any(dists[:, 0] >= self.tol) or np.any(dists[:, 1] < self.tol):
+                return False
+            if np.any(self._species_ids[matches[:, 0]] != self._species_ids[indices]):
                 return False
         return True
 
@@ -1380,11 +1599,11 @@ class PointGroupAnalyzer:
 
         for index in get_clustered_indices():
             sites = self.centered_mol.cart_coords[index]
-            for i, reference in zip(index, sites, strict=True):
-                for op in symm_ops:
-                    rotated = np.dot(op, sites.T).T
-                    matched_indices = find_in_coord_list(rotated, reference, self.tol)
-                    matched_indices = {dict(enumerate(index))[i] for i in matched_indices}
+            # matches[op_idx][ref_idx]: atoms of the cluster that op maps within tol of the reference
+            matches = [KDTree(np.dot(op, sites.T).T).query_ball_point(sites, self.tol, p=np.inf) for op in symm_ops]
+            for ref_idx, i in enumerate(index):
+                for op, op_matches in zip(symm_ops, matches, strict=True):
+                    matched_indices = {index[match] for match in op_matches[ref_idx]}
                     eq_sets[i] |= matched_indices
 
                     if i not in operations:
@@ -1558,11 +1777,15 @@ def cluster_sites(
             of mass (None if there are no origin atoms). clustered_sites is a
             dict of {(avg_dist, species_and_occu): [list of sites]}
     """
-    # Cluster works for dim > 2 data. We just add a dummy 0 for second
-    # coordinate.
+    # Single linkage clustering of the distances from the origin, i.e. splitting
+    # the sorted distances at gaps larger than tol. A dummy 0 second coordinate
+    # is kept for the averages below.
     dists: list[list[float]] = [[float(np.linalg.norm(site.coords)), 0] for site in mol]
 
-    f_cluster = scipy.cluster.hierarchy.fclusterdata(dists, tol, criterion="distance")
+    norms = np.array([dist for dist, _ in dists])
+    order = np.argsort(norms, kind="stable")
+    f_cluster = np.empty(len(norms), dtype=int)
+    f_cluster[order] = np.cumsum(np.diff(norms[order], prepend=norms[order][:1]) > tol)
     clustered_dists: dict[str, list[list[float]]] = defaultdict(list)
     for idx in range(len(mol)):
         clustered_dists[f_cluster[idx]].append(dists[idx])
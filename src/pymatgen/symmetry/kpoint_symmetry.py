@@ -0,0 +1,173 @@
+"""Symmetry reduction of k-points with the point group of a structure in reciprocal space."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+    from typing_extensions import Self
+
+    from pymatgen.core import Structure
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-19"
+
+# Number of k-points whose symmetry images are generated at once
+_CHUNK_SIZE = 2**15
+
+
+class KpointSymmetry:
+    """Fold k-points into the irreducible Brillouin zone of a structure.
+
+    The rotations of the space group are converted to reciprocal space once on
+    initialization. Lists of k-points are then folded with array operations: the
+    images of all k-points under all rotations are generated at once, reduced into
+    [0, 1), rounded onto a grid with spacing atol and hashed to integers. Two k-points
+    are equivalent if the smallest hash of their images is the same. Irreducible
+    meshes are cached per set of rotations and mesh.
+    """
+
+    def __init__(self, rotations: ArrayLike, time_reversal: bool = True) -> None:
+        """
+        Args:
+            rotations (ArrayLike): Rotation matrices of the space group acting on fractional
+                coordinates in real space, e.g. the rotations of the spglib dataset. They
+                must include the identity, which is stored first.
+            time_reversal (bool): Whether k and -k are equivalent. Defaults to True.
+        """
+        rotations = np.asarray(rotations, dtype=int).reshape(-1, 3, 3)
+        if time_reversal:
+            rotations = np.concatenate([rotations, -rotations])
+        # A k-point k in fractional coordinates of the reciprocal lattice is mapped to
+        # k @ R by the rotation R of real space fractional coordinates
+        rotations = np.unique(rotations, axis=0)
+        is_identity = np.all(rotations == np.eye(3, dtype=int), axis=(1, 2))
+        self.rotations = np.concatenate([rotations[is_identity], rotations[~is_identity]])
+        self.time_reversal = time_reversal
+
+    def __len__(self) -> int:
+        return len(self.rotations)
+
+    @classmethod
+    def from_structure(
+        cls,
+        structure: Structure,
+        symprec: float = 0.01,
+        angle_tolerance: float = 5,
+        time_reversal: bool = True,
+    ) -> Self:
+        """Get the k-point symmetry of a structure.
+
+        Args:
+            structure (Structure): Structure to analyze.
+            symprec (float): Tolerance for symmetry finding. Defaults to 0.01.
+            angle_tolerance (float): Angle tolerance for symmetry finding. Defaults to 5.
+            time_reversal (bool): Whether k and -k are equivalent. Defaults to True.
+
+        Returns:
+            KpointSymmetry
+        """
+        sga = SpacegroupAnalyzer(structure, symprec=symprec, angle_tolerance=angle_tolerance)
+        return cls(sga.get_symmetry_dataset().rotations, time_reversal=time_reversal)
+
+    def get_equivalent_kpoints(self, kpoint: ArrayLike, atol: float = 1e-5) -> NDArray:
+        """Get the symmetrically distinct images of a k-point.
+
+        Args:
+            kpoint (ArrayLike): k-point in fractional coordinates.
+            atol (float): Tolerance for fractional coordinates comparisons.
+
+        Returns:
+            np.ndarray: Images of the k-point, starting with the k-point itself.
+        """
+        images = np.asarray(kpoint, dtype=float) @ self.rotations
+        _, indices = np.unique(_hash_kpoints(images, atol), return_index=True)
+        return images[np.sort(indices)]
+
+    def fold(self, kpoints: ArrayLike, atol: float = 1e-5) -> tuple[NDArray, NDArray, NDArray]:
+        """Fold a list of k-points onto the symmetrically distinct ones.
+
+        Args:
+            kpoints (ArrayLike): Nx3 k-points in fractional coordinates. They do not have
+                to lie on a mesh.
+            atol (float): Tolerance for fractional coordinates comparisons.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The irreducible k-points in the
+                order of their first appearance in kpoints, the number of k-points
+                equivalent to each of them and the index of the irreducible k-point of
+                each input k-point.
+        """
+        return _fold_kpoints(self.rotations, np.asarray(kpoints, dtype=float).reshape(-1, 3), atol)
+
+    def get_ir_mesh(
+        self,
+        mesh: tuple[int, int, int],
+        is_shift: tuple[float, float, float] = (0, 0, 0),
+    ) -> tuple[NDArray, NDArray, NDArray]:
+        """Get the irreducible k-points of a regular mesh. Results are cached per set of
+        rotations, mesh and shift, so repeated calls for structures with the same
+        symmetry do not fold the mesh again.
+
+        Args:
+            mesh (tuple[int, int, int]): Number of k-points along each reciprocal
+                lattice vector.
+            is_shift (tuple[float, float, float]): Whether to shift the mesh by half a
+                grid spacing along each direction, as in a Monkhorst-Pack mesh.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Read-only arrays of the irreducible
+                k-points in fractional coordinates within (-0.5, 0.5], their weights
+                (multiplicities in the full mesh) and the index of the irreducible
+                k-point of each k-point in the full mesh, which is ordered with the
+                last axis varying fastest.
+        """
+        mesh = tuple(int(m) for m in mesh)
+        shift = tuple(1 if s else 0 for s in is_shift)
+        return _get_ir_mesh(self.rotations.tobytes(), mesh, shift)
+
+
+def _fold_kpoints(rotations: NDArray, kpoints: NDArray, atol: float) -> tuple[NDArray, NDArray, NDArray]:
+    """Implementation of KpointSymmetry.fold."""
+    keys = np.empty(len(kpoints), dtype=np.int64)
+    for start in range(0, len(kpoints), _CHUNK_SIZE):
+        images = np.einsum("kj,rji->rki", kpoints[start : start + _CHUNK_SIZE], rotations)
+        keys[start : start + _CHUNK_SIZE] = _hash_kpoints(images, atol).min(axis=0)
+
+    _, first, mapping, weights = np.unique(keys, return_index=True, return_inverse=True, return_counts=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return kpoints[first[order]], weights[order], rank[mapping.ravel()]
+
+
+def _hash_kpoints(kpoints: NDArray, atol: float) -> NDArray:
+    """Hash fractional coordinates, reduced into [0, 1) and rounded to a grid of
+    spacing atol, into one integer per k-point.
+    """
+    n_bins = round(1 / atol)
+    if n_bins >= 2**21:
+        raise ValueError(f"{atol=} is too small to hash k-points into 64-bit integers")
+    bins = np.round(kpoints * n_bins).astype(np.int64) % n_bins
+    return (bins[..., 0] * n_bins + bins[..., 1]) * n_bins + bins[..., 2]
+
+
+@lru_cache(maxsize=128)
+def _get_ir_mesh(rotations: bytes, mesh: tuple[int, int, int], shift: tuple[int, int, int]):
+    """Cached KpointSymmetry.get_ir_mesh with the rotations as bytes."""
+    grid = np.indices(mesh).reshape(3, -1).T
+    kpoints = (grid + 0.5 * np.array(shift)) / mesh
+    kpoints -= np.round(kpoints)
+    # Use the fraction of a grid spacing as tolerance, since all k-points are on the mesh
+    ir_kpoints, weights, mapping = _fold_kpoints(
+        np.frombuffer(rotations, dtype=int).reshape(-1, 3, 3), kpoints, min(1e-5, 0.1 / max(mesh))
+    )
+    for array in (ir_kpoints, weights, mapping):
+        array.flags.writeable = False
+    return ir_kpoints, weights, mapping
@@ -7,8 +7,6 @@ from fractions import Fraction
 from typing import TYPE_CHECKING
 
 import numpy as np
-from sympy import Matrix
-from sympy.parsing.sympy_parser import parse_expr
 
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.operations import MagSymmOp, SymmOp
@@ -118,6 +116,10 @@ class JonesFaithfulTransformation:
 
             # requires round-trip to sympy to evaluate
             # (alternatively, `numexpr` looks like a nice solution but requires an additional dependency)
+            # sympy is imported here as it takes long to import and is not needed otherwise
+            from sympy import Matrix
+            from sympy.parsing.sympy_parser import parse_expr
+
             basis_change = [
                 parse_expr(string).subs({"a": Matrix(a), "b": Matrix(b), "c": Matrix(c)}) for string in basis_change
             ]
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 import math
 import warnings
+from collections import defaultdict
 from fractions import Fraction
-from itertools import groupby, product
+from itertools import groupby, islice, product
 from math import gcd
 from string import ascii_lowercase
 from typing import TYPE_CHECKING
 
 import numpy as np
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from monty.dev import requires
 from monty.fractions import lcm
 from monty.json import MSONable
@@ -32,7 +34,7 @@ from pymatgen.core.surface import SlabGenerator
 from pymatgen.electronic_structure.core import Spin
 from pymatgen.io.ase import AseAtomsAdaptor
 from pymatgen.io.icet import IcetSQS
-from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer, batch_symmetry_analysis
 from pymatgen.transformations.standard_transformations import (
     OrderDisorderedStructureTransformation,
     SubstitutionTransformation,
@@ -46,9 +48,11 @@ except ImportError:
     hiphive = None
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from typing import Any, Literal
 
+    from numpy.typing import ArrayLike
+
 
 __author__ = "Shyue Ping Ong, Stephen Dacek, Anubhav Jain, Matthew Horton, Alex Ganose"
 
@@ -239,6 +243,54 @@ class MultipleSubstitutionTransformation:
         return True
 
 
+def _get_ewald_energies(supercell: Structure, structures: Sequence[Structure]) -> list[float]:
+    """Get the Ewald energies of orderings of a supercell, sharing one EwaldSummation."""
+    ewald = EwaldSummation(supercell)
+    return [ewald.compute_sub_structure(struct) for struct in structures]
+
+
+def _iter_unique_structures(
+    structures: Iterable[Structure],
+    matcher: StructureMatcher,
+    symprec: float = 0.1,
+    n_jobs: int = 1,
+    block_size: int = 64,
+) -> Iterator[int]:
+    """Get the indices of structures that do not match any earlier one, in order.
+
+    As in StructureMatcher.group_structures, each structure is reduced only once.
+    Reduced structures are only compared with matcher.fit if they have the same
+    formula, number of sites and space group. Space groups are found for blocks of
+    block_size structures at a time, in parallel, so that structures can be consumed
+    lazily, e.g. until enough unique ones are found.
+
+    Args:
+        structures (Iterable[Structure]): Structures to remove duplicates from.
+        matcher (StructureMatcher): Matcher to compare structures with.
+        symprec (float): Tolerance for symmetry finding. Defaults to 0.1.
+        n_jobs (int): Number of processes to find space groups in. Defaults to 1.
+        block_size (int): Number of structures to find space groups for at a time.
+
+    Yields:
+        int: Index of each unique structure.
+    """
+    unique: dict[tuple[str, int, int], list[Structure]] = defaultdict(list)
+    structures = iter(structures)
+    offset = 0
+    while block := list(islice(structures, block_size)):
+        block = [
+            matcher._get_reduced_structure(struct, matcher._primitive_cell, niggli=True)
+            for struct in matcher._process_species(block)
+        ]
+        analyzers = batch_symmetry_analysis(block, symprec=symprec, n_jobs=n_jobs)
+        for idx, (struct, analyzer) in enumerate(zip(block, analyzers, strict=True), start=offset):
+            fingerprint = (struct.formula, len(struct), analyzer.get_space_group_number())
+            if not any(matcher.fit(struct, other, skip_structure_reduction=True) for other in unique[fingerprint]):
+                unique[fingerprint].append(struct)
+                yield idx
+        offset += len(block)
+
+
 class EnumerateStructureTransformation(AbstractTransformation):
     """Order a disordered structure using enumlib. For complete orderings, this
     generally produces fewer structures that the OrderDisorderedStructure
@@ -257,6 +309,7 @@ class EnumerateStructureTransformation(AbstractTransformation):
         sort_criteria: str | Callable = "ewald",
         timeout: float | None = None,
         n_jobs: int = -1,
+        remove_duplicate_structures: bool = False,
     ):
         """
         Args:
@@ -302,8 +355,13 @@ class EnumerateStructureTransformation(AbstractTransformation):
                 speeds up the subsequent DFT calculations. Alternatively, a callable can be supplied that returns a
                 (Structure, energy) tuple.
             timeout (float): timeout in minutes to pass to EnumlibAdaptor.
-            n_jobs (int): Number of parallel jobs used to compute energy criteria. This is used only when the Ewald
-                or m3gnet or callable sort_criteria is used. Default is -1, which uses all available CPUs.
+            n_jobs (int): Number of parallel jobs used to compute energy criteria and to find duplicates. This is
+                used only when the Ewald or m3gnet or callable sort_criteria is used or remove_duplicate_structures
+                is True. Default is -1, which uses all available CPUs.
+            remove_duplicate_structures (bool): Whether to skip ranked structures that match a better ranked one
+                with StructureMatcher, e.g. equivalent orderings found in different supercells. Only structures with
+                the same reduced formula and space group are compared, and only until enough unique structures are
+                found. Defaults to False.
         """
         self.symm_prec = symm_prec
         self.min_cell_size = min_cell_size
@@ -315,6 +373,7 @@ class EnumerateStructureTransformation(AbstractTransformation):
         self.sort_criteria = sort_criteria
         self.timeout = timeout
         self.n_jobs = n_jobs
+        self.remove_duplicate_structures = remove_duplicate_structures
 
         if max_cell_size and max_disordered_sites:
             raise ValueError("Cannot set both max_cell_size and max_disordered_sites!")
@@ -393,9 +452,6 @@ class EnumerateStructureTransformation(AbstractTransformation):
         if structures is None:
             raise ValueError("Unable to enumerate")
 
-        original_latt = structure.lattice
-        inv_latt = np.linalg.inv(original_latt.matrix)
-        ewald_matrices = {}
         m3gnet_model = None
 
         if not callable(self.sort_criteria) and self.sort_criteria.startswith("m3gnet"):
@@ -417,53 +473,101 @@ class EnumerateStructureTransformation(AbstractTransformation):
                     "energy": energy,
                     "structure": struct,
                 }
-            if contains_oxidation_state and self.sort_criteria == "ewald":
-                new_latt = struct.lattice
-                transformation = np.dot(new_latt.matrix, inv_latt)
-                transformation = tuple(tuple(int(round(cell)) for cell in row) for row in transformation)
-                if transformation not in ewald_matrices:
-                    s_supercell = structure * transformation
-                    ewald = EwaldSummation(s_supercell)
-                    ewald_matrices[transformation] = ewald
-                else:
-                    ewald = ewald_matrices[transformation]
-                energy = ewald.compute_sub_structure(struct)
-                return {"num_sites": len(struct), "energy": energy, "structure": struct}
-            if self.sort_criteria.startswith("m3gnet"):
-                if self.sort_criteria == "m3gnet_relax":
-                    relax_results = m3gnet_model.relax(struct)
-                    energy = float(relax_results["trajectory"].energies[-1])
-                    struct = relax_results["final_structure"]
-
-                elif self.sort_criteria == "m3gnet":
-                    atoms = AseAtomsAdaptor().get_atoms(struct)
-                    m3gnet_model.calculate(atoms)
-                    energy = float(m3gnet_model.results["energy"])
+            if self.sort_criteria == "m3gnet_relax":
+                relax_results = m3gnet_model.relax(struct)
+                energy = float(relax_results["trajectory"].energies[-1])
+                struct = relax_results["final_structure"]
 
-                else:
-                    raise ValueError("Unsupported sort criteria.")
+            elif self.sort_criteria == "m3gnet":
+                atoms = AseAtomsAdaptor().get_atoms(struct)
+                m3gnet_model.calculate(atoms)
+                energy = float(m3gnet_model.results["energy"])
 
-                return {"num_sites": len(struct), "energy": energy, "structure": struct}
+            else:
+                raise ValueError("Unsupported sort criteria.")
 
-            return {"num_sites": len(struct), "structure": struct}
+            return {"num_sites": len(struct), "energy": energy, "structure": struct}
 
-        all_structures = Parallel(n_jobs=self.n_jobs)(delayed(_get_stats)(struct) for struct in structures)
+        sort_by_energy = (
+            callable(self.sort_criteria)
+            or self.sort_criteria.startswith("m3gnet")
+            or (contains_oxidation_state and self.sort_criteria == "ewald")
+        )
+        if not sort_by_energy:
+            all_structures = [{"num_sites": len(struct), "structure": struct} for struct in structures]
+        elif contains_oxidation_state and self.sort_criteria == "ewald":
+            energies = self._get_ewald_energies(structure, structures)
+            all_structures = [
+                {"num_sites": len(struct), "energy": energy, "structure": struct}
+                for struct, energy in zip(structures, energies, strict=True)
+            ]
+        else:
+            all_structures = Parallel(n_jobs=self.n_jobs)(delayed(_get_stats)(struct) for struct in structures)
 
         def sort_func(struct):
-            return (
-                struct["energy"] / struct["num_sites"]
-                if callable(self.sort_criteria)
-                or self.sort_criteria.startswith("m3gnet")
-                or (contains_oxidation_state and self.sort_criteria == "ewald")
-                else struct["num_sites"]
-            )
+            return struct["energy"] / struct["num_sites"] if sort_by_energy else struct["num_sites"]
 
-        self._all_structures = sorted(all_structures, key=sort_func)
+        self._all_structures = self._rank_structures(all_structures, sort_func, max(num_to_return, 1))
 
         if return_ranked_list:
             return self._all_structures[:num_to_return]
         return self._all_structures[0]["structure"]
 
+    def _get_ewald_energies(self, structure: Structure, structures: Sequence[Structure]) -> np.ndarray:
+        """Get the Ewald energies of orderings of supercells of structure.
+
+        Orderings of the same supercell share one EwaldSummation. Supercells are
+        processed in parallel, with the orderings of large groups split into chunks
+        so that all workers are busy.
+        """
+        inv_latt = np.linalg.inv(structure.lattice.matrix)
+        groups: dict[tuple, list[int]] = defaultdict(list)
+        for idx, struct in enumerate(structures):
+            transformation = np.dot(struct.lattice.matrix, inv_latt)
+            groups[tuple(tuple(int(round(cell)) for cell in row) for row in transformation)].append(idx)
+
+        chunk_size = max(1, math.ceil(len(structures) / effective_n_jobs(self.n_jobs)))
+        tasks = [
+            (transformation, indices[start : start + chunk_size])
+            for transformation, indices in groups.items()
+            for start in range(0, len(indices), chunk_size)
+        ]
+        if len(tasks) == 1:
+            results = [_get_ewald_energies(structure * tasks[0][0], structures)]
+        else:
+            results = Parallel(n_jobs=self.n_jobs)(
+                delayed(_get_ewald_energies)(structure * transformation, [structures[idx] for idx in indices])
+                for transformation, indices in tasks
+            )
+
+        energies = np.empty(len(structures))
+        for (_, indices), result in zip(tasks, results, strict=True):
+            energies[indices] = result
+        return energies
+
+    def _rank_structures(self, all_structures: list[dict], key: Callable, num_to_return: int) -> list[dict]:
+        """Get the num_to_return best ranked structures by key, without sorting all of them.
+        With remove_duplicate_structures, structures matching a better ranked one are
+        skipped, and candidates are only checked until enough unique ones are found.
+        """
+        heap = [(key(dct), idx) for idx, dct in enumerate(all_structures)]
+        if not self.remove_duplicate_structures:
+            return [all_structures[idx] for _, idx in heapq.nsmallest(num_to_return, heap)]
+
+        heapq.heapify(heap)
+        candidates: list[dict] = []
+
+        def iter_candidates() -> Iterator[Structure]:
+            """Pop candidates from the heap only as they are checked for duplicates."""
+            while heap:
+                candidates.append(all_structures[heapq.heappop(heap)[1]])
+                yield candidates[-1]["structure"]
+
+        unique = _iter_unique_structures(
+            iter_candidates(), StructureMatcher(), symprec=self.symm_prec, n_jobs=self.n_jobs
+        )
+        return [candidates[idx] for idx in islice(unique, num_to_return)]
+
     def __repr__(self):
         return "EnumerateStructureTransformation"
 
@@ -598,6 +702,169 @@ class MagOrderParameterConstraint(MSONable):
         return satisfies_constraints
 
 
+def _get_hnf(rows: ArrayLike) -> np.ndarray:
+    """Get the lower triangular Hermite normal form of the lattice spanned by integer rows,
+    i.e. rows (a, 0, 0), (b, c, 0) and (d, e, f) with 0 <= b, d < a and 0 <= e < c.
+    """
+    rows = np.array(rows, dtype=np.int64)
+    hnf = np.zeros((3, 3), dtype=np.int64)
+    for col in (2, 1, 0):
+        # Euclid's algorithm on column col leaves a single row with a nonzero entry there
+        while np.count_nonzero(rows[:, col]) > 1:
+            nonzero = np.flatnonzero(rows[:, col])
+            pivot = nonzero[np.argmin(np.abs(rows[nonzero, col]))]
+            others = nonzero[nonzero != pivot]
+            rows[others] -= np.outer(rows[others, col] // rows[pivot, col], rows[pivot])
+        nonzero = np.flatnonzero(rows[:, col])
+        if len(nonzero) == 0:
+            raise ValueError("Rows do not span a three-dimensional lattice.")
+        hnf[col] = rows[nonzero[0]] * np.sign(rows[nonzero[0], col])
+        rows = np.delete(rows, nonzero[0], axis=0)
+    for row, col in ((1, 0), (2, 1), (2, 0)):
+        hnf[row] -= hnf[row, col] // hnf[col, col] * hnf[col]
+    return hnf
+
+
+def _get_translation_index(translations: np.ndarray, hnf: np.ndarray) -> np.ndarray:
+    """Get the index of integer translations among the lattice translations of the parent
+    cell that are distinct modulo the supercell lattice given by its Hermite normal form.
+    """
+    translations = translations.copy()
+    for col in (2, 1, 0):
+        translations -= (translations[..., col] // hnf[col, col])[..., None] * hnf[col]
+    return (translations[..., 0] * hnf[1, 1] + translations[..., 1]) * hnf[2, 2] + translations[..., 2]
+
+
+def _get_translations(hnf: np.ndarray) -> np.ndarray:
+    """Get the lattice translations of the parent cell that are distinct modulo the
+    supercell lattice given by its Hermite normal form, ordered by their index.
+    """
+    return np.indices(np.diag(hnf)).reshape(3, -1).T
+
+
+class _SpinOrderingHasher:
+    """Hash collinear spin orderings of supercells of a parent structure, such that
+    orderings related by an operation of the parent space group, a lattice translation
+    or the reversal of all spins have the same key. This replaces pairwise matching
+    with StructureMatcher to remove duplicate orderings.
+    """
+
+    def __init__(self, structure: Structure, labels: Sequence[int], symprec: float = 0.1):
+        """
+        Args:
+            structure (Structure): Parent structure of the orderings.
+            labels (list[int]): For each site of the parent structure, a nonnegative label
+                of its magnetic sublattice, e.g. its order parameter constraint, or -1 for
+                sites without spin. Only sites with the same label are mapped onto each other.
+            symprec (float): Tolerance for symmetry finding and for mapping the sites of the
+                orderings onto the parent structure. Defaults to 0.1.
+        """
+        self.symprec = symprec
+        self._matrix = structure.lattice.matrix
+        self._inv_matrix = np.linalg.inv(self._matrix)
+        labels = np.asarray(labels)
+        magnetic = np.flatnonzero(labels >= 0)
+        self._frac_coords = structure.frac_coords[magnetic]
+        self._labels = labels[magnetic]
+
+        # Permutations of magnetic sites and the lattice translations they are moved by
+        self._images: dict[bytes, tuple[tuple, np.ndarray]] = {}
+        self._operations = []
+        for op in SpacegroupAnalyzer(structure, symprec).get_symmetry_operations():
+            rotation = np.round(op.rotation_matrix).astype(np.int64)
+            perm, shifts, found = self._map_sites(self._frac_coords @ rotation.T + op.translation_vector)
+            if np.all(found) and np.array_equal(self._labels[perm], self._labels):
+                self._operations.append((rotation, perm, shifts))
+
+    def _map_sites(self, frac_coords: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the indices of the magnetic sites of the parent structure at frac_coords,
+        the lattice translations between them and whether a magnetic site was found.
+        """
+        diff = frac_coords[:, None] - self._frac_coords[None]
+        dists = np.linalg.norm((diff - np.round(diff)) @ self._matrix, axis=-1)
+        indices = np.argmin(dists, axis=1)
+        shifts = np.round(frac_coords - self._frac_coords[indices]).astype(np.int64)
+        return indices, shifts, dists[np.arange(len(indices)), indices] < self.symprec
+
+    def get_key(self, structure: Structure) -> tuple | None:
+        """Get the key of an ordering.
+
+        Args:
+            structure (Structure): Ordering of a supercell of the parent structure, in the
+                same Cartesian frame, with the spin of sites given by their species.
+
+        Returns:
+            tuple: Key that is the same for equivalent orderings, or None if the ordering
+                cannot be mapped onto the parent structure.
+        """
+        supercell = structure.lattice.matrix @ self._inv_matrix
+        if not np.allclose(supercell, np.round(supercell), atol=1e-3):
+            return None
+        hnf = _get_hnf(np.round(supercell))
+        n_cells = round(np.prod(np.diag(hnf)))
+
+        indices, translations, is_magnetic = self._map_sites(structure.cart_coords @ self._inv_matrix)
+        indices, translations = indices[is_magnetic], translations[is_magnetic]
+        if len(indices) != len(self._labels) * n_cells:
+            return None
+        cells = _get_translation_index(translations, hnf)
+        if len(np.unique(indices * n_cells + cells)) != len(indices):
+            return None
+        spins = np.zeros((len(self._labels), n_cells), dtype=np.int8)
+        species = structure.species
+        spins[indices, cells] = [np.sign(getattr(species[idx], "spin", 0) or 0) for idx in np.flatnonzero(is_magnetic)]
+
+        # Reduce the supercell to the smallest one of the ordering
+        translations = _get_translations(hnf)
+        shifted = _get_translation_index(translations[:, None] + translations[None], hnf)
+        invariant = np.all(spins[:, shifted] == spins[:, None], axis=(0, 2))
+        if np.count_nonzero(invariant) > 1:
+            hnf = _get_hnf(np.vstack([hnf, translations[invariant]]))
+            n_cells = round(np.prod(np.diag(hnf)))
+            reduced_spins = np.zeros((len(self._labels), n_cells), dtype=np.int8)
+            reduced_spins[:, _get_translation_index(translations, hnf)] = spins
+            spins = reduced_spins
+            translations = _get_translations(hnf)
+
+        hnf_key, columns = self._get_images(hnf)
+        codes = np.empty((len(columns), spins.size), dtype=np.int8)
+        codes[np.arange(len(columns))[:, None, None], columns] = spins
+        return hnf_key, min(map(bytes, np.vstack([codes, -codes])))
+
+    def _get_images(self, hnf: np.ndarray) -> tuple[tuple, np.ndarray]:
+        """Get the smallest Hermite normal form of the images of a supercell under the
+        parent space group and, for each operation and lattice translation giving it,
+        the columns that the spins of the magnetic sites are moved to.
+        """
+        cache_key = hnf.tobytes()
+        if cache_key not in self._images:
+            n_cells = round(np.prod(np.diag(hnf)))
+            translations = _get_translations(hnf)
+            images: dict[tuple, list[np.ndarray]] = defaultdict(list)
+            for rotation, perm, shifts in self._operations:
+                new_hnf = _get_hnf(hnf @ rotation.T)
+                new_translations = (translations @ rotation.T)[None] + shifts[:, None]
+                images[tuple(new_hnf.ravel())].append(
+                    perm[:, None] * n_cells
+                    + _get_translation_index(
+                        new_translations[None] + _get_translations(new_hnf)[:, None, None], new_hnf
+                    )
+                )
+            hnf_key = min(images)
+            self._images[cache_key] = hnf_key, np.concatenate(images[hnf_key])
+        return self._images[cache_key]
+
+
+def _enumerate_cell_size(structure: Structure, enum_kwargs: dict[str, Any], return_ranked_list: int) -> list[dict]:
+    """Enumerate orderings of a single cell size, which may have none."""
+    try:
+        return EnumerateStructureTransformation(**enum_kwargs).apply_transformation(  # type: ignore[return-value]
+            structure, return_ranked_list=return_ranked_list
+        )
+    except ValueError:
+        return []
+
+
 class MagOrderingTransformation(AbstractTransformation):
     """This transformation takes a structure and returns a list of collinear
     magnetic orderings. For disordered structures, make an ordered
@@ -803,6 +1070,38 @@ class MagOrderingTransformation(AbstractTransformation):
         logger.debug(f"Structure with spin magnitudes:\n{structure}")
         return structure
 
+    @staticmethod
+    def _enumerate(
+        structure: Structure, enum_kwargs: dict[str, Any], return_ranked_list: bool | int
+    ) -> Structure | list[dict[str, Any]]:
+        """Enumerate orderings of a structure decorated with dummy species with
+        EnumerateStructureTransformation. If a ranked list is requested, each cell size
+        is enumerated separately, in parallel with n_jobs processes.
+        """
+        cell_sizes = range(enum_kwargs["min_cell_size"], enum_kwargs["max_cell_size"] + 1)
+        if not return_ranked_list or len(cell_sizes) == 1:
+            return EnumerateStructureTransformation(**enum_kwargs).apply_transformation(
+                structure, return_ranked_list=return_ranked_list
+            )
+
+        results = Parallel(n_jobs=enum_kwargs.get("n_jobs", -1))(
+            delayed(_enumerate_cell_size)(
+                structure,
+                {**enum_kwargs, "min_cell_size": size, "max_cell_size": size, "n_jobs": 1},
+                return_ranked_list,
+            )
+            for size in cell_sizes
+        )
+        alls = [dct for result in results for dct in result]
+        if not alls:
+            raise ValueError("Unable to enumerate")
+
+        # Same ranking as EnumerateStructureTransformation, whose enumeration is by increasing cell size
+        def sort_func(dct):
+            return dct["energy"] / dct["num_sites"] if "energy" in dct else dct["num_sites"]
+
+        return sorted(alls, key=sort_func)[: int(return_ranked_list)]
+
     def apply_transformation(
         self, structure: Structure, return_ranked_list: bool | int = False
     ) -> Structure | list[Structure]:
@@ -824,6 +1123,7 @@ class MagOrderingTransformation(AbstractTransformation):
 
         # retrieve order parameters
         order_parameters = [MagOrderParameterConstraint.from_dict(op_dict) for op_dict in self.order_parameter]
+        parent = structure
         # add dummy species on which to perform enumeration
         structure = self._add_dummy_species(structure, order_parameters)
 
@@ -848,9 +1148,7 @@ class MagOrderingTransformation(AbstractTransformation):
         else:
             enum_kwargs["max_cell_size"] = enum_kwargs["min_cell_size"]
 
-        trafo = EnumerateStructureTransformation(**enum_kwargs)
-
-        alls = trafo.apply_transformation(structure, return_ranked_list=return_ranked_list)
+        alls = self._enumerate(structure, enum_kwargs, return_ranked_list)
 
         # handle the fact that EnumerateStructureTransformation can either
         # return a single Structure or a list
@@ -872,17 +1170,31 @@ class MagOrderingTransformation(AbstractTransformation):
         if num_to_return == 1 or not return_ranked_list:
             return alls[0]["structure"] if num_to_return else alls  # type: ignore[return-value, index]
 
-        # Remove duplicate structures and group according to energy model
-        matcher = StructureMatcher(comparator=SpinComparator())
+        # Remove duplicate structures by hashing their spin orderings, falling back to
+        # pairwise matching if orderings cannot be mapped onto the parent structure
+        labels = [
+            next((idx for idx, constraint in enumerate(order_parameters) if constraint.satisfies_constraint(site)), -1)
+            for site in parent
+        ]
+        hasher = _SpinOrderingHasher(parent, labels, symprec=enum_kwargs.get("symm_prec", 0.1))
+        keys = [hasher.get_key(dct["structure"]) for dct in alls]  # type: ignore[index]
+        if None not in keys:
+            unique: dict[tuple, Structure] = {}
+            for hash_key, dct in zip(keys, alls, strict=True):
+                unique.setdefault(hash_key, dct["structure"])  # type: ignore[index]
+            structures = list(unique.values())
+        else:
+            matcher = StructureMatcher(comparator=SpinComparator())
+
+            def key(struct: Structure) -> int:
+                return SpacegroupAnalyzer(struct, 0.1).get_space_group_number()
 
-        def key(struct: Structure) -> int:
-            return SpacegroupAnalyzer(struct, 0.1).get_space_group_number()
+            structures = []
+            for _, group in groupby(sorted((dct["structure"] for dct in alls), key=key), key):  # type: ignore[arg-type, index]
+                structures.extend(grouped[0] for grouped in matcher.group_structures(list(group)))
 
-        out = []
-        for _, group in groupby(sorted((dct["structure"] for dct in alls), key=key), key):  # type: ignore[arg-type, index]
-            group = list(group)  # type: ignore[assignment]
-            grouped = matcher.group_structures(group)
-            out.extend([{"structure": g[0], "energy": self.energy_model.get_energy(g[0])} for g in grouped])
+        # Rank according to energy model
+        out = [{"structure": struct, "energy": self.energy_model.get_energy(struct)} for struct in structures]
 
         self._all_structures = sorted(out, key=lambda dct: dct["energy"])
 
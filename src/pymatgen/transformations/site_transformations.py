@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 from monty.json import MSONable
 
-from pymatgen.analysis.ewald import EwaldMinimizer, EwaldSummation
+from pymatgen.analysis.ewald import EwaldMinimizer, EwaldSummation, IncrementalEwaldEnergy
 from pymatgen.analysis.local_env import MinimumDistanceNN
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.transformations.transformation_abc import AbstractTransformation
@@ -298,6 +298,7 @@ class PartialRemoveSitesTransformation(AbstractTransformation):
         start_time = time.perf_counter()
         self.logger.debug("Performing initial Ewald sum...")
         ewald_sum = EwaldSummation(structure)
+        ewald_energy = IncrementalEwaldEnergy.from_ewald_summation(ewald_sum)
         self.logger.debug(f"Ewald sum took {time.perf_counter() - start_time} seconds.")
         start_time = time.perf_counter()
 
@@ -311,7 +312,7 @@ class PartialRemoveSitesTransformation(AbstractTransformation):
                 indices_list.extend(indices)
             s_new = structure.copy()
             s_new.remove_sites(indices_list)
-            energy = ewald_sum.compute_partial_energy(indices_list)
+            energy = ewald_energy.energy + ewald_energy.get_energy_change(indices_list, np.zeros(len(indices_list)))
             already_tested = False
             for ii, t_sites in enumerate(tested_sites):
                 t_energy = all_structures[ii]["energy"]
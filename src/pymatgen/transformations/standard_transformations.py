@@ -14,7 +14,7 @@ from numpy import around
 
 from pymatgen.analysis.bond_valence import BVAnalyzer
 from pymatgen.analysis.elasticity.strain import Deformation
-from pymatgen.analysis.ewald import EwaldMinimizer, EwaldSummation
+from pymatgen.analysis.ewald import EwaldMinimizer, EwaldMonteCarloMinimizer, EwaldSummation
 from pymatgen.analysis.structure_matcher import StructureMatcher
 from pymatgen.core import Composition, get_el_sp
 from pymatgen.core.operations import SymmOp
@@ -429,13 +429,20 @@ class OrderDisorderedStructureTransformation(AbstractTransformation):
     putting all lithium in sites [4, 5, 6, 7].
 
     USE WITH CARE.
+
+    For large supercells, ALGO_MONTE_CARLO searches the orderings by simulated
+    annealing with EwaldMonteCarloMinimizer instead, which scales with the
+    number of disordered sites rather than the number of combinations, but
+    is not guaranteed to find the lowest energy ordering.
     """
 
     ALGO_FAST = 0
     ALGO_COMPLETE = 1
     ALGO_BEST_FIRST = 2
+    # 3 is EwaldMinimizer.ALGO_TIME_LIMIT
+    ALGO_MONTE_CARLO = 4
 
-    def __init__(self, algo=ALGO_FAST, symmetrized_structures=False, no_oxi_states=False):
+    def __init__(self, algo=ALGO_FAST, symmetrized_structures=False, no_oxi_states=False, mc_params=None):
         """
         Args:
             algo (int): Algorithm to use.
@@ -444,11 +451,15 @@ class OrderDisorderedStructureTransformation(AbstractTransformation):
                 should be used for the grouping of sites.
             no_oxi_states (bool): Whether to remove oxidation states prior to
                 ordering.
+            mc_params (dict): Keyword arguments of EwaldMonteCarloMinimizer
+                for ALGO_MONTE_CARLO, e.g. {"n_chains": 8, "ncores": 4, "seed": 0}.
+                Defaults to None.
         """
         self.algo = algo
         self._all_structures: list = []
         self.no_oxi_states = no_oxi_states
         self.symmetrized_structures = symmetrized_structures
+        self.mc_params = mc_params
 
     def apply_transformation(self, structure: Structure, return_ranked_list: bool | int = False) -> Structure:
         """For this transformation, the apply_transformation method will return
@@ -539,7 +550,10 @@ class OrderDisorderedStructureTransformation(AbstractTransformation):
                 manipulations.append([0, empty, list(group), None])
 
         matrix = EwaldSummation(struct).total_energy_matrix
-        ewald_m = EwaldMinimizer(matrix, manipulations, n_to_return, self.algo)
+        if self.algo == self.ALGO_MONTE_CARLO:
+            ewald_m = EwaldMonteCarloMinimizer(matrix, manipulations, n_to_return, **(self.mc_params or {}))
+        else:
+            ewald_m = EwaldMinimizer(matrix, manipulations, n_to_return, self.algo)
 
         self._all_structures = []
 
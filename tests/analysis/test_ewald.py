@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import copy
 from unittest import TestCase
 
 import numpy as np
 import pytest
 from pytest import approx
 
-from pymatgen.analysis.ewald import EwaldMinimizer, EwaldSummation
+from pymatgen.analysis.ewald import (
+    EwaldMinimizer,
+    EwaldMonteCarloMinimizer,
+    EwaldSummation,
+    IncrementalEwaldEnergy,
+    ParticleMeshEwaldSummation,
+)
 from pymatgen.core.structure import Structure
 from pymatgen.util.testing import VASP_IN_DIR
 
@@ -80,6 +87,96 @@ class TestEwaldSummation(TestCase):
         assert ham.as_dict() == EwaldSummation.from_dict(dct).as_dict()
 
 
+class TestIncrementalEwaldEnergy(TestCase):
+    def setUp(self):
+        self.struct = Structure.from_file(f"{VASP_IN_DIR}/POSCAR")
+        self.struct.add_oxidation_state_by_element({"Li": 1, "Fe": 2, "P": 5, "O": -2})
+        self.ewald = EwaldSummation(self.struct)
+
+    def test_updates(self):
+        energy = IncrementalEwaldEnergy.from_ewald_summation(self.ewald)
+        assert energy.energy == approx(np.sum(self.ewald.total_energy_matrix))
+
+        delta = energy.get_removal_energy(3)
+        assert energy.energy + delta == approx(self.ewald.compute_partial_energy([3]))
+        assert energy.remove(3) == approx(self.ewald.compute_partial_energy([3]))
+        energy.remove(5)
+        assert energy.energy == approx(self.ewald.compute_partial_energy([3, 5]))
+
+        # Swap an Fe2+ and an O2-, and change an occupation
+        expected = energy.energy + energy.get_swap_energy(0, 20)
+        assert energy.swap(0, 20) == approx(expected)
+        assert energy.charges[[0, 20]].tolist() == [-2, 2]
+        expected = energy.energy + energy.get_energy_change([1], [3])
+        assert energy.set_charges([1], [3]) == approx(expected)
+
+        charges = energy.charges
+        assert energy.energy == approx(charges @ energy.interaction_matrix @ charges)
+        struct = self.struct.copy()
+        struct.remove_oxidation_states()
+        struct.add_site_property("charge", charges.tolist())
+        assert energy.energy == approx(np.sum(EwaldSummation(struct).total_energy_matrix), abs=1e-6)
+
+    def test_get_energies(self):
+        energy = IncrementalEwaldEnergy.from_ewald_summation(self.ewald)
+        rng = np.random.default_rng(0)
+        configs = rng.permutation(np.tile(energy.charges, (50, 1)), axis=1)
+        energies = energy.get_energies(configs)
+        assert energies.shape == (50,)
+        for config, config_energy in zip(configs[:3], energies[:3], strict=True):
+            assert config_energy == approx(config @ energy.interaction_matrix @ config)
+        with pytest.raises(ValueError, match="Expected 24 charges"):
+            IncrementalEwaldEnergy(energy.interaction_matrix, [1, 2])
+
+    def test_compute_sub_structure(self):
+        sub_structure = self.struct.copy()
+        sub_structure.remove_sites([0, 10])
+        assert self.ewald.compute_sub_structure(sub_structure) == approx(self.ewald.compute_partial_energy([0, 10]))
+        sub_structure.append("Li+", [0.123, 0.456, 0.789])
+        with pytest.raises(ValueError, match="Missing sites"):
+            self.ewald.compute_sub_structure(sub_structure)
+
+
+class TestParticleMeshEwaldSummation(TestCase):
+    def setUp(self):
+        self.struct = Structure.from_file(f"{VASP_IN_DIR}/POSCAR")
+        self.struct.add_oxidation_state_by_element({"Li": 1, "Fe": 2, "P": 5, "O": -2})
+
+    def test_init(self):
+        for struct in (self.struct, self.struct * (2, 1, 2)):
+            struct.perturb(0.1, min_distance=0.1)
+            ewald = EwaldSummation(struct, compute_forces=True)
+            pme = ParticleMeshEwaldSummation(struct, compute_forces=True)
+            assert pme.total_energy == approx(ewald.total_energy, rel=1e-5)
+            # The cell has no Li, so it is charged
+            terms = (pme.real_space_energy, pme.reciprocal_space_energy, pme.point_energy, pme._charged_cell_energy)
+            assert pme.total_energy == approx(sum(terms))
+            assert np.abs(pme.forces - ewald.forces).max() < 1e-2
+
+        # Finer mesh and higher order converge towards the direct sum
+        pme = ParticleMeshEwaldSummation(self.struct, grid=(32, 40, 64), order=8)
+        assert pme.grid == (32, 40, 64)
+        assert pme.total_energy == approx(EwaldSummation(self.struct).total_energy, rel=1e-7)
+
+        with pytest.raises(AttributeError, match="Forces are available only if compute_forces is True"):
+            _ = pme.forces
+
+        for order in (2, 5):
+            with pytest.raises(ValueError, match=f"B-spline order must be even and at least 4, got {order}"):
+                ParticleMeshEwaldSummation(self.struct, order=order)
+
+    def test_neutral(self):
+        struct = self.struct.copy()
+        struct.replace_species({"Fe2+": "Fe3+"})
+        ewald = EwaldSummation(struct, compute_forces=True)
+        pme = ParticleMeshEwaldSummation(struct, eta=ewald.eta, compute_forces=True)
+        assert pme._charged_cell_energy == 0
+        assert pme.total_energy == approx(ewald.total_energy, rel=1e-5)
+        assert pme.real_space_energy == approx(ewald.real_space_energy, rel=1e-5)
+        assert pme.point_energy == approx(ewald.point_energy)
+        assert np.abs(pme.forces - ewald.forces).max() < 1e-2
+
+
 class TestEwaldMinimizer(TestCase):
     def test_init(self):
         matrix = np.array(
@@ -105,6 +202,32 @@ class TestEwaldMinimizer(TestCase):
         assert e_min.minimized_sum == approx(111.63, abs=1e-3), "Returned wrong minimum value"
         assert len(e_min.best_m_list) == 6, "Returned wrong number of permutations"
 
+    def test_monte_carlo(self):
+        rng = np.random.default_rng(0)
+        matrix = rng.integers(-5, 15, size=(10, 10)).astype(float)
+        m_list = [[0.9, 4, [1, 2, 3, 4, 8], "a"], [-1, 2, [5, 6, 7], "b"]]
+        # EwaldMinimizer consumes the indices of m_list
+        e_min = EwaldMinimizer(matrix, copy.deepcopy(m_list), 50)
+        mc_min = EwaldMonteCarloMinimizer(matrix, m_list, 50, n_chains=2, n_sweeps=100, seed=0)
+
+        # all 15 orderings are visited and ranked like the exhaustive search
+        assert len(mc_min.output_lists) == 15
+        assert [output[0] for output in mc_min.output_lists] == approx([output[0] for output in e_min.output_lists])
+        assert mc_min.minimized_sum == approx(e_min.minimized_sum)
+        assert sorted(mc_min.best_m_list) == sorted(e_min.best_m_list)
+
+        # Chains run in a process pool give the same orderings
+        pool_min = EwaldMonteCarloMinimizer(matrix, m_list, 50, n_chains=2, n_sweeps=100, ncores=2, seed=0)
+        assert pool_min.output_lists == mc_min.output_lists
+
+        # Manipulations of the same sites are swapped with each other
+        mc_min = EwaldMonteCarloMinimizer(matrix, [[0.5, 2, [0, 1, 2, 3], "a"], [0, 1, [0, 1, 2, 3], None]], 50)
+        assert len(mc_min.output_lists) == 12
+        assert all(len(output[1]) == 3 for output in mc_min.output_lists)
+
+        with pytest.raises(ValueError, match="identical or disjoint sets of indices"):
+            EwaldMonteCarloMinimizer(matrix, [[0.5, 1, [0, 1], "a"], [0.5, 1, [1, 2], "b"]])
+
     def test_site(self):
         """Test that uses an uncharged structure."""
         filepath = f"{VASP_IN_DIR}/POSCAR"
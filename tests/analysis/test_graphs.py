@@ -12,7 +12,7 @@ import pytest
 from monty.serialization import loadfn
 from pytest import approx
 
-from pymatgen.analysis.graphs import MoleculeGraph, MolGraphSplitError, PeriodicSite, StructureGraph
+from pymatgen.analysis.graphs import MoleculeGraph, MolGraphSplitError, PeriodicSite, StructureGraph, unique_graphs
 from pymatgen.analysis.local_env import (
     CovalentBondNN,
     CutOffDictNN,
@@ -809,6 +809,22 @@ class TestMoleculeGraph(TestCase):
             # Test that each fragment is connected
             assert nx.is_connected(unique_fragments[ii].graph.to_undirected())
 
+    def test_unique_graphs(self):
+        ethyl_xyz_path = f"{TEST_DIR}/ethylene.xyz"
+        ethylene = Molecule.from_file(ethyl_xyz_path)
+        # swap carbons
+        ethylene[0], ethylene[1] = ethylene[1], ethylene[0]
+        edges = {(0, 1): {"weight": 2}, (1, 2): None, (1, 3): None, (0, 4): None, (0, 5): None}
+        ethylene_graph = MoleculeGraph.from_edges(ethylene, edges)
+
+        unique = unique_graphs([self.ethylene, self.butadiene, ethylene_graph, self.cyclohexene, self.butadiene])
+        assert unique == [self.ethylene, self.butadiene, self.cyclohexene]
+
+        # also works on plain networkx graphs
+        graphs = [mg.graph for mg in (self.ethylene, ethylene_graph, self.butadiene)]
+        assert unique_graphs(graphs) == [self.ethylene.graph, self.butadiene.graph]
+        assert unique_graphs([]) == []
+
     def test_find_rings(self):
         rings = self.cyclohexene.find_rings(including=[0])
         assert sorted(rings[0]) == [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 0)]
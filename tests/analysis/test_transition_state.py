@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import json
 
+import numpy as np
+import pytest
 from matplotlib import pyplot as plt
 from numpy.testing import assert_allclose
 
-from pymatgen.analysis.transition_state import NEBAnalysis, combine_neb_plots
+from pymatgen.analysis.transition_state import IDPPSolver, NEBAnalysis, combine_neb_plots
+from pymatgen.core import Lattice, Structure
 from pymatgen.util.testing import TEST_FILES_DIR, PymatgenTest
 
 """
@@ -69,3 +72,58 @@ class TestNEBAnalysis(PymatgenTest):
         assert ax.texts[0].get_text() == "326 meV", "Unexpected annotation text"
         assert ax.get_xlabel() == "Reaction Coordinate"
         assert ax.get_ylabel() == "Energy (meV)"
+
+
+class TestIDPPSolver(PymatgenTest):
+    def setUp(self):
+        # Vacancy hop in a 2x2x2 fcc Ag supercell
+        fcc = Structure(Lattice.cubic(4.09), ["Ag"] * 4, [[0, 0, 0], [0.5, 0.5, 0], [0, 0.5, 0.5], [0.5, 0, 0.5]]) * 2
+        fcc.remove_sites([0])
+        self.start = fcc
+        self.hop_idx = next(idx for idx, site in enumerate(fcc) if np.allclose(site.frac_coords, [0.25, 0.25, 0]))
+        self.end = fcc.copy()
+        self.end.replace(self.hop_idx, "Ag", [0, 0, 0])
+
+    def test_run(self):
+        solver = IDPPSolver.from_endpoints([self.start, self.end], nimages=5, sort_tol=0)
+        assert solver.init_coords.shape == (7, 31, 3)
+        path = solver.run()
+        assert len(path) == 7
+        assert path[0] == self.start
+        assert path[-1] == self.end
+
+        # Neighbors of the hopping atom move out of the way compared to the linear path
+        linear = self.start.interpolate(self.end, 6)
+        for lin_image, image in zip(linear[1:-1], path[1:-1], strict=True):
+            lin_dists = np.delete(lin_image.distance_matrix[self.hop_idx], self.hop_idx)
+            dists = np.delete(image.distance_matrix[self.hop_idx], self.hop_idx)
+            assert dists.min() > lin_dists.min() + 0.04
+        # The path stays symmetric about the midpoint
+        assert_allclose(path[3][self.hop_idx].frac_coords[:2], [0.125, 0.125], atol=1e-3)
+
+        with pytest.warns(UserWarning, match="did not converge in 2 iterations"):
+            solver.run(maxiter=2)
+
+    def test_forces(self):
+        solver = IDPPSolver.from_endpoints([self.start, self.end], nimages=3, sort_tol=0)
+        coords = solver.init_coords + np.random.default_rng(0).normal(scale=0.05, size=solver.init_coords.shape)
+        funcs, forces = solver._get_funcs_and_forces(coords)
+        # Forces are the negative gradient of the objective function
+        for site_idx, axis in ((self.hop_idx, 0), (5, 2)):
+            step = np.zeros_like(coords)
+            step[:, site_idx, axis] = 1e-6
+            gradient = (solver._get_funcs_and_forces(coords + step)[0] - funcs) / 1e-6
+            assert_allclose(forces[:, site_idx, axis], -gradient, rtol=1e-3, atol=1e-5)
+
+        # Only pairs within the cutoff are stored, so their number is linear in the number of sites
+        n_pairs = len(solver._centers)
+        larger = IDPPSolver.from_endpoints([self.start * (2, 1, 1), self.end * (2, 1, 1)], nimages=3, sort_tol=0)
+        assert len(larger._centers) == 2 * n_pairs
+
+    def test_init_errors(self):
+        with pytest.raises(ValueError, match="at least one image"):
+            IDPPSolver([self.start, self.end])
+        strained = self.end.copy()
+        strained.apply_strain(0.01)
+        with pytest.raises(ValueError, match="same lattice"):
+            IDPPSolver([self.start, self.start, strained])
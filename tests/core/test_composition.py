@@ -11,8 +11,9 @@ import pytest
 from numpy.testing import assert_allclose
 from pytest import approx
 
+import pymatgen.core.composition as composition_module
 from pymatgen.core import Composition, DummySpecies, Element, Species
-from pymatgen.core.composition import ChemicalPotential
+from pymatgen.core.composition import ChemicalPotential, set_formula_cache_size
 from pymatgen.util.testing import PymatgenTest
 
 
@@ -313,6 +314,38 @@ class TestComposition(PymatgenTest):
         comp = Composition({"Na": 2 - Composition.amount_tolerance / 2, "Cl": 2})
         assert comp.reduced_formula == "NaCl"
 
+    def test_formula_cache(self):
+        try:
+            set_formula_cache_size(2)
+            for formula in ("Li2Fe3(PO4)3", "Li2Fe3(PO4)3", "Fe2O3", "NaCl"):
+                comp = Composition(formula)
+            cache_info = composition_module._parse_formula_cached.cache_info()
+            assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (1, 3, 2)
+            assert comp == Composition({"Na": 1, "Cl": 1})
+            # invalid formulas are not cached and raise every time
+            for _ in range(2):
+                with pytest.raises(ValueError, match="Invalid formula="):
+                    Composition("123")
+
+            set_formula_cache_size(0)
+            assert Composition("Li2Fe3(PO4)3") == Composition({"Li": 2, "Fe": 3, "P": 3, "O": 12})
+            assert composition_module._parse_formula_cached.cache_info().currsize == 0
+        finally:
+            set_formula_cache_size(composition_module.FORMULA_CACHE_SIZE)
+
+    def test_derived_property_cache(self):
+        comp = Composition("Li4Fe4P4O16")
+        reduced_comp, factor = comp.get_reduced_composition_and_factor()
+        assert comp.get_reduced_composition_and_factor()[0] is reduced_comp
+        assert (reduced_comp.formula, factor) == ("Li1 Fe1 P1 O4", 4)
+        assert comp.reduced_formula == "LiFePO4"
+        assert comp.get_reduced_formula_and_factor(iupac_ordering=True) == ("LiFePO4", 4)
+        assert comp.hill_formula == comp.hill_formula == "Fe4 Li4 O16 P4"
+        assert comp.chemical_system == "Fe-Li-O-P"
+        # cached values must not leak between compositions
+        assert Composition("Li2O").reduced_formula == "Li2O"
+        assert (comp * 2).get_reduced_composition_and_factor()[1] == 8
+
     def test_integer_formula(self):
         correct_reduced_formulas = [
             "Li3Fe2(PO4)3",
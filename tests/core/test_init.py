@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import pymatgen.core
+from pymatgen.core import Element, Structure
+from pymatgen.core.periodic_table import Element as Element2
+from pymatgen.core.structure import Structure as Structure2
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+
+def test_lazy_imports():
+    assert Structure is Structure2
+    assert Element is Element2
+    assert pymatgen.core.structure.Structure is Structure
+    assert {"Structure", "Element", "SETTINGS", "units"} <= set(dir(pymatgen.core))
+
+    with pytest.raises(AttributeError, match=r"module 'pymatgen\.core' has no attribute 'Foo'"):
+        _ = pymatgen.core.Foo
+
+
+def test_import_dependencies():
+    """Light imports must not pull in the structure module and its heavy dependencies."""
+    code = "import sys, {}; print(*sys.modules)"
+    modules = set(_run_python("-c", code.format("pymatgen.core")).stdout.split())
+    assert "pymatgen.core" in modules
+    assert modules.isdisjoint({"pymatgen.core.periodic_table", "pymatgen.core.structure", "ruamel.yaml", "numpy"})
+
+    modules = set(_run_python("-c", code.format("pymatgen.core.periodic_table")).stdout.split())
+    assert "pymatgen.core.periodic_table" in modules
+    assert modules.isdisjoint({"pymatgen.core.structure", "pymatgen.core.lattice", "scipy.spatial", "sympy"})
+
+    modules = set(_run_python("-c", code.format("pymatgen.core.structure")).stdout.split())
+    assert "sympy" not in modules
+
+
+def test_import_time():
+    """Guard against regressions of the import time of pymatgen.core, which is run by
+    every command line invocation. The threshold is generous to avoid flaky failures.
+    """
+    stderr = _run_python("-X", "importtime", "-c", "import pymatgen.core").stderr
+    # Lines are formatted as "import time: self [us] | cumulative | imported package"
+    times = {
+        line.split("|")[2].strip(): int(line.split("|")[1])
+        for line in stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+    }
+    assert times["pymatgen.core"] < 500_000
@@ -11,7 +11,7 @@ import pytest
 from pytest import approx
 
 from pymatgen.core import DummySpecies, Element, Species, get_el_sp
-from pymatgen.core.periodic_table import ElementBase, ElementType
+from pymatgen.core.periodic_table import ElementBase, ElementType, property_table
 from pymatgen.core.units import Ha_to_eV
 from pymatgen.io.core import ParseError
 from pymatgen.util.testing import PymatgenTest
@@ -701,6 +701,28 @@ def test_get_el_sp():
         get_el_sp(None)
 
 
+def test_property_table():
+    x_table = property_table("X")
+    assert x_table is property_table("X")
+    assert len(x_table) == 119
+    assert np.isnan(x_table[0])
+    for el in (Element.H, Element.Fe, Element.O, Element.Og):
+        assert x_table[el.Z] == approx(el.X, nan_ok=True)
+    assert np.isnan(x_table[Element.He.Z])
+    with pytest.raises(ValueError, match="read-only"):
+        x_table[1] = 0
+
+    assert property_table("atomic_mass")[26] == approx(Element.Fe.atomic_mass)
+    assert property_table("atomic_radius")[26] == approx(Element.Fe.atomic_radius)
+    assert np.isnan(property_table("atomic_radius")[Element.Ne.Z])
+    assert property_table("is_metal")[26] == 1
+
+    with pytest.raises(ValueError, match="ionic_radii is not a numerical Element property"):
+        property_table("ionic_radii")
+    with pytest.raises(AttributeError, match="Element has no attribute foo"):
+        property_table("foo")
+
+
 def test_element_type():
     assert isinstance(ElementType.actinoid, Enum)
     assert isinstance(ElementType.metalloid, Enum)
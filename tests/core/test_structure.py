@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import json
 import os
 from fractions import Fraction
@@ -16,6 +17,7 @@ from numpy.testing import assert_allclose, assert_array_equal
 from pytest import approx
 
 from pymatgen.core import SETTINGS, Composition, Element, Lattice, Species
+from pymatgen.core.bonds import CovalentBond
 from pymatgen.core.operations import SymmOp
 from pymatgen.core.structure import (
     IMolecule,
@@ -26,6 +28,7 @@ from pymatgen.core.structure import (
     Structure,
     StructureError,
 )
+from pymatgen.core.trajectory import Trajectory
 from pymatgen.electronic_structure.core import Magmom
 from pymatgen.io.ase import AseAtomsAdaptor
 from pymatgen.io.cif import CifParser
@@ -316,6 +319,32 @@ class TestIStructure(PymatgenTest):
     def test_properties_dict(self):
         assert self.propertied_structure.properties == {"test_property": "test"}
 
+    def test_get_species_property_array(self):
+        struct = self.get_structure("LiFePO4")
+        x_values = struct.get_species_property_array("X")
+        assert_allclose(x_values, [site.specie.X for site in struct])
+        assert_allclose(struct.get_species_property_array("atomic_mass"), [sp.atomic_mass for sp in struct.species])
+
+        struct = struct.copy()
+        struct.add_oxidation_state_by_guess()
+        assert_allclose(struct.get_species_property_array("ionic_radius"), [sp.ionic_radius for sp in struct.species])
+
+        # disordered and partially occupied sites, and missing values
+        struct = IStructure(
+            Lattice.cubic(4),
+            [{"Fe": 0.5, "Co": 0.5}, {"Li": 0.5}, "X0+", "He", {"Li": 0.5, "X0+": 0.5}],
+            [[0, 0, 0], [0.5, 0.5, 0.5], [0.25, 0.25, 0.25], [0.75, 0.75, 0.75], [0.5, 0, 0]],
+        )
+        masses = struct.get_species_property_array("atomic_mass")
+        assert_allclose(masses[:2], [(Element.Fe.atomic_mass + Element.Co.atomic_mass) / 2, Element.Li.atomic_mass])
+        assert np.isnan(masses[2:]).tolist() == [True, False, True]
+        # default is used if any species on a site lacks the property
+        assert_allclose(struct.get_species_property_array("atomic_mass", default=-1)[2:], [-1, 4.002602, -1])
+        assert_allclose(struct.get_species_property_array("X", default=0)[:4], [(1.83 + 1.88) / 2, 0.98, 0, 0])
+
+        with pytest.raises(AttributeError, match="Element has no attribute foo"):
+            struct.get_species_property_array("foo")
+
     def test_copy(self):
         new_struct = self.propertied_structure.copy(
             site_properties={"charge": [2, 3]}, properties={"another_prop": "test"}
@@ -495,6 +524,15 @@ class TestIStructure(PymatgenTest):
         assert_array_equal(int_s[1][1].frac_coords, [0.875, 0.5, 0.875])
         assert_array_equal(int_s[2][1].frac_coords, [1.0, 0.5, 1.0])
 
+        # All images as a Trajectory
+        traj = struct.interpolate(struct2, 4, interpolate_lattices=True, return_trajectory=True)
+        int_s = struct.interpolate(struct2, 4, interpolate_lattices=True)
+        assert isinstance(traj, Trajectory)
+        assert len(traj) == 5
+        assert traj.lattice.shape == (5, 3, 3)
+        assert_allclose(traj.lattice, [image.lattice.matrix for image in int_s])
+        assert_allclose(traj.coords, [image.frac_coords for image in int_s])
+
     def test_interpolate_lattice_rotation(self):
         l1 = Lattice(np.eye(3))
         l2 = Lattice(np.diag((-1.01, -1.01, 1)))
@@ -553,6 +591,19 @@ class TestIStructure(PymatgenTest):
         assert len(fcc_ag_prim) == 1
         assert fcc_ag_prim.volume == approx(17.10448225)
 
+        # ~1000 sites with several species and noise below the tolerance
+        supercell = self.get_structure("LiFePO4") * (3, 3, 4)
+        supercell.perturb(0.05)
+        prim = supercell.get_primitive_structure()
+        assert len(prim) == 28
+        assert prim.volume == approx(supercell.volume / 36, rel=1e-3)
+        assert prim.composition.reduced_formula == "LiFePO4"
+
+        # Already primitive structures return a copy
+        prim = self.get_structure("LiFePO4")
+        assert prim.get_primitive_structure() == prim
+        assert prim.get_primitive_structure() is not prim
+
     def test_primitive_with_constrained_lattice(self):
         struct = Structure.from_file(f"{TEST_FILES_DIR}/core/structure/Fe310.json.gz")
         constraints = {"a": 2.83133, "b": 4.69523, "gamma": 107.54840}
@@ -838,6 +889,25 @@ Direct
         ans = [[0.0, 2.3516318], [2.3516318, 0.0]]
         assert_allclose(self.struct.distance_matrix, ans)
 
+        struct = self.get_structure("LiFePO4") * (1, 2, 1)
+        dist_mat = struct.distance_matrix
+        assert_allclose(struct.get_distance_matrix(chunk_size=5), dist_mat)
+
+        sparse = struct.get_distance_matrix(cutoff=3)
+        close = (dist_mat <= 3) & ~np.eye(len(struct), dtype=bool)
+        assert sparse.shape == dist_mat.shape
+        assert sparse.nnz == close.sum()
+        assert_allclose(sparse.toarray()[close], dist_mat[close])
+        # small cell where sites are within the cutoff of several images of each other
+        sparse = self.struct.get_distance_matrix(cutoff=5)
+        assert_allclose(sparse.toarray(), self.struct.distance_matrix)
+
+        # coincident sites are kept
+        struct.append("Li", struct[0].frac_coords)
+        assert struct.get_distance_matrix(cutoff=0.5)[0, len(struct) - 1] == approx(0)
+        assert struct.get_distance_matrix(cutoff=0.5).nnz == 2
+        assert not struct.is_valid()
+
     def test_to_from_file_and_string(self):
         for fmt in ("cif", "json", "poscar", "cssr", "pwmat"):
             struct = self.struct.to(fmt=fmt)
@@ -970,6 +1040,107 @@ class TestStructure(PymatgenTest):
         struct[:2] = "S"
         assert struct.formula == "Li1 S2"
 
+    def test_lazy_sites(self):
+        struct = Structure(
+            Lattice.cubic(4),
+            ["Fe", "O", "O"],
+            [[0, 0, 0], [0.5, 0.5, 0.5], [1.25, 0, 0.5]],
+            site_properties={"magmom": [5, 0, 0]},
+            labels=["Fe1", None, "O2"],
+            to_unit_cell=True,
+        )
+        # sites are only created on access
+        assert struct._sites._n_made == 0
+        assert struct.formula == "Fe1 O2"
+        assert struct.labels == ["Fe1", "O", "O2"]
+        assert struct.site_properties == {"magmom": [5, 0, 0]}
+        assert_allclose(struct.frac_coords[2], [0.25, 0, 0.5])
+        assert_allclose(struct.cart_coords[1], [2, 2, 2])
+        assert struct.copy()._sites._n_made == 0
+        assert struct._sites._n_made == 0
+
+        # changes made through created sites are seen by the structure
+        struct[1].frac_coords = [0.5, 0.5, 0.25]
+        struct[1].properties["magmom"] = -1
+        struct[1].species = "N"
+        assert struct._sites._n_made == 1
+        assert_allclose(struct.frac_coords[1], [0.5, 0.5, 0.25])
+        assert_allclose(struct.cart_coords[1], [2, 2, 1])
+        assert struct.site_properties == {"magmom": [5, -1, 0]}
+        assert struct.labels == ["Fe1", "N", "O2"]
+        assert struct.formula == "Fe1 N1 O1"
+
+        struct.apply_strain(0.5)
+        assert struct[1].lattice is struct.lattice
+        assert_allclose(struct.cart_coords, [[0, 0, 0], [3, 3, 1.5], [1.5, 0, 3]])
+        assert_allclose(struct[2].coords, [1.5, 0, 3])
+
+        del struct[0]
+        assert struct.formula == "N1 O1"
+        assert struct.site_properties == {"magmom": [-1, 0]}
+        assert struct._sites._n_made == 2
+        assert struct.sites == [struct[0], struct[1]]
+        assert isinstance(struct._sites, list)
+
+        istruct = IStructure.from_sites(struct)
+        assert isinstance(istruct.sites, tuple)
+        assert istruct == struct
+
+    def test_cache(self):
+        struct = self.get_structure("LiFePO4")
+        assert struct._cache is None
+        assert struct.enable_cache() is struct
+
+        dist_mat = struct.distance_matrix
+        assert_allclose(dist_mat, struct.lattice.get_all_distances(struct.frac_coords, struct.frac_coords))
+        # cached results are copies that can be modified safely
+        dist_mat[0, 1] = 100
+        assert struct.distance_matrix[0, 1] != 100
+        struct.get_neighbor_list(3)
+        assert set(struct._cache) == {("distance_matrix",), ("neighbor_list", 3, 1e-8, True)}
+        all_neighbors = struct.get_all_neighbors(3)
+        assert all_neighbors == struct.copy().get_all_neighbors(3)
+        assert struct.get_all_neighbors(3)[0][0] is all_neighbors[0][0]
+
+        # species and property changes invalidate cached neighbors
+        struct.add_oxidation_state_by_guess()
+        assert not struct._cache
+        assert struct.get_all_neighbors(3)[0][0].specie == Species("O", -2)
+
+        # mutators invalidate the cache
+        for mutate in (
+            lambda: struct.translate_sites([0], [0.1, 0, 0]),
+            lambda: struct.apply_strain(0.01),
+            lambda: struct.perturb(0.1),
+            lambda: struct.__setitem__(0, ("Li", [0.5, 0.5, 0.5])),
+            lambda: struct.rotate_sites([0], theta=0.1),
+            lambda: struct.append("Li", [0.1, 0.1, 0.1]),
+            lambda: struct.remove_sites([len(struct) - 1]),
+            lambda: struct.sort(),
+            lambda: struct.make_supercell([1, 1, 2]),
+            lambda: struct.add_site_property("magmom", [0] * len(struct)),
+            lambda: struct.replace_species({"Li+": "Na+"}),
+        ):
+            struct.distance_matrix
+            struct.get_neighbor_list(3)
+            assert struct._cache
+            mutate()
+            assert not struct._cache
+            assert_allclose(
+                struct.distance_matrix, struct.lattice.get_all_distances(struct.frac_coords, struct.frac_coords)
+            )
+            assert len(struct.get_neighbor_list(3)[0]) == len(struct.copy().get_neighbor_list(3)[0])
+
+        # changes to site objects are not tracked
+        struct[0].frac_coords = [0.25, 0.25, 0.25]
+        assert struct.distance_matrix[0, 1] != struct.get_distance(0, 1)
+        struct.clear_cache()
+        assert struct.distance_matrix[0, 1] == approx(struct.get_distance(0, 1))
+
+        struct.enable_cache(False)
+        struct.distance_matrix
+        assert struct._cache is None
+
     def test_not_hashable(self):
         with pytest.raises(TypeError, match="unhashable type: 'Structure'"):
             _ = {self.struct: 1}
@@ -1336,6 +1507,15 @@ class TestStructure(PymatgenTest):
         assert struct.formula == "Si8"
         assert_allclose(struct.lattice.abc, [7.6803959, 17.5979979, 7.6803959])
 
+        # each site is followed by its periodic images, carrying labels and site properties
+        struct = Structure(
+            Lattice.cubic(3), ["Si", "Si"], [[0, 0, 0], [0.75, 0.5, 0.75]], site_properties={"magmom": [1, -1]}
+        )
+        struct = struct.relabel_sites() * [1, 1, 2]
+        assert struct.labels == ["Si_1", "Si_1", "Si_2", "Si_2"]
+        assert struct.site_properties == {"magmom": [1, 1, -1, -1]}
+        assert_allclose(struct.frac_coords, [[0, 0, 0], [0, 0, 0.5], [0.75, 0.5, 0.375], [0.75, 0.5, 0.875]])
+
     def test_make_supercell(self):
         supercell = self.struct.make_supercell([2, 1, 1])
         assert supercell.formula == "Si4"
@@ -1565,6 +1745,25 @@ class TestStructure(PymatgenTest):
         assert len(navs2) == 12
         assert 51.5 in [itr.properties["prop1"] for itr in navs2]
 
+    def test_merge_sites_large(self):
+        # ~20k sites, every tenth one duplicated 0.005 A away
+        rocksalt = Structure.from_spacegroup("Fm-3m", Lattice.cubic(4.2), ["Mg", "O"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        struct = rocksalt * (12, 12, 18)
+        assert len(struct) == 20736
+        assert struct.is_valid()
+        dup_inds = list(range(0, len(struct), 10))
+        dups = Structure.from_sites([struct[idx] for idx in dup_inds])
+        dups.translate_sites(list(range(len(dups))), [0.005, 0, 0], frac_coords=False)
+        merged = Structure.from_sites([*struct, *dups])
+        assert not merged.is_valid()
+        assert merged.is_valid(tol=0.001)
+
+        merged.merge_sites(tol=0.01, mode="delete")
+        assert len(merged) == len(struct)
+        assert merged.composition == struct.composition
+        assert merged.is_valid()
+        assert_allclose(merged[10].frac_coords, struct[10].frac_coords + [0.0025 / merged.lattice.a, 0, 0])
+
     def test_properties(self):
         assert self.struct.num_sites == len(self.struct)
         self.struct.make_supercell(2)
@@ -1611,6 +1810,34 @@ class TestStructure(PymatgenTest):
         with pytest.raises(ValueError, match="You need at least 1 site to construct a Structure"):
             Structure.from_sites([])
 
+    def test_from_arrays(self):
+        struct = Structure.from_arrays(
+            self.struct.lattice.matrix,
+            np.array([8, 3, 3]),
+            [[0, 0, 0], [0.25, 0.25, 0.25], [0.75, 0.75, 0.75]],
+            site_properties={"magmom": np.array([0.0, 1, -1])},
+            charge=0,
+        )
+        assert isinstance(struct, Structure)
+        assert struct == Structure(
+            self.struct.lattice,
+            ["O", "Li", "Li"],
+            [[0, 0, 0], [0.25, 0.25, 0.25], [0.75, 0.75, 0.75]],
+            site_properties={"magmom": [0, 1, -1]},
+        )
+        assert struct.species == [Element("O"), Element("Li"), Element("Li")]
+        # sites of the same element share one Composition
+        assert struct[1].species is struct[2].species
+        assert struct.charge == 0
+
+        istruct = IStructure.from_arrays(self.struct.lattice, [14, 14], self.struct.frac_coords, labels=["a", "b"])
+        assert isinstance(istruct, IStructure)
+        assert istruct.labels == ["a", "b"]
+        assert istruct == IStructure.from_sites(self.struct)
+
+        with pytest.raises(StructureError, match="len.atomic_numbers.=2 != len.frac_coords.=1"):
+            Structure.from_arrays(self.struct.lattice, [14, 14], [[0, 0, 0]])
+
     def test_charge(self):
         struct = Structure.from_sites(self.struct)
         assert struct.charge == 0, "Initial Structure not defaulting to behavior in SiteCollection"
@@ -1961,6 +2188,33 @@ class TestIMolecule(PymatgenTest):
     def test_get_covalent_bonds(self):
         assert len(self.mol.get_covalent_bonds()) == 4
 
+        # Same bonds, in the same order, as checking every pair
+        rng = np.random.default_rng(0)
+        mol = Molecule(
+            rng.choice(["C", "H", "O", "N"], 300).tolist(), rng.random((300, 3)) * 12, charge_spin_check=False
+        )
+        expected = [
+            (site1, site2)
+            for site1, site2 in itertools.combinations(mol, 2)
+            if CovalentBond.is_bonded(site1, site2, tol=0.1)
+        ]
+        bonds = mol.get_covalent_bonds(tol=0.1)
+        assert len(bonds) > 100
+        assert [(bond.site1, bond.site2) for bond in bonds] == expected
+
+        # No Cl - Cl bond data is needed for a single Cl
+        mol = Molecule(["H", "Cl"], [[0, 0, 0], [0, 0, 1.27]])
+        assert [(bond.site1, bond.site2) for bond in mol.get_covalent_bonds()] == [(mol[0], mol[1])]
+        mol = Molecule(
+            ["C", "Cl", "H", "H", "H"],
+            [[0, 0, 0], [0, 0, 1.78], [1.03, 0, -0.36], [-0.51, 0.89, -0.36], [-0.51, -0.89, -0.36]],
+        )
+        assert len(mol.get_covalent_bonds()) == 4
+
+        mol = Molecule(["C", "Xe"], [[0, 0, 0], [0, 0, 10]])
+        with pytest.raises(ValueError, match="No bond data for elements C - Xe"):
+            mol.get_covalent_bonds()
+
     def test_properties(self):
         assert len(self.mol) == 5
         assert self.mol.is_ordered
@@ -2027,6 +2281,16 @@ Site: H (-0.5134, 0.8892, -0.3630)"""
         no_reorder = self.mol.get_boxed_structure(10, 10, 10, reorder=False)
         assert str(s3[0].specie) == "H"
         assert str(no_reorder[0].specie) == "C"
+        no_reorder = self.mol.get_boxed_structure(5, 5, 5, (2, 1, 1), reorder=False)
+        assert len(no_reorder) == 10
+        assert_allclose(no_reorder[5].coords - no_reorder[0].coords, [5, 0, 0], atol=1e-8)
+
+        # Randomly rotated images keep min_dist from each other, across periodic boundaries
+        rotated = self.mol.get_boxed_structure(4, 4, 4, (2, 2, 2), random_rotation=True, min_dist=1.5, reorder=False)
+        assert len(rotated) == 40
+        dists = rotated.distance_matrix
+        mol_ids = np.repeat(np.arange(8), 5)
+        assert np.all(dists[mol_ids[:, None] != mol_ids[None, :]] > 1.5)
 
     def test_get_distance(self):
         assert self.mol.get_distance(0, 1) == approx(1.089)
@@ -2056,6 +2320,10 @@ Site: H (-0.5134, 0.8892, -0.3630)"""
             [1.08900040717, 1.7783298026, 1.77833003783, 1.77833, 0.0],
         ]
         assert_allclose(self.mol.distance_matrix, ans)
+        assert_allclose(self.mol.get_distance_matrix(chunk_size=2), ans)
+        assert_allclose(self.mol.get_distance_matrix(cutoff=1.5).toarray(), np.where(np.array(ans) < 1.5, ans, 0))
+        assert self.mol.is_valid(1)
+        assert not self.mol.is_valid(1.5)
 
     def test_get_zmatrix(self):
         mol = IMolecule(["C", "H", "H", "H", "H"], self.coords)
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import bz2
+import gzip
+import io
+import json
+import lzma
+import shutil
+import tarfile
+
 import numpy as np
 import pytest
+from monty.io import zopen
 from pytest import approx
 
 from pymatgen.analysis.structure_matcher import StructureMatcher
 from pymatgen.core import Composition, DummySpecies, Element, Lattice, Species, Structure
 from pymatgen.electronic_structure.core import Magmom
-from pymatgen.io.cif import CifBlock, CifParser, CifWriter
+from pymatgen.io.cif import CifBlock, CifParser, CifWriter, convert_cifs
 from pymatgen.symmetry.structure import SymmetrizedStructure
+from pymatgen.util.coord import in_coord_list_pbc
 from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR, PymatgenTest
 
 try:
@@ -214,6 +224,112 @@ class TestCifIO(PymatgenTest):
         assert len(parser.parse_structures(primitive=False)[0]) == 2
         assert not parser.has_errors
 
+    def test_iter_structures(self):
+        for filename in ("MultiStructure.cif", "PF_sd_1928405.cif", "Li2O.cif"):
+            cif_path = f"{TEST_FILES_DIR}/cif/{filename}"
+            structures = CifParser(cif_path).parse_structures(primitive=False, on_error="ignore")
+            iterated = list(CifParser.iter_structures(cif_path, on_error="ignore"))
+            assert iterated == structures
+
+        # structures are yielded lazily block by block
+        structs = CifParser.iter_structures(f"{TEST_FILES_DIR}/cif/MultiStructure.cif")
+        assert next(structs).formula == "Li4 Fe4 P4 O16"
+
+        with pytest.raises(ValueError, match="Invalid CIF file with no structures"):
+            list(CifParser.iter_structures(f"{TEST_FILES_DIR}/cif/bad_occu.cif", on_error="ignore"))
+
+    def test_first_unique_pbc(self):
+        rng = np.random.default_rng(42)
+        frac_coords = rng.random((200, 3))
+        # add near-duplicates, also across periodic boundaries
+        dupes = (frac_coords[:100] + rng.uniform(-2e-4, 2e-4, (100, 3))) % 1
+        frac_coords = np.concatenate([frac_coords, dupes, [[0, 0.5, 0.5], [0.99995, 0.5, 0.5]]])
+
+        unique: list = []
+        expected = []
+        for coord in frac_coords:
+            expected.append(not in_coord_list_pbc(unique, coord, atol=1e-4))
+            if expected[-1]:
+                unique.append(coord)
+        assert list(CifParser._first_unique_pbc(frac_coords, 1e-4)) == expected
+
+    def test_convert_cifs(self):
+        cif_dir = self.tmp_path / "cifs"
+        cif_dir.mkdir()
+        for filename in ("Li2O.cif", "MultiStructure.cif", "bad_occu.cif"):
+            shutil.copy(f"{TEST_FILES_DIR}/cif/{filename}", cif_dir)
+        with tarfile.open(self.tmp_path / "cifs.tar.gz", mode="w:gz") as tar:
+            tar.add(f"{TEST_FILES_DIR}/cif/Li.cif", arcname="nested/Li.cif")
+
+        for ncores in (1, 2):
+            out_file = self.tmp_path / f"structs_{ncores}.jsonl.gz"
+            summary = convert_cifs([cif_dir, self.tmp_path / "cifs.tar.gz"], out_file, ncores=ncores)
+            assert summary["n_files"] == 4
+            assert summary["n_structures"] == 4
+            assert summary["n_errors"] == 1
+            assert summary["files_per_second"] > 0
+
+            with zopen(out_file, mode="rt") as file:
+                records = [json.loads(line) for line in file]
+            assert [(rec["source"].split("/")[-1], rec["index"]) for rec in records] == [
+                ("Li2O.cif", 0),
+                ("MultiStructure.cif", 0),
+                ("MultiStructure.cif", 1),
+                ("bad_occu.cif", None),
+                ("Li.cif", 0),
+            ]
+            assert "Invalid CIF file with no structures" in records[3]["error"]
+            assert records[3]["warnings"] != []
+            assert Structure.from_dict(records[0]["structure"]).formula == "Li8 O4"
+
+    def test_convert_cifs_compressed_tar_members(self):
+        with open(f"{TEST_FILES_DIR}/cif/Li2O.cif", mode="rb") as file:
+            content = file.read()
+        tar_path = self.tmp_path / "cifs.tar"
+        with tarfile.open(tar_path, mode="w") as tar:
+            for name, data in (
+                ("Li2O.cif.bz2", bz2.compress(content)),
+                ("Li2O.cif.GZ", gzip.compress(content)),
+                ("Li2O.CIF.xz", lzma.compress(content)),
+                ("corrupt.cif.gz", gzip.compress(content)[:100]),
+            ):
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        truncated_path = self.tmp_path / "truncated.tar.gz"
+        with tarfile.open(truncated_path, mode="w:gz") as tar:
+            tar.add(f"{TEST_FILES_DIR}/cif/MultiStructure.cif", arcname="MultiStructure.cif")
+            tar.add(f"{TEST_FILES_DIR}/cif/Li2O.cif", arcname="Li2O.cif")
+        truncated_path.write_bytes(truncated_path.read_bytes()[:-200])
+
+        # unreadable members and sources are recorded as errors without aborting the batch
+        out_file = self.tmp_path / "structs.jsonl"
+        summary = convert_cifs([tar_path, self.tmp_path / "missing.cif", truncated_path], out_file, ncores=1)
+        assert summary["n_files"] == 8
+        assert summary["n_structures"] == 5
+        assert summary["n_errors"] == 4
+
+        with open(out_file) as file:
+            errors = {rec["source"].split("/")[-1]: rec["error"] for rec in map(json.loads, file) if rec["error"]}
+        assert errors["cifs.tar:corrupt.cif.gz"].startswith("EOFError")
+        assert errors["missing.cif"].startswith("FileNotFoundError")
+        assert errors["truncated.tar.gz:Li2O.cif"].startswith("EOFError")
+        assert errors["truncated.tar.gz"].startswith("EOFError")
+
+    def test_convert_cifs_parquet(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        out_file = self.tmp_path / "structs.parquet"
+        paths = [f"{TEST_FILES_DIR}/cif/{filename}" for filename in ("Li2O.cif", "MultiStructure.cif", "bad_occu.cif")]
+        summary = convert_cifs(paths, out_file, ncores=1, row_group_size=2)
+        assert summary["n_structures"] == 3
+
+        parquet_file = pq.ParquetFile(out_file)
+        assert parquet_file.metadata.num_row_groups == 2
+        records = parquet_file.read().to_pylist()
+        assert [rec["index"] for rec in records] == [0, 0, 1, None]
+        assert records[3]["structure"] is None
+        assert Structure.from_dict(json.loads(records[0]["structure"])).formula == "Li8 O4"
+
     def test_get_symmetrized_structure(self):
         parser = CifParser(f"{TEST_FILES_DIR}/cif/Li2O.cif")
         sym_structure = parser.parse_structures(primitive=False, symmetrized=True)[0]
@@ -731,6 +847,14 @@ loop_
         cb2 = CifBlock.from_str(str(cb))
         assert cb == cb2
 
+    def test_malformed_loops(self):
+        with pytest.raises(ValueError, match="Loop without data names or values, columns=\\[\\]"):
+            CifBlock.from_str("data_mwe\nloop_\n1 2")
+        with pytest.raises(ValueError, match="Loop without data names or values"):
+            CifBlock.from_str("data_mwe\nloop_\n_tag1\n_tag2\nloop_\n_other\n1")
+        with pytest.raises(ValueError, match="Number of items in loop is not a multiple"):
+            CifBlock.from_str("data_mwe\nloop_\n_tag1\n_tag2\n1")
+
     def test_bad_occu(self):
         filepath = f"{TEST_FILES_DIR}/cif/bad_occu.cif"
         parser = CifParser(filepath)
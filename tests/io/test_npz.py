@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pymatgen.core import IStructure, Lattice, Molecule, Species, Structure
+from pymatgen.core.trajectory import Trajectory
+from pymatgen.entries.computed_entries import ComputedStructureEntry
+from pymatgen.io.npz import dump_many, from_bytes, load_many, to_bytes
+from pymatgen.util.testing import PymatgenTest
+
+
+class TestNpz(PymatgenTest):
+    def setUp(self):
+        self.struct = self.get_structure("LiFePO4")
+        self.struct.add_site_property("magmom", [float(idx) for idx in range(len(self.struct))])
+        self.struct.add_site_property("selective_dynamics", [[True, False, True]] * len(self.struct))
+        self.struct.add_site_property("tag", [None] * (len(self.struct) - 1) + ["last"])
+        self.struct.properties = {"source": "test"}
+        self.mol = Molecule(
+            ["C", "H", "H", "H", "H"],
+            [
+                [0, 0, 0],
+                [0, 0, 1.089],
+                [1.026719, 0, -0.363],
+                [-0.51336, -0.889165, -0.363],
+                [-0.51336, 0.889165, -0.363],
+            ],
+            site_properties={"charge": [-0.4, 0.1, 0.1, 0.1, 0.1]},
+        )
+
+    def test_structure(self):
+        struct = Structure.from_bytes(self.struct.to_bytes())
+        assert struct == self.struct
+        assert struct.as_dict() == self.struct.as_dict()
+        assert isinstance(struct, Structure)
+        assert struct.site_properties["selective_dynamics"][0] == [True, False, True]
+        assert struct.site_properties["tag"][-2:] == [None, "last"]
+
+        # disorder, oxidation states, labels, charge and pbc
+        struct = Structure(
+            Lattice.cubic(4, pbc=(True, True, False)),
+            [{"Li": 0.5, "Na": 0.5}, Species("O", -2)],
+            [[0, 0, 0], [0.5, 0.5, 0.5]],
+            charge=1,
+            labels=["A", "B"],
+        )
+        decoded = IStructure.from_bytes(struct.to_bytes(compress=True))
+        assert isinstance(decoded, IStructure)
+        assert decoded == struct
+        assert decoded.labels == ["A", "B"]
+        assert decoded.charge == 1
+        assert decoded.pbc == (True, True, False)
+
+    def test_molecule(self):
+        mol = Molecule.from_bytes(self.mol.to_bytes())
+        assert mol == self.mol
+        assert mol.as_dict() == self.mol.as_dict()
+
+        self.mol.set_charge_and_spin(1)
+        mol = from_bytes(to_bytes(self.mol))
+        assert (mol.charge, mol.spin_multiplicity) == (1, 2)
+
+    def test_entry(self):
+        entry = ComputedStructureEntry(
+            self.struct, -100, parameters={"run_type": "GGA"}, data={"band_gap": 1.5}, entry_id="mp-1"
+        )
+        decoded = ComputedStructureEntry.from_bytes(entry.to_bytes())
+        assert decoded.as_dict() == entry.as_dict()
+        assert decoded.structure == self.struct
+
+    def test_trajectory(self):
+        structs = [self.struct.copy() for _ in range(3)]
+        for idx, struct in enumerate(structs):
+            struct.translate_sites(list(range(len(struct))), [0.01 * idx, 0, 0])
+        for constant_lattice in (True, False):
+            traj = Trajectory.from_structures(structs, constant_lattice=constant_lattice)
+            decoded = Trajectory.from_bytes(traj.to_bytes())
+            assert decoded.lattice.shape == traj.lattice.shape
+            assert decoded.constant_lattice == constant_lattice
+            assert np.allclose(decoded.coords, traj.coords)
+            assert list(decoded) == list(traj)
+
+        traj = Trajectory.from_molecules([self.mol, self.mol], frame_properties=[{"energy": -1}, {"energy": -2}])
+        decoded = Trajectory.from_bytes(traj.to_bytes())
+        assert decoded.lattice is None
+        assert decoded.frame_properties == [{"energy": -1}, {"energy": -2}]
+        assert list(decoded) == list(traj)
+
+    def test_dump_load_many(self):
+        structs = [self.struct, IStructure.from_sites(self.struct), self.struct * (1, 2, 1)]
+        decoded = load_many(dump_many(structs))
+        assert decoded == structs
+        assert [type(struct) for struct in decoded] == [Structure, IStructure, Structure]
+        assert all(isinstance(struct, Structure) for struct in load_many(dump_many(structs), cls=Structure))
+
+        # species are decoded once and shared between sites and structures
+        assert decoded[0][0].species is decoded[2][0].species
+
+        filename = f"{self.tmp_path}/entries.npz"
+        entries = [ComputedStructureEntry(struct, -idx, entry_id=f"mp-{idx}") for idx, struct in enumerate(structs)]
+        assert dump_many(entries, filename) is None
+        assert [entry.as_dict() for entry in load_many(filename)] == [entry.as_dict() for entry in entries]
+
+        # file names without .npz suffix are kept as given
+        filename = f"{self.tmp_path}/structs.dat"
+        dump_many(structs, filename, compress=True)
+        assert load_many(filename) == structs
+
+        assert load_many(dump_many([])) == []
+
+        # site properties of different dtypes across objects are restored per object
+        mixed = [self.struct.copy(), self.struct.copy()]
+        n_sites = len(self.struct)
+        mixed[0].add_site_property("magmom", [0.5] * n_sites)
+        mixed[1].add_site_property("magmom", [2] * n_sites)
+        for struct in mixed:
+            struct.add_site_property("charge", [0.0] * n_sites)
+        decoded = load_many(dump_many(mixed))
+        assert [struct.site_properties["magmom"] for struct in decoded] == [[0.5] * n_sites, [2] * n_sites]
+        assert {type(magmom) for magmom in decoded[1].site_properties["magmom"]} == {int}
+        assert dump_many(mixed) == dump_many(mixed)
+
+        with pytest.raises(TypeError, match=r"Cannot serialize a mix of \['molecule', 'structure'\]"):
+            dump_many([self.struct, self.mol])
+        with pytest.raises(ValueError, match="Expected data for a single object, got 3"):
+            from_bytes(dump_many(structs))
@@ -10,11 +10,15 @@ from pytest import approx, raises
 from spglib import SpglibDataset
 
 from pymatgen.core import Lattice, Molecule, PeriodicSite, Site, Species, Structure
+from pymatgen.core.operations import SymmOp
 from pymatgen.io.vasp.outputs import Vasprun
 from pymatgen.symmetry.analyzer import (
+    SPGLIB_CACHE,
     PointGroupAnalyzer,
     SpacegroupAnalyzer,
+    SpglibCache,
     SymmetryUndetermined,
+    batch_symmetry_analysis,
     cluster_sites,
     iterative_symmetrize,
 )
@@ -382,6 +386,61 @@ class TestSpacegroupAnalyzer(PymatgenTest):
             SpacegroupAnalyzer(struct, 0.1)
 
 
+class TestBatchSymmetryAnalysis(PymatgenTest):
+    def setUp(self):
+        self.maxsize = SPGLIB_CACHE.maxsize
+        SPGLIB_CACHE.clear()
+
+    def tearDown(self):
+        SPGLIB_CACHE.maxsize = self.maxsize
+
+    def test_batch_symmetry_analysis(self):
+        lfp = self.get_structure("LiFePO4")
+        structures = [lfp, self.get_structure("Si"), lfp.copy(), lfp * (1, 1, 2)]
+        analyzers = batch_symmetry_analysis(structures, symprec=0.1)
+        assert [sga.get_space_group_symbol() for sga in analyzers] == ["Pnma", "Fd-3m", "Pnma", "Pnma"]
+        # the copy of LiFePO4 is the same cell, so spglib ran once for it
+        assert len(SPGLIB_CACHE) == 3
+        assert analyzers[0].get_symmetry_dataset() is analyzers[2].get_symmetry_dataset()
+
+        # later analyses of the same structures at the same tolerance are cached
+        hits = SPGLIB_CACHE.hits
+        assert lfp.get_space_group_info(symprec=0.1) == ("Pnma", 62)
+        assert SPGLIB_CACHE.hits == hits + 1
+        assert len(SPGLIB_CACHE) == 3
+        SpacegroupAnalyzer(lfp, symprec=0.01)
+        assert len(SPGLIB_CACHE) == 4
+
+        SPGLIB_CACHE.clear()
+        parallel = batch_symmetry_analysis(structures, symprec=0.1, n_jobs=2)
+        assert [sga.get_space_group_number() for sga in parallel] == [62, 227, 62, 62]
+
+        # a cache smaller than the batch still computes each structure once
+        SPGLIB_CACHE.clear()
+        SPGLIB_CACHE.maxsize = 1
+        analyzers = batch_symmetry_analysis(structures, symprec=0.1)
+        assert [sga.get_space_group_number() for sga in analyzers] == [62, 227, 62, 62]
+        assert len(SPGLIB_CACHE) == 1
+
+    def test_cache(self):
+        cache = SpglibCache(maxsize=2)
+        for idx in range(3):
+            assert cache.get(idx, lambda idx=idx: idx**2) == idx**2
+        assert 0 not in cache
+        assert cache.get(2, lambda: -1) == 4
+        assert (cache.hits, cache.misses) == (1, 3)
+
+        cell = ([[1, 0, 0], [0, 1, 0], [0, 0, 1]], [[0, 0, 0]], [1])
+        assert SpglibCache.get_key("dataset", cell, 0.01, 5) == SpglibCache.get_key("dataset", cell, 0.01, 5)
+        assert SpglibCache.get_key("dataset", cell, 0.01, 5) != SpglibCache.get_key("dataset", cell, 0.1, 5)
+        assert SpglibCache.get_key("dataset", cell, 0.01, 5) != SpglibCache.get_key("dataset", (*cell, [1]), 0.01, 5)
+
+        cache.maxsize = 0
+        cache.clear()
+        assert cache.get(0, lambda: 1) == 1
+        assert len(cache) == 0
+
+
 class TestSpacegroup(TestCase):
     def setUp(self):
         self.structure = Structure.from_file(f"{VASP_IN_DIR}/POSCAR")
@@ -506,6 +565,25 @@ class TestPointGroupAnalyzer(PymatgenTest):
         pg_analyzer = PointGroupAnalyzer(mol, 0.1)
         assert pg_analyzer.sch_symbol == "Oh"
 
+    def test_large_clusters(self):
+        gold = Structure.from_spacegroup("Fm-3m", Lattice.cubic(4.08), ["Au"], [[0, 0, 0]]) * 6
+        coords = gold.cart_coords - gold.lattice.get_cartesian_coords([0.5, 0.5, 0.5])
+        coords = coords[np.linalg.norm(coords, axis=1) < 9]
+        pg_analyzer = PointGroupAnalyzer(Molecule(["Au"] * len(coords), coords))
+        assert len(coords) == 177
+        assert pg_analyzer.sch_symbol == "Oh"
+        assert len(pg_analyzer.get_equivalent_atoms()["eq_sets"]) == 11
+
+        # operations must map each atom onto an atom of the same species
+        species = ["Au"] * len(coords)
+        species[np.argmin(np.linalg.norm(coords - [0, 0, 8.16], axis=1))] = "Ag"
+        pg_analyzer = PointGroupAnalyzer(Molecule(species, coords))
+        assert not pg_analyzer.is_valid_op(PointGroupAnalyzer.inversion_op)
+        assert pg_analyzer.is_valid_op(SymmOp.from_axis_angle_and_translation([0, 0, 1], 90))
+
+        coords = np.random.default_rng(0).random((500, 3)) * 20
+        assert PointGroupAnalyzer(Molecule(["C"] * len(coords), coords)).sch_symbol == "C1"
+
     def test_tricky(self):
         mol = Molecule.from_file(f"{TEST_DIR}/dh.xyz")
         pg_analyzer = PointGroupAnalyzer(mol, 0.1)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+from pymatgen.symmetry.kpoint_symmetry import KpointSymmetry
+from pymatgen.util.testing import PymatgenTest
+
+
+class TestKpointSymmetry(PymatgenTest):
+    def test_get_ir_mesh(self):
+        for name in ("SrTiO3", "LiFePO4", "Graphite"):
+            struct = self.get_structure(name)
+            sga = SpacegroupAnalyzer(struct)
+            kpt_symm = KpointSymmetry.from_structure(struct)
+            for mesh, is_shift in (((4, 4, 4), (0, 0, 0)), ((6, 6, 6), (1, 1, 1)), ((1, 2, 3), (0, 0, 0))):
+                ir_kpoints, weights, mapping = kpt_symm.get_ir_mesh(mesh, is_shift)
+                spglib_weights = [weight for _, weight in sga.get_ir_reciprocal_mesh(mesh, is_shift)]
+                assert sorted(weights) == sorted(spglib_weights)
+                assert len(mapping) == np.prod(mesh)
+                assert np.all(np.abs(ir_kpoints) <= 0.5)
+                assert kpt_symm.get_ir_mesh(mesh, is_shift) is kpt_symm.get_ir_mesh(mesh, is_shift)
+
+        # cached meshes are shared between structures of the same symmetry
+        kpt_symm = KpointSymmetry.from_structure(self.get_structure("SrTiO3"))
+        other = KpointSymmetry.from_structure(self.get_structure("CsCl"))
+        assert other.get_ir_mesh((5, 5, 5)) is kpt_symm.get_ir_mesh((5, 5, 5))
+        with pytest.raises(ValueError, match="read-only"):
+            kpt_symm.get_ir_mesh((5, 5, 5))[1][0] = 0
+
+    def test_fold(self):
+        struct = self.get_structure("LiFePO4")
+        sga = SpacegroupAnalyzer(struct)
+        kpt_symm = KpointSymmetry.from_structure(struct)
+        assert len(kpt_symm) == 4
+
+        # folding the full spglib grid gives the same partition as spglib
+        grid, spglib_mapping = sga.get_ir_reciprocal_mesh_map((4, 5, 6))
+        ir_kpoints, weights, mapping = kpt_symm.fold(grid)
+        assert len(set(zip(spglib_mapping, mapping, strict=True))) == len(ir_kpoints) == len(set(spglib_mapping))
+        assert_allclose(ir_kpoints, grid[np.unique(mapping, return_index=True)[1]])
+        assert weights.sum() == len(grid)
+
+        # arbitrary k-points off the mesh, with equivalent images shifted by lattice vectors
+        rng = np.random.default_rng(0)
+        kpoints = rng.random((50, 3))
+        images = np.array([kpt_symm.rotations[idx % len(kpt_symm)] for idx in range(50)])
+        equivalent = np.einsum("kj,kji->ki", kpoints, images) + rng.integers(-1, 2, (50, 3))
+        ir_kpoints, weights, mapping = kpt_symm.fold(np.vstack([kpoints, equivalent]))
+        assert_allclose(ir_kpoints, kpoints)
+        assert weights.tolist() == [2] * 50
+        assert mapping.tolist() == list(range(50)) * 2
+
+        with pytest.raises(ValueError, match="too small to hash"):
+            kpt_symm.fold(kpoints, atol=1e-8)
+
+    def test_get_equivalent_kpoints(self):
+        kpt_symm = KpointSymmetry.from_structure(self.get_structure("SrTiO3"))
+        assert len(kpt_symm) == 48
+        assert len(kpt_symm.get_equivalent_kpoints([0, 0, 0])) == 1
+        assert len(kpt_symm.get_equivalent_kpoints([0.5, 0, 0])) == 3
+        images = kpt_symm.get_equivalent_kpoints([0.1, 0.2, 0.3])
+        assert len(images) == 48
+        assert_allclose(images[0], [0.1, 0.2, 0.3])
+
+        no_time_reversal = KpointSymmetry(kpt_symm.rotations[:1], time_reversal=False)
+        assert len(no_time_reversal) == 1
+        assert len(KpointSymmetry(kpt_symm.rotations[:1])) == 2
@@ -62,3 +62,12 @@ def test_pmg_diff(cd_tmp_path: Path):
         ["pmg", "diff", "--incar", f"{VASP_IN_DIR}/INCAR", f"{VASP_IN_DIR}/INCAR_2"],
         check=True,
     )
+
+
+def test_pmg_cifs(cd_tmp_path: Path):
+    subprocess.run(
+        ["pmg", "cifs", f"{TEST_FILES_DIR}/cif/Li2O.cif", f"{TEST_FILES_DIR}/cif/Li.cif", "-o", "structs.jsonl"],
+        check=True,
+    )
+    with open("structs.jsonl") as file:
+        assert len(file.readlines()) == 2
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import json
+from itertools import combinations, product
 from shutil import which
 
 import numpy as np
 import pytest
+from joblib import parallel_backend
 from monty.serialization import loadfn
 from numpy.testing import assert_allclose, assert_array_equal
 from pytest import approx
 
 from pymatgen.analysis.energy_models import IsingModel, SymmetryModel
+from pymatgen.analysis.ewald import EwaldSummation
 from pymatgen.analysis.gb.grain import GrainBoundaryGenerator
+from pymatgen.analysis.structure_matcher import StructureMatcher
 from pymatgen.core import Lattice, Molecule, Species, Structure
 from pymatgen.core.surface import SlabGenerator
 from pymatgen.io.icet import ClusterSpace
@@ -32,6 +36,8 @@ from pymatgen.transformations.advanced_transformations import (
     SubstituteSurfaceSiteTransformation,
     SubstitutionPredictorTransformation,
     SuperTransformation,
+    _get_hnf,
+    _SpinOrderingHasher,
     find_codopant,
 )
 from pymatgen.transformations.standard_transformations import (
@@ -249,6 +255,59 @@ class TestEnumerateStructureTransformation:
         assert trans.symm_prec == 0.1
 
 
+class TestEnumerateStructureRanking:
+    """Post-processing of enumerated orderings, which does not need enumlib."""
+
+    def setup_method(self):
+        struct = Structure.from_file(f"{VASP_IN_DIR}/POSCAR_LiFePO4")
+        struct = SubstitutionTransformation({"Fe": {"Fe": 0.5}}).apply_transformation(struct)
+        self.struct = OxidationStateDecorationTransformation({"Li": 1, "Fe": 2, "P": 5, "O": -2}).apply_transformation(
+            struct
+        )
+        order_trans = OrderDisorderedStructureTransformation(algo=2)
+        self.orderings = [dct["structure"] for dct in order_trans.apply_transformation(self.struct, 20)]
+        self.orderings += [dct["structure"] for dct in order_trans.apply_transformation(self.struct * (1, 1, 2), 20)]
+
+    def test_get_ewald_energies(self):
+        energies = EnumerateStructureTransformation(n_jobs=1)._get_ewald_energies(self.struct, self.orderings)
+        assert len(energies) == len(self.orderings)
+        for ordering, energy in zip(self.orderings[::7], energies[::7], strict=True):
+            supercell = self.struct * (1, 1, round(ordering.volume / self.struct.volume))
+            assert energy == approx(EwaldSummation(supercell).compute_sub_structure(ordering))
+
+        # Threads avoid the start up time of worker processes but exercise the same chunking
+        with parallel_backend("threading"):
+            energies_parallel = EnumerateStructureTransformation(n_jobs=2)._get_ewald_energies(
+                self.struct, self.orderings
+            )
+        assert_allclose(energies_parallel, energies)
+
+    def test_rank_structures(self):
+        energies = EnumerateStructureTransformation(n_jobs=1)._get_ewald_energies(self.struct, self.orderings)
+        all_structures = [
+            {"num_sites": len(ordering), "energy": energy, "structure": ordering}
+            for ordering, energy in zip(self.orderings, energies, strict=True)
+        ]
+
+        def key(dct):
+            return dct["energy"] / dct["num_sites"]
+
+        ranked = EnumerateStructureTransformation(n_jobs=1)._rank_structures(all_structures, key, 5)
+        assert ranked == sorted(all_structures, key=key)[:5]
+
+        enum_trans = EnumerateStructureTransformation(n_jobs=1, remove_duplicate_structures=True)
+        unique = enum_trans._rank_structures(all_structures, key, 100)
+        assert len(unique) == len(StructureMatcher().group_structures(self.orderings))
+        assert len(unique) < len(all_structures)
+        assert [key(dct) for dct in unique] == sorted(key(dct) for dct in unique)
+        assert unique[0] is min(all_structures, key=key)
+        matcher = StructureMatcher()
+        for idx, dct in enumerate(unique):
+            assert not any(matcher.fit(dct["structure"], other["structure"]) for other in unique[:idx])
+
+        assert enum_trans._rank_structures(all_structures, key, 3) == unique[:3]
+
+
 class TestSubstitutionPredictorTransformation:
     def test_apply_transformation(self):
         trafo = SubstitutionPredictorTransformation(threshold=1e-3, alpha=-5, lambda_table=get_table())
@@ -271,6 +330,77 @@ class TestSubstitutionPredictorTransformation:
         assert trafo._substitutor.p.alpha == -2, "incorrect alpha passed through dict"
 
 
+def _get_hnfs(size):
+    for a, c in product(range(1, size + 1), repeat=2):
+        if size % (a * c) == 0:
+            f = size // (a * c)
+            for b, d, e in product(range(a), range(a), range(c)):
+                yield [[a, 0, 0], [b, c, 0], [d, e, f]]
+
+
+class TestSpinOrderingHasher:
+    """Orderings of all supercells of a given size are generated without enumlib. The
+    expected numbers of unique orderings were checked with StructureMatcher.
+    """
+
+    @staticmethod
+    def get_orderings(structure, size, symbol):
+        orderings = []
+        for hnf in _get_hnfs(size):
+            supercell = structure * hnf
+            indices = supercell.indices_from_symbol(symbol)
+            for spin_up in combinations(indices, len(indices) // 2):
+                ordering = supercell.copy()
+                for idx in indices:
+                    ordering.replace(idx, Species(symbol, 2, spin=5 if idx in spin_up else -5))
+                orderings.append(ordering)
+        return orderings
+
+    def test_get_key(self):
+        struct = Structure.from_spacegroup("Fm-3m", Lattice.cubic(4.2), ["Ni2+", "O2-"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        struct = struct.get_primitive_structure()
+        hasher = _SpinOrderingHasher(struct, [0, -1])
+
+        orderings = self.get_orderings(struct, 2, "Ni")
+        assert len(orderings) == 14
+        assert len({hasher.get_key(ordering) for ordering in orderings}) == 2
+
+        # Orderings of a cell of size 4 include those of cells of size 2
+        orderings += self.get_orderings(struct, 4, "Ni")
+        keys = [hasher.get_key(ordering) for ordering in orderings]
+        assert len(set(keys)) == 7
+
+        # Keys do not depend on the choice of supercell vectors or spin reversal
+        ordering = orderings[20].copy()
+        key = keys[20]
+        ordering.make_supercell([[1, 1, 0], [0, 1, 0], [0, 0, 1]])
+        assert hasher.get_key(ordering) == key
+        for idx in ordering.indices_from_symbol("Ni"):
+            ordering.replace(idx, Species("Ni", 2, spin=-ordering[idx].specie.spin))
+        assert hasher.get_key(ordering) == key
+
+        ordering.translate_sites(range(len(ordering)), [0.1, 0, 0])
+        assert hasher.get_key(ordering) is None
+
+    def test_get_key_nonsymmorphic(self):
+        struct = PymatgenTest.get_structure("LiFePO4")
+        struct.add_oxidation_state_by_element({"Li": 1, "Fe": 2, "P": 5, "O": -2})
+        hasher = _SpinOrderingHasher(struct, [0 if site.specie.symbol == "Fe" else -1 for site in struct])
+        orderings = self.get_orderings(struct, 1, "Fe")
+        assert len(orderings) == 6
+        assert len({hasher.get_key(ordering) for ordering in orderings}) == 3
+
+
+def test_get_hnf():
+    assert_array_equal(_get_hnf([[0, 2, 0], [1, 0, 0], [0, 0, 1]]), [[1, 0, 0], [0, 2, 0], [0, 0, 1]])
+    assert_array_equal(_get_hnf([[1, 1, 0], [-1, 1, 0], [0, 0, -1], [1, 0, 0]]), [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    for hnf in _get_hnfs(6):
+        assert_array_equal(_get_hnf(np.array([[1, 1, 0], [0, 1, 0], [2, 0, 1]]) @ hnf), hnf)
+
+    with pytest.raises(ValueError, match="Rows do not span a three-dimensional lattice"):
+        _get_hnf([[1, 0, 0], [0, 1, 0]])
+
+
 @pytest.mark.skipif(not enumlib_present, reason="enum_lib not present.")
 class TestMagOrderingTransformation(PymatgenTest):
     def setUp(self):
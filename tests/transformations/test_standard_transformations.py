@@ -35,7 +35,7 @@ from pymatgen.transformations.standard_transformations import (
     SubstitutionTransformation,
     SupercellTransformation,
 )
-from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR
+from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR, PymatgenTest
 
 enumlib_present = which("enum.x") and which("makestr.x")
 
@@ -306,6 +306,23 @@ class TestOrderDisorderedStructureTransformation:
         dct = trafo.as_dict()
         assert isinstance(OrderDisorderedStructureTransformation.from_dict(dct), OrderDisorderedStructureTransformation)
 
+    def test_monte_carlo(self):
+        struct = PymatgenTest.get_structure("LiFePO4") * (1, 2, 2)
+        struct.add_oxidation_state_by_element({"Li": 1, "Fe": 2, "P": 5, "O": -2})
+        struct.replace_species({"Li+": {"Li+": 0.5}})
+
+        fast = OrderDisorderedStructureTransformation().apply_transformation(struct, return_ranked_list=3)
+        trafo = OrderDisorderedStructureTransformation(
+            algo=OrderDisorderedStructureTransformation.ALGO_MONTE_CARLO, mc_params={"seed": 0}
+        )
+        output = trafo.apply_transformation(struct, return_ranked_list=3)
+        assert len(output) == 3
+        assert output[0]["energy"] == approx(fast[0]["energy"])
+        assert output[0]["structure"].composition["Li+"] == 8
+        assert [entry["energy"] for entry in output] == sorted(entry["energy"] for entry in output)
+        assert trafo.lowest_energy_structure == output[0]["structure"]
+        assert OrderDisorderedStructureTransformation.from_dict(trafo.as_dict()).mc_params == {"seed": 0}
+
     def test_no_oxidation(self):
         specie = {"Cu1+": 0.5, "Au2+": 0.5}
         cu_au = Structure.from_spacegroup("Fm-3m", Lattice.cubic(3.677), [specie], [[0, 0, 0]])